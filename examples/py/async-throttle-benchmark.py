@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.async.base.throttle import throttle  # noqa: E402
+
+# compares the latency added by the rate limiter with the previous polling
+# implementation that woke up every `delay` seconds to hand out tokens
+
+rate_limit = 50  # milliseconds per request
+num_requests = 40
+
+
+def polling_throttle(config):
+
+    cfg = {
+        'lastTimestamp': time.time(),
+        'numTokens': 0,
+        'running': False,
+        'queue': asyncio.Queue(),
+        'delay': 1.0,
+        'refillRate': 1.0 / rate_limit,
+        'defaultCost': 1.0,
+        'capacity': 1.0,
+    }
+
+    cfg.update(config)
+
+    async def run():
+        if not cfg['running']:
+            cfg['running'] = True
+            while not cfg['queue'].empty():
+                now = time.time()
+                elapsed = (now - cfg['lastTimestamp'])
+                cfg['lastTimestamp'] = now
+                cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
+                if cfg['numTokens'] > 0:
+                    if not cfg['queue'].empty():
+                        cost, future = cfg['queue'].get_nowait()
+                        cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
+                        if not future.done():
+                            future.set_result(None)
+                await asyncio.sleep(cfg['delay'])
+            cfg['running'] = False
+
+    def acquire(cost=None):
+        future = asyncio.Future()
+        cfg['queue'].put_nowait((cost, future))
+        asyncio.ensure_future(run())
+        return future
+
+    return acquire
+
+
+async def measure(acquire):
+    added = []
+
+    async def request():
+        # arrivals at half the allowed rate, so ideally nobody waits long
+        start = time.time()
+        await acquire()
+        added.append((time.time() - start) * 1000)
+
+    tasks = []
+    for i in range(0, num_requests):
+        tasks.append(asyncio.ensure_future(request()))
+        await asyncio.sleep(random.expovariate(1000.0 / (2 * rate_limit)))
+    await asyncio.gather(*tasks)
+    added.sort()
+    return {
+        'p50': added[int(len(added) * 0.50)],
+        'p99': added[int(len(added) * 0.99)],
+        'max': added[-1],
+    }
+
+
+async def main():
+    config = {'refillRate': 1.0 / rate_limit, 'delay': 1.0}
+    for name, acquire in [('polling', polling_throttle(config)), ('event-driven', throttle(config))]:
+        result = await measure(acquire)
+        print('{:>14} added latency ms: p50 {:8.2f} p99 {:8.2f} max {:8.2f}'.format(name, result['p50'], result['p99'], result['max']))
+
+
+asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# measures the time and peak memory of a fresh interpreter running `import ccxt`
+# with the lazy exchange imports, with one exchange, and with all exchanges loaded
+# the way the package used to import them
+
+scenarios = [
+    ('interpreter', 'pass'),
+    ('import ccxt', 'import ccxt'),
+    ('import ccxt, ccxt.binance', 'import ccxt; ccxt.binance'),
+    ('import ccxt, all exchanges (eager)', 'import ccxt; [getattr(ccxt, id) for id in ccxt.exchanges]'),
+]
+
+measure = '''
+import resource, sys, time
+started = time.time()
+{statement}
+elapsed = time.time() - started
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed * 1000, rss / 1024.0 if sys.platform != 'darwin' else rss / 1048576.0)
+'''
+
+runs = 10
+
+print('{:<40} {:>10} {:>10}'.format('', 'ms', 'max MB'))
+for name, statement in scenarios:
+    times = []
+    memory = []
+    for i in range(0, runs):
+        output = subprocess.check_output([sys.executable, '-c', measure.format(statement=statement)], cwd=root + '/python')
+        elapsed, rss = output.decode().split()
+        times.append(float(elapsed))
+        memory.append(float(rss))
+    times.sort()
+    print('{:<40} {:>10.1f} {:>10.1f}'.format(name, times[len(times) // 2], max(memory)))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# measures the construction time and the memory retained per instance, the api table
+# of an exchange is computed once per class, passing 'api' in the config falls back
+# to binding a partial per endpoint in every instance, sharedMetadata shares the
+# describe() data between the instances
+
+ids = ['binance', 'bitfinex', 'kraken', 'poloniex', 'hitbtc2']
+num_instances = 100
+
+
+def measure(exchange_class, config):
+    exchange_class(config)  # warm up the class-level tables
+    gc.collect()
+    started = time.time()
+    tracemalloc.start()
+    instances = [exchange_class(config) for i in range(0, num_instances)]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    elapsed = time.time() - started
+    del instances
+    return elapsed * 1000 / num_instances, memory / 1024.0 / num_instances
+
+
+print('{:<12} {:>10} {:>12} {:>10} {:>12} {:>12} {:>12}'.format('', 'ms', 'KB', 'ms (api)', 'KB (api)', 'ms (shared)', 'KB (shared)'))
+for id in ids:
+    exchange_class = getattr(ccxt, id)
+    elapsed, memory = measure(exchange_class, {})
+    elapsed_api, memory_api = measure(exchange_class, {'api': exchange_class().api})
+    elapsed_shared, memory_shared = measure(exchange_class, {'sharedMetadata': True})
+    print('{:<12} {:>10.2f} {:>12.1f} {:>10.2f} {:>12.1f} {:>12.2f} {:>12.1f}'.format(id, elapsed, memory, elapsed_api, memory_api, elapsed_shared, memory_shared))
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+from ccxt.base.ohlcv_store import OHLCVStore  # noqa: E402
+
+# measures reading a year of 1m candles from the local OHLCV store as lists and as arrays,
+# and finding the missing ranges in it
+
+minute = 60000
+count = 365 * 24 * 60
+ohlcvs = [[i * minute, 100.0, 101.0, 99.0, 100.5, 1.0] for i in range(0, count)]
+
+path = tempfile.mkdtemp()
+try:
+    store = OHLCVStore(path)
+    started = time.time()
+    store.write('binance', 'BTC/USDT', '1m', ohlcvs, 0, count * minute)
+    print('{:<12} {:>10.1f} ms'.format('write', (time.time() - started) * 1000))
+    for name, arrays in [('read lists', False), ('read arrays', True)]:
+        started = time.time()
+        result = store.read('binance', 'BTC/USDT', '1m', arrays=arrays)
+        print('{:<12} {:>10.1f} ms'.format(name, (time.time() - started) * 1000))
+    started = time.time()
+    store.missing('binance', 'BTC/USDT', '1m', 0, (count + 60) * minute)
+    print('{:<12} {:>10.1f} ms'.format('missing', (time.time() - started) * 1000))
+finally:
+    shutil.rmtree(path)
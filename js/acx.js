@@ -183,8 +183,8 @@ module.exports = class acx extends Exchange {
             let id = ids[i];
             let market = undefined;
             let symbol = id;
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             } else {
                 let base = id.slice (0, 3);
@@ -268,7 +268,7 @@ module.exports = class acx extends Exchange {
             symbol = market['symbol'];
         } else {
             let marketId = order['market'];
-            symbol = this.marketsById[marketId]['symbol'];
+            symbol = this.findMarket (marketId)['symbol'];
         }
         let timestamp = this.parse8601 (order['created_at']);
         let state = order['state'];
@@ -310,7 +310,7 @@ module.exports = class acx extends Exchange {
             order['price'] = price.toString ();
         }
         let response = await this.privatePostOrders (this.extend (order, params));
-        let market = this.marketsById[response['market']];
+        let market = this.findMarket (response['market']);
         return this.parseOrder (response, market);
     }
 
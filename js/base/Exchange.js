@@ -102,6 +102,7 @@ module.exports = class Exchange {
         this.journal          = 'debug.json'
         this.userAgent        = undefined
         this.twofa            = false // two-factor authentication (2FA)
+        this.marketIdSeparators = [ '', '_', '-', '/' ]
         this.timeframes       = undefined
         this.hasPublicAPI         = true
         this.hasPrivateAPI        = true
@@ -156,6 +157,7 @@ module.exports = class Exchange {
 
         this.market_id                   = this.marketId
         this.market_ids                  = this.marketIds
+        this.find_market                 = this.findMarket
         this.array_concat                = this.arrayConcat
         this.implode_params              = this.implodeParams
         this.extract_params              = this.extractParams
@@ -201,6 +203,7 @@ module.exports = class Exchange {
         this.amount_to_string            = this.amountToString
         this.fee_to_precision            = this.feeToPrecision
         this.cost_to_precision           = this.costToPrecision
+        this.to_number                   = this.toNumber
         this.precisionFromString         = precisionFromString
         this.precision_from_string       = precisionFromString
         this.truncate                    = functions.truncate
@@ -223,6 +226,7 @@ module.exports = class Exchange {
             'fetchOpenOrders': false,
             'fetchOrder': false,
             'fetchOrderBook': true,
+            'fetchOrderBooks': false,
             'fetchOrders': false,
             'fetchTicker': true,
             'fetchTickers': false,
@@ -304,6 +308,15 @@ module.exports = class Exchange {
         }
     }
 
+    requestCost (path, api = 'public', method = 'GET', params = {}) {
+        // weights per rate limit bucket, only enforced by the Python rate limiters for now
+        const costs = ((this.apiCosts || {})[api] || {})[method.toLowerCase ()] || {}
+        const cost = costs[path]
+        if (typeof cost === 'undefined')
+            return { 'default': 1 }
+        return (typeof cost === 'object') ? extend ({}, cost) : { 'default': cost }
+    }
+
     defineRestApi (api, methodName, options = {}) {
 
         for (const type of Object.keys (api)) {
@@ -501,6 +514,7 @@ module.exports = class Exchange {
         this.markets_by_id = this.marketsById
         this.symbols = Object.keys (this.markets).sort ()
         this.ids = Object.keys (this.markets_by_id).sort ()
+        this.marketsByRawId = this.indexByRawId (values)
         if (currencies) {
             this.currencies = deepExtend (currencies, this.currencies)
         } else {
@@ -632,6 +646,37 @@ module.exports = class Exchange {
         return this.market (symbol).id || symbol
     }
 
+    indexByRawId (markets) {
+        const result = {}
+        const ambiguous = {}
+        for (const market of markets) {
+            const ids = [ market.id, market.symbol, market.altname ]
+            for (const [ base, quote ] of [ [ market.baseId, market.quoteId ], [ market.base, market.quote ] ])
+                if (base && quote)
+                    ids.push (...this.marketIdSeparators.map (separator => base + separator + quote))
+            for (const id of ids)
+                if (typeof id === 'string')
+                    for (const form of [ id, id.toLowerCase (), id.toUpperCase () ])
+                        if (!(form in result))
+                            result[form] = market
+                        else if (result[form] !== market)
+                            ambiguous[form] = true
+        }
+        // a form shared by several markets, like ABC for AB/C and A/BC, finds none of them
+        for (const form of Object.keys (ambiguous))
+            delete result[form]
+        // the exact symbols and ids take precedence over the forms derived from other markets
+        for (const key of [ 'symbol', 'id' ])
+            for (const market of markets)
+                if (typeof market[key] !== 'undefined')
+                    result[market[key]] = market
+        return result
+    }
+
+    findMarket (id) {
+        return this.marketsByRawId ? this.marketsByRawId[id] : undefined
+    }
+
     marketIds (symbols) {
         return symbols.map (symbol => this.marketId(symbol));
     }
@@ -859,15 +904,20 @@ module.exports = class Exchange {
         return parseFloat (fee).toFixed (this.markets[symbol].precision.price)
     }
 
+    toNumber (value) {
+        // the Python number type can be Decimal or str, JS numbers are always floats
+        return parseFloat (value)
+    }
+
     calculateFee (symbol, type, side, amount, price, takerOrMaker = 'taker', params = {}) {
         let market = this.markets[symbol]
-        let rate = market[takerOrMaker]
-        let cost = parseFloat (this.costToPrecision (symbol, amount * price))
+        let rate = this.toNumber (market[takerOrMaker])
+        let cost = this.toNumber (this.costToPrecision (symbol, this.toNumber (amount) * this.toNumber (price)))
         return {
             'type': takerOrMaker,
             'currency': market['quote'],
             'rate': rate,
-            'cost': parseFloat (this.feeToPrecision (symbol, rate * cost)),
+            'cost': this.toNumber (this.feeToPrecision (symbol, rate * cost)),
         }
     }
 
@@ -15,6 +15,31 @@ module.exports = class binance extends Exchange {
             'name': 'Binance',
             'countries': 'JP', // Japan
             'rateLimit': 500,
+            'ohlcvPageSize': 500, // candles per OHLCV request
+            'rateLimits': {
+                'default': { 'rateLimit': 50 }, // 1200 request weight per minute
+                'orders': { 'rateLimit': 100 }, // 10 orders per second
+            },
+            // request weights, 1 if not listed
+            'apiCosts': {
+                'private': {
+                    'get': {
+                        'allOrders': 5,
+                        'account': 5,
+                        'myTrades': 5,
+                    },
+                    'post': {
+                        'order': { 'default': 1, 'orders': 1 },
+                    },
+                    'delete': {
+                        'order': { 'default': 1, 'orders': 1 },
+                    },
+                },
+            },
+            'adaptiveRateLimit': {
+                'usedWeightHeader': 'X-MBX-USED-WEIGHT',
+                'weightLimit': 1200,
+            },
             'hasCORS': false,
             // obsolete metainfo interface
             'hasFetchBidsAsks': true,
@@ -376,10 +401,10 @@ module.exports = class binance extends Exchange {
     calculateFee (symbol, type, side, amount, price, takerOrMaker = 'taker', params = {}) {
         let market = this.markets[symbol];
         let key = 'quote';
-        let rate = market[takerOrMaker];
-        let cost = parseFloat (this.costToPrecision (symbol, amount * rate));
+        let rate = this.toNumber (market[takerOrMaker]);
+        let cost = this.toNumber (this.costToPrecision (symbol, this.toNumber (amount) * rate));
         if (side === 'sell') {
-            cost *= price;
+            cost *= this.toNumber (price);
         } else {
             key = 'base';
         }
@@ -387,7 +412,7 @@ module.exports = class binance extends Exchange {
             'type': takerOrMaker,
             'currency': market[key],
             'rate': rate,
-            'cost': parseFloat (this.feeToPrecision (symbol, cost)),
+            'cost': this.toNumber (this.feeToPrecision (symbol, cost)),
         };
     }
 
@@ -401,8 +426,8 @@ module.exports = class binance extends Exchange {
             let asset = balance['asset'];
             let currency = this.commonCurrencyCode (asset);
             let account = {
-                'free': parseFloat (balance['free']),
-                'used': parseFloat (balance['locked']),
+                'free': this.safeFloat (balance, 'free', 0.0),
+                'used': this.safeFloat (balance, 'locked', 0.0),
                 'total': 0.0,
             };
             account['total'] = this.sum (account['free'], account['used']);
@@ -418,7 +443,9 @@ module.exports = class binance extends Exchange {
             'symbol': market['id'],
             'limit': 100, // default = maximum = 100
         }, params));
-        return this.parseOrderBook (orderbook);
+        let result = this.parseOrderBook (orderbook);
+        result['nonce'] = this.safeInteger (orderbook, 'lastUpdateId');
+        return result;
     }
 
     parseTicker (ticker, market = undefined) {
@@ -427,9 +454,7 @@ module.exports = class binance extends Exchange {
             timestamp = this.milliseconds ();
         let symbol = ticker['symbol'];
         if (!market) {
-            if (symbol in this.markets_by_id) {
-                market = this.markets_by_id[symbol];
-            }
+            market = this.findMarket (symbol);
         }
         if (market)
             symbol = market['symbol'];
@@ -526,9 +551,9 @@ module.exports = class binance extends Exchange {
         let timestampField = ('T' in trade) ? 'T' : 'time';
         let timestamp = trade[timestampField];
         let priceField = ('p' in trade) ? 'p' : 'price';
-        let price = parseFloat (trade[priceField]);
+        let price = this.safeFloat (trade, priceField);
         let amountField = ('q' in trade) ? 'q' : 'qty';
-        let amount = parseFloat (trade[amountField]);
+        let amount = this.safeFloat (trade, amountField);
         let idField = ('a' in trade) ? 'a' : 'id';
         let id = trade[idField].toString ();
         let side = undefined;
@@ -543,7 +568,7 @@ module.exports = class binance extends Exchange {
         let fee = undefined;
         if ('commission' in trade) {
             fee = {
-                'cost': parseFloat (trade['commission']),
+                'cost': this.safeFloat (trade, 'commission'),
                 'currency': this.commonCurrencyCode (trade['commissionAsset']),
             };
         }
@@ -602,8 +627,8 @@ module.exports = class binance extends Exchange {
             symbol = market['symbol'];
         } else {
             let id = order['symbol'];
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             }
         }
@@ -614,10 +639,10 @@ module.exports = class binance extends Exchange {
             timestamp = order['transactTime'];
         else
             throw new ExchangeError (this.id + ' malformed order: ' + this.json (order));
-        let price = parseFloat (order['price']);
-        let amount = parseFloat (order['origQty']);
-        let filled = this.safeFloat (order, 'executedQty', 0.0);
-        let remaining = Math.max (amount - filled, 0.0);
+        let price = this.safeFloat (order, 'price');
+        let amount = this.safeFloat (order, 'origQty');
+        let filled = this.safeFloat (order, 'executedQty', 0);
+        let remaining = Math.max (amount - filled, this.toNumber (0));
         let result = {
             'info': order,
             'id': order['orderId'].toString (),
@@ -779,6 +804,22 @@ module.exports = class binance extends Exchange {
         };
     }
 
+    requestCost (path, api = 'public', method = 'GET', params = {}) {
+        let cost = super.requestCost (path, api, method, params);
+        if (path === 'depth') {
+            let limit = this.safeInteger (params, 'limit', 100);
+            if (limit > 500) {
+                cost['default'] = 10;
+            } else if (limit > 100) {
+                cost['default'] = 5;
+            }
+        } else if ((path === 'ticker/24hr') || (path === 'openOrders')) {
+            if (!('symbol' in params))
+                cost['default'] = 40;
+        }
+        return cost;
+    }
+
     sign (path, api = 'public', method = 'GET', params = {}, headers = undefined, body = undefined) {
         let url = this.urls['api'][api];
         url += '/' + path;
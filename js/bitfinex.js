@@ -16,6 +16,7 @@ module.exports = class bitfinex extends Exchange {
             'countries': 'VG',
             'version': 'v1',
             'rateLimit': 1500,
+            'ohlcvPageSize': 1000, // candles per OHLCV request
             'hasCORS': false,
             // old metainfo interface
             'hasFetchOrder': true,
@@ -310,8 +311,8 @@ module.exports = class bitfinex extends Exchange {
             let ticker = tickers[i];
             if ('pair' in ticker) {
                 let id = ticker['pair'];
-                if (id in this.markets_by_id) {
-                    let market = this.markets_by_id[id];
+                let market = this.findMarket (id);
+                if (market) {
                     let symbol = market['symbol'];
                     result[symbol] = this.parseTicker (ticker, market);
                 } else {
@@ -340,8 +341,8 @@ module.exports = class bitfinex extends Exchange {
             symbol = market['symbol'];
         } else if ('pair' in ticker) {
             let id = ticker['pair'];
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             } else {
                 throw new ExchangeError (this.id + ' unrecognized ticker symbol ' + id + ' ' + this.json (ticker));
@@ -460,9 +461,7 @@ module.exports = class bitfinex extends Exchange {
         let symbol = undefined;
         if (!market) {
             let exchange = order['symbol'].toUpperCase ();
-            if (exchange in this.markets_by_id) {
-                market = this.markets_by_id[exchange];
-            }
+            market = this.findMarket (exchange);
         }
         if (market)
             symbol = market['symbol'];
@@ -185,8 +185,8 @@ module.exports = class bithumb extends Exchange {
             let id = ids[i];
             let symbol = id;
             let market = undefined;
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             }
             let ticker = tickers[id];
@@ -187,7 +187,7 @@ module.exports = class bitlish extends Exchange {
         let result = {};
         for (let i = 0; i < ids.length; i++) {
             let id = ids[i];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             let ticker = tickers[id];
             result[symbol] = this.parseTicker (ticker, market);
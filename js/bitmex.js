@@ -17,6 +17,7 @@ module.exports = class bitmex extends Exchange {
             'version': 'v1',
             'userAgent': undefined,
             'rateLimit': 1500,
+            'ohlcvPageSize': 500, // candles per OHLCV request
             'hasCORS': false,
             'hasFetchOHLCV': true,
             'hasWithdraw': true,
@@ -307,7 +308,7 @@ module.exports = class bitmex extends Exchange {
         let symbol = undefined;
         if (!market) {
             if ('symbol' in trade)
-                market = this.markets_by_id[trade['symbol']];
+                market = this.findMarket (trade['symbol']);
         }
         if (market)
             symbol = market['symbol'];
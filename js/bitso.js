@@ -180,7 +180,7 @@ module.exports = class bitso extends Exchange {
         let symbol = undefined;
         if (!market) {
             if ('book' in trade)
-                market = this.markets_by_id[trade['book']];
+                market = this.findMarket (trade['book']);
         }
         if (market)
             symbol = market['symbol'];
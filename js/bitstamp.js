@@ -247,9 +247,9 @@ module.exports = class bitstamp extends Exchange {
         if ('order_id' in trade)
             order = trade['order_id'].toString ();
         if ('currency_pair' in trade) {
-            let marketId = trade['currency_pair'];
-            if (marketId in this.markets_by_id)
-                market = this.markets_by_id[marketId];
+            let found = this.findMarket (trade['currency_pair']);
+            if (found)
+                market = found;
         }
         let price = this.safeFloat (trade, 'price');
         price = this.safeFloat (trade, market['symbolId'], price);
@@ -125,8 +125,9 @@ module.exports = class bitstamp1 extends Exchange {
         if ('order_id' in trade)
             order = trade['order_id'].toString ();
         if ('currency_pair' in trade) {
-            if (trade['currency_pair'] in this.markets_by_id)
-                market = this.markets_by_id[trade['currency_pair']];
+            let found = this.findMarket (trade['currency_pair']);
+            if (found)
+                market = found;
         }
         return {
             'id': trade['tid'].toString (),
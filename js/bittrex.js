@@ -323,8 +323,8 @@ module.exports = class bittrex extends Exchange {
             let id = ticker['MarketName'];
             let market = undefined;
             let symbol = id;
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             } else {
                 symbol = this.parseSymbol (id);
@@ -491,9 +491,8 @@ module.exports = class bittrex extends Exchange {
         if (!market) {
             if ('Exchange' in order) {
                 let marketId = order['Exchange'];
-                if (marketId in this.markets_by_id)
-                    market = this.markets_by_id[marketId];
-                else
+                market = this.findMarket (marketId);
+                if (!market)
                     symbol = this.parseSymbol (marketId);
             }
         }
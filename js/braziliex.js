@@ -228,7 +228,7 @@ module.exports = class braziliex extends Exchange {
         let ids = Object.keys (tickers);
         for (let i = 0; i < ids.length; i++) {
             let id = ids[i];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             let ticker = {
                 'date': timestamp,
@@ -309,8 +309,7 @@ module.exports = class braziliex extends Exchange {
         if (!market) {
             let marketId = this.safeString (order, 'market');
             if (marketId)
-                if (marketId in this.markets_by_id)
-                    market = this.markets_by_id[marketId];
+                market = this.findMarket (marketId);
         }
         if (market)
             symbol = market['symbol'];
@@ -121,8 +121,8 @@ module.exports = class btcturk extends Exchange {
             let ticker = tickers[i];
             let symbol = ticker['pair'];
             let market = undefined;
-            if (symbol in this.markets_by_id) {
-                market = this.markets_by_id[symbol];
+            market = this.findMarket (symbol);
+            if (market) {
                 symbol = market['symbol'];
             }
             result[symbol] = this.parseTicker (ticker, market);
@@ -193,11 +193,9 @@ module.exports = class bter extends Exchange {
             quote = this.commonCurrencyCode (quote);
             let symbol = base + '/' + quote;
             let ticker = tickers[id];
-            let market = undefined;
-            if (symbol in this.markets)
-                market = this.markets[symbol];
-            if (id in this.markets_by_id)
-                market = this.markets_by_id[id];
+            let market = this.findMarket (id);
+            if (!market)
+                market = this.findMarket (symbol);
             result[symbol] = this.parseTicker (ticker, market);
         }
         return result;
@@ -164,7 +164,7 @@ module.exports = class bxinth extends Exchange {
         for (let i = 0; i < ids.length; i++) {
             let id = ids[i];
             let ticker = tickers[id];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             result[symbol] = this.parseTicker (ticker, market);
         }
@@ -169,8 +169,8 @@ module.exports = class ccex extends Exchange {
             let uppercase = id.toUpperCase ();
             let market = undefined;
             let symbol = undefined;
-            if (uppercase in this.markets_by_id) {
-                market = this.markets_by_id[uppercase];
+            market = this.findMarket (uppercase);
+            if (market) {
                 symbol = market['symbol'];
             } else {
                 let [ base, quote ] = uppercase.split ('-');
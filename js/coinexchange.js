@@ -130,7 +130,7 @@ module.exports = class coinexchange extends Exchange {
     parseTicker (ticker, market = undefined) {
         if (!market) {
             let marketId = ticker['MarketID'];
-            market = this.marketsById[marketId];
+            market = this.findMarket (marketId);
         }
         let symbol = undefined;
         if (market)
@@ -230,7 +230,7 @@ module.exports = class coingi extends Exchange {
 
     parseTrade (trade, market = undefined) {
         if (!market)
-            market = this.markets_by_id[trade['currencyPair']];
+            market = this.findMarket (trade['currencyPair']);
         return {
             'id': trade['id'],
             'info': trade,
@@ -192,8 +192,8 @@ module.exports = class coinmarketcap extends Exchange {
             let id = ticker['id'] + '/' + currency;
             let symbol = id;
             let market = undefined;
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             }
             tickers[symbol] = this.parseTicker (ticker, market);
@@ -129,7 +129,7 @@ module.exports = class coinmate extends Exchange {
 
     parseTrade (trade, market = undefined) {
         if (!market)
-            market = this.markets_by_id[trade['currencyPair']];
+            market = this.findMarket (trade['currencyPair']);
         return {
             'id': trade['transactionId'],
             'info': trade,
@@ -222,10 +222,9 @@ module.exports = class cryptopia extends Exchange {
         for (let i = 0; i < tickers.length; i++) {
             let ticker = tickers[i];
             let id = ticker['TradePairId'];
-            let recognized = (id in this.markets_by_id);
-            if (!recognized)
+            let market = this.findMarket (id);
+            if (!market)
                 throw new ExchangeError (this.id + ' fetchTickers() returned unrecognized pair id ' + id);
-            let market = this.markets_by_id[id];
             let symbol = market['symbol'];
             result[symbol] = this.parseTicker (ticker, market);
         }
@@ -246,8 +245,7 @@ module.exports = class cryptopia extends Exchange {
         let id = this.safeString (trade, 'TradeId');
         if (!market) {
             if ('TradePairId' in trade)
-                if (trade['TradePairId'] in this.markets_by_id)
-                    market = this.markets_by_id[trade['TradePairId']];
+                market = this.findMarket (trade['TradePairId']);
         }
         let symbol = undefined;
         let fee = undefined;
@@ -459,8 +457,8 @@ module.exports = class cryptopia extends Exchange {
             symbol = market['symbol'];
         } else if ('Market' in order) {
             let id = order['Market'];
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             }
         }
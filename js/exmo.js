@@ -192,7 +192,7 @@ module.exports = class exmo extends Exchange {
         let ids = Object.keys (response);
         for (let i = 0; i < ids.length; i++) {
             let id = ids[i];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             let ticker = response[id];
             result[symbol] = this.parseTicker (ticker, market);
@@ -274,7 +274,7 @@ module.exports = class gatecoin extends Exchange {
         for (let t = 0; t < tickers.length; t++) {
             let ticker = tickers[t];
             let id = ticker['currencyPair'];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             result[symbol] = this.parseTicker (ticker, market);
         }
@@ -301,7 +301,7 @@ module.exports = class gatecoin extends Exchange {
         }
         let timestamp = parseInt (trade['transactionTime']) * 1000;
         if (!market)
-            market = this.markets_by_id[trade['currencyPair']];
+            market = this.findMarket (trade['currencyPair']);
         return {
             'info': trade,
             'id': trade['transactionId'].toString (),
@@ -217,7 +217,9 @@ module.exports = class gdax extends Exchange {
             'id': this.marketId (symbol),
             'level': 2, // 1 best bidask, 2 aggregated, 3 full
         }, params));
-        return this.parseOrderBook (orderbook);
+        let result = this.parseOrderBook (orderbook);
+        result['nonce'] = this.safeInteger (orderbook, 'sequence');
+        return result;
     }
 
     async fetchTicker (symbol, params = {}) {
@@ -341,8 +343,7 @@ module.exports = class gdax extends Exchange {
         let timestamp = this.parse8601 (order['created_at']);
         let symbol = undefined;
         if (!market) {
-            if (order['product_id'] in this.markets_by_id)
-                market = this.markets_by_id[order['product_id']];
+            market = this.findMarket (order['product_id']);
         }
         let status = this.parseOrderStatus (order['status']);
         let price = this.safeFloat (order, 'price');
@@ -606,7 +606,7 @@ module.exports = class hitbtc extends Exchange {
         let result = {};
         for (let i = 0; i < ids.length; i++) {
             let id = ids[i];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             let ticker = tickers[id];
             result[symbol] = this.parseTicker (ticker, market);
@@ -713,7 +713,7 @@ module.exports = class hitbtc extends Exchange {
             timestamp = this.safeInteger (order, 'timestamp');
         let symbol = undefined;
         if (!market)
-            market = this.markets_by_id[order['symbol']];
+            market = this.findMarket (order['symbol']);
         let status = this.safeString (order, 'orderStatus');
         if (status)
             status = this.parseOrderStatus (status);
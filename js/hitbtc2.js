@@ -729,7 +729,7 @@ module.exports = class hitbtc2 extends hitbtc {
         for (let i = 0; i < tickers.length; i++) {
             let ticker = tickers[i];
             let id = ticker['symbol'];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             result[symbol] = this.parseTicker (ticker, market);
         }
@@ -754,8 +754,8 @@ module.exports = class hitbtc2 extends hitbtc {
             symbol = market['symbol'];
         } else {
             let id = trade['symbol'];
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             } else {
                 symbol = id;
@@ -843,7 +843,7 @@ module.exports = class hitbtc2 extends hitbtc {
         if ('updatedAt' in order)
             updated = this.parse8601 (order['updatedAt']);
         if (!market)
-            market = this.markets_by_id[order['symbol']];
+            market = this.findMarket (order['symbol']);
         let symbol = market['symbol'];
         let amount = this.safeFloat (order, 'quantity');
         let filled = this.safeFloat (order, 'cumQuantity');
@@ -378,10 +378,7 @@ module.exports = class huobipro extends Exchange {
         let symbol = undefined;
         if (!market) {
             if ('symbol' in order) {
-                if (order['symbol'] in this.markets_by_id) {
-                    let marketId = order['symbol'];
-                    market = this.markets_by_id[marketId];
-                }
+                market = this.findMarket (order['symbol']);
             }
         }
         if (market)
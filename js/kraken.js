@@ -16,6 +16,8 @@ module.exports = class kraken extends Exchange {
             'countries': 'US',
             'version': '0',
             'rateLimit': 3000,
+            'ohlcvPageSize': 720, // candles per OHLCV request
+            'ohlcvLatestOnly': true, // only the latest 720 candles, whatever the since
             'hasCORS': false,
             // obsolete metainfo interface
             'hasFetchTickers': true,
@@ -398,7 +400,7 @@ module.exports = class kraken extends Exchange {
         let result = {};
         for (let i = 0; i < ids.length; i++) {
             let id = ids[i];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             let ticker = tickers[id];
             result[symbol] = this.parseTicker (ticker, market);
@@ -554,13 +556,7 @@ module.exports = class kraken extends Exchange {
     }
 
     findMarketByAltnameOrId (id) {
-        let result = undefined;
-        if (id in this.marketsByAltname) {
-            result = this.marketsByAltname[id];
-        } else if (id in this.markets_by_id) {
-            result = this.markets_by_id[id];
-        }
-        return result;
+        return this.findMarket (id);
     }
 
     parseOrder (order, market = undefined) {
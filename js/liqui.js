@@ -28,6 +28,7 @@ module.exports = class liqui extends Exchange {
                 'fetchOpenOrders': true,
                 'fetchClosedOrders': 'emulated',
                 'fetchTickers': true,
+                'fetchOrderBooks': true,
                 'fetchMyTrades': true,
                 'withdraw': true,
             },
@@ -218,6 +219,38 @@ module.exports = class liqui extends Exchange {
         return result;
     }
 
+    async fetchOrderBooks (symbols = undefined, params = {}) {
+        await this.loadMarkets ();
+        let ids = undefined;
+        if (!symbols) {
+            ids = this.ids.join ('-');
+            if (ids.length > 2083) {
+                let numIds = this.ids.length;
+                throw new ExchangeError (this.id + ' has ' + numIds.toString () + ' symbols exceeding max URL length, you are required to specify a list of symbols in the first argument to fetchOrderBooks');
+            }
+        } else {
+            ids = this.marketIds (symbols);
+            ids = ids.join ('-');
+        }
+        let response = await this.publicGetDepthPair (this.extend ({
+            'pair': ids,
+        }, params));
+        let result = {};
+        ids = Object.keys (response);
+        for (let i = 0; i < ids.length; i++) {
+            let id = ids[i];
+            let symbol = id;
+            let market = this.findMarket (id);
+            if (market) {
+                symbol = market['symbol'];
+            }
+            result[symbol] = this.parseOrderBook (response[id]);
+            result[symbol]['bids'] = this.sortBy (result[symbol]['bids'], 0, true);
+            result[symbol]['asks'] = this.sortBy (result[symbol]['asks'], 0);
+        }
+        return result;
+    }
+
     parseTicker (ticker, market = undefined) {
         let timestamp = ticker['updated'] * 1000;
         let symbol = undefined;
@@ -269,7 +302,7 @@ module.exports = class liqui extends Exchange {
         for (let k = 0; k < keys.length; k++) {
             let id = keys[k];
             let ticker = tickers[id];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             result[symbol] = this.parseTicker (ticker, market);
         }
@@ -297,7 +330,7 @@ module.exports = class liqui extends Exchange {
         let order = this.safeString (trade, this.getOrderIdKey ());
         if ('pair' in trade) {
             let marketId = trade['pair'];
-            market = this.markets_by_id[marketId];
+            market = this.findMarket (marketId);
         }
         let symbol = undefined;
         if (market)
@@ -411,7 +444,7 @@ module.exports = class liqui extends Exchange {
         let timestamp = parseInt (order['timestamp_created']) * 1000;
         let symbol = undefined;
         if (!market)
-            market = this.markets_by_id[order['pair']];
+            market = this.findMarket (order['pair']);
         if (market)
             symbol = market['symbol'];
         let remaining = undefined;
@@ -244,8 +244,7 @@ module.exports = class lykke extends Exchange {
         let symbol = undefined;
         if (!market) {
             if ('AssetPairId' in order)
-                if (order['AssetPairId'] in this.markets_by_id)
-                    market = this.markets_by_id[order['AssetPairId']];
+                market = this.findMarket (order['AssetPairId']);
         }
         if (market)
             symbol = market['symbol'];
@@ -185,8 +185,7 @@ module.exports = class mercado extends Exchange {
         let symbol = undefined;
         if (!market) {
             if ('coin_pair' in order)
-                if (order['coin_pair'] in this.markets_by_id)
-                    market = this.markets_by_id[order['coin_pair']];
+                market = this.findMarket (order['coin_pair']);
         }
         if (market)
             symbol = market['symbol'];
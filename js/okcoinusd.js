@@ -17,6 +17,7 @@ module.exports = class okcoinusd extends Exchange {
             'hasCORS': false,
             'version': 'v1',
             'rateLimit': 1000, // up to 3000 requests per 5 minutes ≈ 600 requests per minute ≈ 10 requests per second ≈ 100 ms
+            'ohlcvPageSize': 1440, // candles per OHLCV request
             // obsolete metainfo interface
             'hasFetchOHLCV': true,
             'hasFetchOrder': true,
@@ -440,8 +441,7 @@ module.exports = class okcoinusd extends Exchange {
         let symbol = undefined;
         if (!market) {
             if ('symbol' in order)
-                if (order['symbol'] in this.markets_by_id)
-                    market = this.markets_by_id[order['symbol']];
+                market = this.findMarket (order['symbol']);
         }
         if (market)
             symbol = market['symbol'];
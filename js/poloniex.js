@@ -293,7 +293,7 @@ module.exports = class poloniex extends Exchange {
         let result = {};
         for (let i = 0; i < ids.length; i++) {
             let id = ids[i];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             let ticker = tickers[id];
             result[symbol] = this.parseTicker (ticker, market);
@@ -364,9 +364,8 @@ module.exports = class poloniex extends Exchange {
         let quote = undefined;
         if ((!market) && ('currencyPair' in trade)) {
             let currencyPair = trade['currencyPair'];
-            if (currencyPair in this.markets_by_id) {
-                market = this.markets_by_id[currencyPair];
-            } else {
+            market = this.findMarket (currencyPair);
+            if (!market) {
                 let parts = currencyPair.split ('_');
                 quote = parts[0];
                 base = parts[1];
@@ -454,9 +453,7 @@ module.exports = class poloniex extends Exchange {
                 let ids = Object.keys (response);
                 for (let i = 0; i < ids.length; i++) {
                     let id = ids[i];
-                    let market = undefined;
-                    if (id in this.markets_by_id)
-                        market = this.markets_by_id[id];
+                    let market = this.findMarket (id);
                     let trades = this.parseTrades (response[id], market);
                     for (let j = 0; j < trades.length; j++) {
                         result.push (trades[j]);
@@ -549,7 +546,7 @@ module.exports = class poloniex extends Exchange {
             for (let i = 0; i < marketIds.length; i++) {
                 let marketId = marketIds[i];
                 let orders = response[marketId];
-                let m = this.markets_by_id[marketId];
+                let m = this.findMarket (marketId);
                 openOrders = this.parseOpenOrders (orders, m, openOrders);
             }
         }
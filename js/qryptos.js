@@ -251,7 +251,7 @@ module.exports = class qryptos extends Exchange {
     parseOrder (order) {
         let timestamp = order['created_at'] * 1000;
         let marketId = order['product_id'].toString ();
-        let market = this.marketsById[marketId];
+        let market = this.findMarket (marketId);
         let status = undefined;
         if ('status' in order) {
             if (order['status'] === 'live') {
@@ -181,7 +181,7 @@ module.exports = class therock extends Exchange {
         let result = {};
         for (let i = 0; i < ids.length; i++) {
             let id = ids[i];
-            let market = this.markets_by_id[id];
+            let market = this.findMarket (id);
             let symbol = market['symbol'];
             let ticker = tickers[id];
             result[symbol] = this.parseTicker (ticker, market);
@@ -200,7 +200,7 @@ module.exports = class therock extends Exchange {
 
     parseTrade (trade, market = undefined) {
         if (!market)
-            market = this.markets_by_id[trade['fund_id']];
+            market = this.findMarket (trade['fund_id']);
         let timestamp = this.parse8601 (trade['date']);
         return {
             'info': trade,
@@ -209,8 +209,8 @@ module.exports = class xbtce extends Exchange {
             let id = ids[i];
             let market = undefined;
             let symbol = undefined;
-            if (id in this.markets_by_id) {
-                market = this.markets_by_id[id];
+            market = this.findMarket (id);
+            if (market) {
                 symbol = market['symbol'];
             } else {
                 let base = id.slice (0, 3);
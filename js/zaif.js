@@ -181,7 +181,7 @@ module.exports = class zaif extends Exchange {
         let id = this.safeString (trade, 'id');
         id = this.safeString (trade, 'tid', id);
         if (!market)
-            market = this.markets_by_id[trade['currency_pair']];
+            market = this.findMarket (trade['currency_pair']);
         return {
             'id': id.toString (),
             'info': trade,
@@ -230,7 +230,7 @@ module.exports = class zaif extends Exchange {
         let side = (order['action'] == 'bid') ? 'buy' : 'sell';
         let timestamp = parseInt (order['timestamp']) * 1000;
         if (!market)
-            market = this.markets_by_id[order['currency_pair']];
+            market = this.findMarket (order['currency_pair']);
         let price = order['price'];
         let amount = order['amount'];
         return {
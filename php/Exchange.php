@@ -530,6 +530,8 @@ abstract class Exchange {
         $this->password    = '';
         $this->uid         = '';
         $this->twofa       = false;
+        $this->marketIdSeparators = array ('', '_', '-', '/');
+        $this->markets_by_raw_id = null;
         $this->marketsById = null;
         $this->markets_by_id = null;
         $this->userAgent   = null; // 'ccxt/' . $version . ' (+https://github.com/ccxt/ccxt) PHP/' . PHP_VERSION;
@@ -585,6 +587,7 @@ abstract class Exchange {
             'fetchOpenOrders' => false,
             'fethcOrder' => false,
             'fethcOrderBook' => true,
+            'fetchOrderBooks' => false,
             'fetchOrders' => false,
             'fetchTicker' => true,
             'fetchTickers' => false,
@@ -613,6 +616,16 @@ abstract class Exchange {
             $this->set_markets ($this->markets);
     }
 
+    public function request_cost ($path, $api = 'public', $method = 'GET', $params = array ()) {
+        // weights per rate limit bucket, only enforced by the Python rate limiters for now
+        $method = strtolower ($method);
+        if (isset ($this->apiCosts[$api][$method][$path]))
+            $cost = $this->apiCosts[$api][$method][$path];
+        else
+            return array ('default' => 1);
+        return is_array ($cost) ? $cost : array ('default' => $cost);
+    }
+
     public function define_rest_api ($api, $method_name, $options = array ()) {
         foreach ($api as $type => $methods)
             foreach ($methods as $http_method => $paths)
@@ -961,6 +974,7 @@ abstract class Exchange {
         sort ($this->symbols);
         $this->ids = array_keys ($this->markets_by_id);
         sort ($this->ids);
+        $this->markets_by_raw_id = $this->index_by_raw_id ($values);
         if ($currencies) {
             $this->currencies = array_replace_recursive ($currencies, $this->currencies);
         } else {
@@ -1348,15 +1362,24 @@ abstract class Exchange {
         return $this->create_market_sell_order ($symbol, $amount, $params);
     }
 
+    public function to_number ($value) {
+        // the Python number type can be Decimal or str, PHP numbers are always floats
+        return floatval ($value);
+    }
+
+    public function toNumber ($value) {
+        return $this->to_number ($value);
+    }
+
     public function calculate_fee ($symbol, $type, $side, $amount, $price, $takerOrMaker = 'taker', $params = array ()) {
         $market = $this->markets[$symbol];
-        $rate = $market[$takerOrMaker];
-        $cost = floatval ($this->cost_to_precision ($symbol, $amount * $price));
+        $rate = $this->to_number ($market[$takerOrMaker]);
+        $cost = $this->to_number ($this->cost_to_precision ($symbol, $this->to_number ($amount) * $this->to_number ($price)));
         return array (
             'type' => $takerOrMaker,
             'currency' => $market['quote'],
             'rate' => $rate,
-            'cost' => floatval ($this->fee_to_precision ($symbol, $rate * $cost)),
+            'cost' => $this->to_number ($this->fee_to_precision ($symbol, $rate * $cost)),
         );
     }
 
@@ -1460,6 +1483,47 @@ abstract class Exchange {
         throw new ExchangeError ($this->id . ' does not have market symbol ' . $symbol);
     }
 
+    public function index_by_raw_id ($markets) {
+        $result = array ();
+        $ambiguous = array ();
+        foreach ($markets as $market) {
+            $ids = array ();
+            foreach (array ('id', 'symbol', 'altname') as $key)
+                if (array_key_exists ($key, $market))
+                    $ids[] = $market[$key];
+            foreach (array (array ('baseId', 'quoteId'), array ('base', 'quote')) as $keys) {
+                list ($base, $quote) = $keys;
+                if (!empty ($market[$base]) && !empty ($market[$quote]))
+                    foreach ($this->marketIdSeparators as $separator)
+                        $ids[] = $market[$base] . $separator . $market[$quote];
+            }
+            foreach ($ids as $id)
+                if (is_string ($id))
+                    foreach (array ($id, strtolower ($id), strtoupper ($id)) as $form)
+                        if (!array_key_exists ($form, $result))
+                            $result[$form] = $market;
+                        else if ($result[$form] != $market)
+                            $ambiguous[$form] = true;
+        }
+        // a form shared by several markets, like ABC for AB/C and A/BC, finds none of them
+        foreach ($ambiguous as $form => $value)
+            unset ($result[$form]);
+        // the exact symbols and ids take precedence over the forms derived from other markets
+        foreach (array ('symbol', 'id') as $key)
+            foreach ($markets as $market)
+                if (array_key_exists ($key, $market))
+                    $result[$market[$key]] = $market;
+        return $result;
+    }
+
+    public function find_market ($id) {
+        return (isset ($this->markets_by_raw_id) && array_key_exists ($id, $this->markets_by_raw_id)) ? $this->markets_by_raw_id[$id] : null;
+    }
+
+    public function findMarket ($id) {
+        return $this->find_market ($id);
+    }
+
     public function market_ids ($symbols) {
         return array_map (array ($this, 'market_id'), $symbols);
     }
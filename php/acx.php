@@ -178,8 +178,8 @@ class acx extends Exchange {
             $id = $ids[$i];
             $market = null;
             $symbol = $id;
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             } else {
                 $base = mb_substr ($id, 0, 3);
@@ -263,7 +263,7 @@ class acx extends Exchange {
             $symbol = $market['symbol'];
         } else {
             $marketId = $order['market'];
-            $symbol = $this->marketsById[$marketId]['symbol'];
+            $symbol = $this->find_market($marketId)['symbol'];
         }
         $timestamp = $this->parse8601 ($order['created_at']);
         $state = $order['state'];
@@ -305,7 +305,7 @@ class acx extends Exchange {
             $order['price'] = (string) $price;
         }
         $response = $this->privatePostOrders (array_merge ($order, $params));
-        $market = $this->marketsById[$response['market']];
+        $market = $this->find_market($response['market']);
         return $this->parse_order($response, $market);
     }
 
@@ -10,6 +10,31 @@ class binance extends Exchange {
             'name' => 'Binance',
             'countries' => 'JP', // Japan
             'rateLimit' => 500,
+            'ohlcvPageSize' => 500, // candles per OHLCV request
+            'rateLimits' => array (
+                'default' => array ( 'rateLimit' => 50 ), // 1200 request weight per minute
+                'orders' => array ( 'rateLimit' => 100 ), // 10 orders per second
+            ),
+            // request weights, 1 if not listed
+            'apiCosts' => array (
+                'private' => array (
+                    'get' => array (
+                        'allOrders' => 5,
+                        'account' => 5,
+                        'myTrades' => 5,
+                    ),
+                    'post' => array (
+                        'order' => array ( 'default' => 1, 'orders' => 1 ),
+                    ),
+                    'delete' => array (
+                        'order' => array ( 'default' => 1, 'orders' => 1 ),
+                    ),
+                ),
+            ),
+            'adaptiveRateLimit' => array (
+                'usedWeightHeader' => 'X-MBX-USED-WEIGHT',
+                'weightLimit' => 1200,
+            ),
             'hasCORS' => false,
             // obsolete metainfo interface
             'hasFetchBidsAsks' => true,
@@ -371,10 +396,10 @@ class binance extends Exchange {
     public function calculate_fee ($symbol, $type, $side, $amount, $price, $takerOrMaker = 'taker', $params = array ()) {
         $market = $this->markets[$symbol];
         $key = 'quote';
-        $rate = $market[$takerOrMaker];
-        $cost = floatval ($this->cost_to_precision($symbol, $amount * $rate));
+        $rate = $this->to_number($market[$takerOrMaker]);
+        $cost = $this->to_number($this->cost_to_precision($symbol, $this->to_number($amount) * $rate));
         if ($side === 'sell') {
-            $cost *= $price;
+            $cost *= $this->to_number($price);
         } else {
             $key = 'base';
         }
@@ -382,7 +407,7 @@ class binance extends Exchange {
             'type' => $takerOrMaker,
             'currency' => $market[$key],
             'rate' => $rate,
-            'cost' => floatval ($this->fee_to_precision($symbol, $cost)),
+            'cost' => $this->to_number($this->fee_to_precision($symbol, $cost)),
         );
     }
 
@@ -396,8 +421,8 @@ class binance extends Exchange {
             $asset = $balance['asset'];
             $currency = $this->common_currency_code($asset);
             $account = array (
-                'free' => floatval ($balance['free']),
-                'used' => floatval ($balance['locked']),
+                'free' => $this->safe_float($balance, 'free', 0.0),
+                'used' => $this->safe_float($balance, 'locked', 0.0),
                 'total' => 0.0,
             );
             $account['total'] = $this->sum ($account['free'], $account['used']);
@@ -413,7 +438,9 @@ class binance extends Exchange {
             'symbol' => $market['id'],
             'limit' => 100, // default = maximum = 100
         ), $params));
-        return $this->parse_order_book($orderbook);
+        $result = $this->parse_order_book($orderbook);
+        $result['nonce'] = $this->safe_integer($orderbook, 'lastUpdateId');
+        return $result;
     }
 
     public function parse_ticker ($ticker, $market = null) {
@@ -422,9 +449,7 @@ class binance extends Exchange {
             $timestamp = $this->milliseconds ();
         $symbol = $ticker['symbol'];
         if (!$market) {
-            if (is_array ($this->markets_by_id) && array_key_exists ($symbol, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$symbol];
-            }
+            $market = $this->find_market($symbol);
         }
         if ($market)
             $symbol = $market['symbol'];
@@ -521,9 +546,9 @@ class binance extends Exchange {
         $timestampField = (is_array ($trade) && array_key_exists ('T', $trade)) ? 'T' : 'time';
         $timestamp = $trade[$timestampField];
         $priceField = (is_array ($trade) && array_key_exists ('p', $trade)) ? 'p' : 'price';
-        $price = floatval ($trade[$priceField]);
+        $price = $this->safe_float($trade, $priceField);
         $amountField = (is_array ($trade) && array_key_exists ('q', $trade)) ? 'q' : 'qty';
-        $amount = floatval ($trade[$amountField]);
+        $amount = $this->safe_float($trade, $amountField);
         $idField = (is_array ($trade) && array_key_exists ('a', $trade)) ? 'a' : 'id';
         $id = (string) $trade[$idField];
         $side = null;
@@ -538,7 +563,7 @@ class binance extends Exchange {
         $fee = null;
         if (is_array ($trade) && array_key_exists ('commission', $trade)) {
             $fee = array (
-                'cost' => floatval ($trade['commission']),
+                'cost' => $this->safe_float($trade, 'commission'),
                 'currency' => $this->common_currency_code($trade['commissionAsset']),
             );
         }
@@ -597,8 +622,8 @@ class binance extends Exchange {
             $symbol = $market['symbol'];
         } else {
             $id = $order['symbol'];
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             }
         }
@@ -609,10 +634,10 @@ class binance extends Exchange {
             $timestamp = $order['transactTime'];
         else
             throw new ExchangeError ($this->id . ' malformed $order => ' . $this->json ($order));
-        $price = floatval ($order['price']);
-        $amount = floatval ($order['origQty']);
-        $filled = $this->safe_float($order, 'executedQty', 0.0);
-        $remaining = max ($amount - $filled, 0.0);
+        $price = $this->safe_float($order, 'price');
+        $amount = $this->safe_float($order, 'origQty');
+        $filled = $this->safe_float($order, 'executedQty', 0);
+        $remaining = max ($amount - $filled, $this->to_number(0));
         $result = array (
             'info' => $order,
             'id' => (string) $order['orderId'],
@@ -774,6 +799,22 @@ class binance extends Exchange {
         );
     }
 
+    public function request_cost ($path, $api = 'public', $method = 'GET', $params = array ()) {
+        $cost = parent::request_cost($path, $api, $method, $params);
+        if ($path === 'depth') {
+            $limit = $this->safe_integer($params, 'limit', 100);
+            if ($limit > 500) {
+                $cost['default'] = 10;
+            } else if ($limit > 100) {
+                $cost['default'] = 5;
+            }
+        } else if (($path === 'ticker/24hr') || ($path === 'openOrders')) {
+            if (!(is_array ($params) && array_key_exists ('symbol', $params)))
+                $cost['default'] = 40;
+        }
+        return $cost;
+    }
+
     public function sign ($path, $api = 'public', $method = 'GET', $params = array (), $headers = null, $body = null) {
         $url = $this->urls['api'][$api];
         $url .= '/' . $path;
@@ -11,6 +11,7 @@ class bitfinex extends Exchange {
             'countries' => 'VG',
             'version' => 'v1',
             'rateLimit' => 1500,
+            'ohlcvPageSize' => 1000, // candles per OHLCV request
             'hasCORS' => false,
             // old metainfo interface
             'hasFetchOrder' => true,
@@ -305,8 +306,8 @@ class bitfinex extends Exchange {
             $ticker = $tickers[$i];
             if (is_array ($ticker) && array_key_exists ('pair', $ticker)) {
                 $id = $ticker['pair'];
-                if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                    $market = $this->markets_by_id[$id];
+                $market = $this->find_market($id);
+                if ($market) {
                     $symbol = $market['symbol'];
                     $result[$symbol] = $this->parse_ticker($ticker, $market);
                 } else {
@@ -335,8 +336,8 @@ class bitfinex extends Exchange {
             $symbol = $market['symbol'];
         } else if (is_array ($ticker) && array_key_exists ('pair', $ticker)) {
             $id = $ticker['pair'];
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             } else {
                 throw new ExchangeError ($this->id . ' unrecognized $ticker $symbol ' . $id . ' ' . $this->json ($ticker));
@@ -455,9 +456,7 @@ class bitfinex extends Exchange {
         $symbol = null;
         if (!$market) {
             $exchange = strtoupper ($order['symbol']);
-            if (is_array ($this->markets_by_id) && array_key_exists ($exchange, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$exchange];
-            }
+            $market = $this->find_market($exchange);
         }
         if ($market)
             $symbol = $market['symbol'];
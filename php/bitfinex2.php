@@ -303,7 +303,7 @@ class bitfinex2 extends bitfinex {
         for ($i = 0; $i < count ($tickers); $i++) {
             $ticker = $tickers[$i];
             $id = $ticker[0];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
         }
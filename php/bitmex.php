@@ -12,6 +12,7 @@ class bitmex extends Exchange {
             'version' => 'v1',
             'userAgent' => null,
             'rateLimit' => 1500,
+            'ohlcvPageSize' => 500, // candles per OHLCV request
             'hasCORS' => false,
             'hasFetchOHLCV' => true,
             'hasWithdraw' => true,
@@ -302,7 +303,7 @@ class bitmex extends Exchange {
         $symbol = null;
         if (!$market) {
             if (is_array ($trade) && array_key_exists ('symbol', $trade))
-                $market = $this->markets_by_id[$trade['symbol']];
+                $market = $this->find_market($trade['symbol']);
         }
         if ($market)
             $symbol = $market['symbol'];
@@ -175,7 +175,7 @@ class bitso extends Exchange {
         $symbol = null;
         if (!$market) {
             if (is_array ($trade) && array_key_exists ('book', $trade))
-                $market = $this->markets_by_id[$trade['book']];
+                $market = $this->find_market($trade['book']);
         }
         if ($market)
             $symbol = $market['symbol'];
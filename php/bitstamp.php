@@ -242,9 +242,9 @@ class bitstamp extends Exchange {
         if (is_array ($trade) && array_key_exists ('order_id', $trade))
             $order = (string) $trade['order_id'];
         if (is_array ($trade) && array_key_exists ('currency_pair', $trade)) {
-            $marketId = $trade['currency_pair'];
-            if (is_array ($this->markets_by_id) && array_key_exists ($marketId, $this->markets_by_id))
-                $market = $this->markets_by_id[$marketId];
+            $found = $this->find_market($trade['currency_pair']);
+            if ($found)
+                $market = $found;
         }
         $price = $this->safe_float($trade, 'price');
         $price = $this->safe_float($trade, $market['symbolId'], $price);
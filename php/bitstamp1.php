@@ -120,8 +120,9 @@ class bitstamp1 extends Exchange {
         if (is_array ($trade) && array_key_exists ('order_id', $trade))
             $order = (string) $trade['order_id'];
         if (is_array ($trade) && array_key_exists ('currency_pair', $trade)) {
-            if (is_array ($this->markets_by_id) && array_key_exists ($trade['currency_pair'], $this->markets_by_id))
-                $market = $this->markets_by_id[$trade['currency_pair']];
+            $found = $this->find_market($trade['currency_pair']);
+            if ($found)
+                $market = $found;
         }
         return array (
             'id' => (string) $trade['tid'],
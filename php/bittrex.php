@@ -318,8 +318,8 @@ class bittrex extends Exchange {
             $id = $ticker['MarketName'];
             $market = null;
             $symbol = $id;
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             } else {
                 $symbol = $this->parse_symbol ($id);
@@ -486,9 +486,8 @@ class bittrex extends Exchange {
         if (!$market) {
             if (is_array ($order) && array_key_exists ('Exchange', $order)) {
                 $marketId = $order['Exchange'];
-                if (is_array ($this->markets_by_id) && array_key_exists ($marketId, $this->markets_by_id))
-                    $market = $this->markets_by_id[$marketId];
-                else
+                $market = $this->find_market($marketId);
+                if (!$market)
                     $symbol = $this->parse_symbol ($marketId);
             }
         }
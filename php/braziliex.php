@@ -223,7 +223,7 @@ class braziliex extends Exchange {
         $ids = is_array ($tickers) ? array_keys ($tickers) : array ();
         for ($i = 0; $i < count ($ids); $i++) {
             $id = $ids[$i];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $ticker = array (
                 'date' => $timestamp,
@@ -304,8 +304,7 @@ class braziliex extends Exchange {
         if (!$market) {
             $marketId = $this->safe_string($order, 'market');
             if ($marketId)
-                if (is_array ($this->markets_by_id) && array_key_exists ($marketId, $this->markets_by_id))
-                    $market = $this->markets_by_id[$marketId];
+                $market = $this->find_market($marketId);
         }
         if ($market)
             $symbol = $market['symbol'];
@@ -116,8 +116,8 @@ class btcturk extends Exchange {
             $ticker = $tickers[$i];
             $symbol = $ticker['pair'];
             $market = null;
-            if (is_array ($this->markets_by_id) && array_key_exists ($symbol, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$symbol];
+            $market = $this->find_market($symbol);
+            if ($market) {
                 $symbol = $market['symbol'];
             }
             $result[$symbol] = $this->parse_ticker($ticker, $market);
@@ -188,11 +188,9 @@ class bter extends Exchange {
             $quote = $this->common_currency_code($quote);
             $symbol = $base . '/' . $quote;
             $ticker = $tickers[$id];
-            $market = null;
-            if (is_array ($this->markets) && array_key_exists ($symbol, $this->markets))
-                $market = $this->markets[$symbol];
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id))
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if (!$market)
+                $market = $this->find_market($symbol);
             $result[$symbol] = $this->parse_ticker($ticker, $market);
         }
         return $result;
@@ -159,7 +159,7 @@ class bxinth extends Exchange {
         for ($i = 0; $i < count ($ids); $i++) {
             $id = $ids[$i];
             $ticker = $tickers[$id];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
         }
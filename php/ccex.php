@@ -164,8 +164,8 @@ class ccex extends Exchange {
             $uppercase = strtoupper ($id);
             $market = null;
             $symbol = null;
-            if (is_array ($this->markets_by_id) && array_key_exists ($uppercase, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$uppercase];
+            $market = $this->find_market($uppercase);
+            if ($market) {
                 $symbol = $market['symbol'];
             } else {
                 list ($base, $quote) = explode ('-', $uppercase);
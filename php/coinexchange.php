@@ -125,7 +125,7 @@ class coinexchange extends Exchange {
     public function parse_ticker ($ticker, $market = null) {
         if (!$market) {
             $marketId = $ticker['MarketID'];
-            $market = $this->marketsById[$marketId];
+            $market = $this->find_market($marketId);
         }
         $symbol = null;
         if ($market)
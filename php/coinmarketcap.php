@@ -187,8 +187,8 @@ class coinmarketcap extends Exchange {
             $id = $ticker['id'] . '/' . $currency;
             $symbol = $id;
             $market = null;
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             }
             $tickers[$symbol] = $this->parse_ticker($ticker, $market);
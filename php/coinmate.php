@@ -124,7 +124,7 @@ class coinmate extends Exchange {
 
     public function parse_trade ($trade, $market = null) {
         if (!$market)
-            $market = $this->markets_by_id[$trade['currencyPair']];
+            $market = $this->find_market($trade['currencyPair']);
         return array (
             'id' => $trade['transactionId'],
             'info' => $trade,
@@ -217,10 +217,9 @@ class cryptopia extends Exchange {
         for ($i = 0; $i < count ($tickers); $i++) {
             $ticker = $tickers[$i];
             $id = $ticker['TradePairId'];
-            $recognized = (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id));
-            if (!$recognized)
+            $market = $this->find_market($id);
+            if (!$market)
                 throw new ExchangeError ($this->id . ' fetchTickers() returned unrecognized pair $id ' . $id);
-            $market = $this->markets_by_id[$id];
             $symbol = $market['symbol'];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
         }
@@ -241,8 +240,7 @@ class cryptopia extends Exchange {
         $id = $this->safe_string($trade, 'TradeId');
         if (!$market) {
             if (is_array ($trade) && array_key_exists ('TradePairId', $trade))
-                if (is_array ($this->markets_by_id) && array_key_exists ($trade['TradePairId'], $this->markets_by_id))
-                    $market = $this->markets_by_id[$trade['TradePairId']];
+                $market = $this->find_market($trade['TradePairId']);
         }
         $symbol = null;
         $fee = null;
@@ -454,8 +452,8 @@ class cryptopia extends Exchange {
             $symbol = $market['symbol'];
         } else if (is_array ($order) && array_key_exists ('Market', $order)) {
             $id = $order['Market'];
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             }
         }
@@ -187,7 +187,7 @@ class exmo extends Exchange {
         $ids = is_array ($response) ? array_keys ($response) : array ();
         for ($i = 0; $i < count ($ids); $i++) {
             $id = $ids[$i];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $ticker = $response[$id];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
@@ -269,7 +269,7 @@ class gatecoin extends Exchange {
         for ($t = 0; $t < count ($tickers); $t++) {
             $ticker = $tickers[$t];
             $id = $ticker['currencyPair'];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
         }
@@ -296,7 +296,7 @@ class gatecoin extends Exchange {
         }
         $timestamp = intval ($trade['transactionTime']) * 1000;
         if (!$market)
-            $market = $this->markets_by_id[$trade['currencyPair']];
+            $market = $this->find_market($trade['currencyPair']);
         return array (
             'info' => $trade,
             'id' => (string) $trade['transactionId'],
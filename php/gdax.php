@@ -212,7 +212,9 @@ class gdax extends Exchange {
             'id' => $this->market_id($symbol),
             'level' => 2, // 1 best bidask, 2 aggregated, 3 full
         ), $params));
-        return $this->parse_order_book($orderbook);
+        $result = $this->parse_order_book($orderbook);
+        $result['nonce'] = $this->safe_integer($orderbook, 'sequence');
+        return $result;
     }
 
     public function fetch_ticker ($symbol, $params = array ()) {
@@ -336,8 +338,7 @@ class gdax extends Exchange {
         $timestamp = $this->parse8601 ($order['created_at']);
         $symbol = null;
         if (!$market) {
-            if (is_array ($this->markets_by_id) && array_key_exists ($order['product_id'], $this->markets_by_id))
-                $market = $this->markets_by_id[$order['product_id']];
+            $market = $this->find_market($order['product_id']);
         }
         $status = $this->parse_order_status($order['status']);
         $price = $this->safe_float($order, 'price');
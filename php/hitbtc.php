@@ -601,7 +601,7 @@ class hitbtc extends Exchange {
         $result = array ();
         for ($i = 0; $i < count ($ids); $i++) {
             $id = $ids[$i];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $ticker = $tickers[$id];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
@@ -708,7 +708,7 @@ class hitbtc extends Exchange {
             $timestamp = $this->safe_integer($order, 'timestamp');
         $symbol = null;
         if (!$market)
-            $market = $this->markets_by_id[$order['symbol']];
+            $market = $this->find_market($order['symbol']);
         $status = $this->safe_string($order, 'orderStatus');
         if ($status)
             $status = $this->parse_order_status($status);
@@ -724,7 +724,7 @@ class hitbtc2 extends hitbtc {
         for ($i = 0; $i < count ($tickers); $i++) {
             $ticker = $tickers[$i];
             $id = $ticker['symbol'];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
         }
@@ -749,8 +749,8 @@ class hitbtc2 extends hitbtc {
             $symbol = $market['symbol'];
         } else {
             $id = $trade['symbol'];
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             } else {
                 $symbol = $id;
@@ -838,7 +838,7 @@ class hitbtc2 extends hitbtc {
         if (is_array ($order) && array_key_exists ('updatedAt', $order))
             $updated = $this->parse8601 ($order['updatedAt']);
         if (!$market)
-            $market = $this->markets_by_id[$order['symbol']];
+            $market = $this->find_market($order['symbol']);
         $symbol = $market['symbol'];
         $amount = $this->safe_float($order, 'quantity');
         $filled = $this->safe_float($order, 'cumQuantity');
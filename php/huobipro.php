@@ -373,10 +373,7 @@ class huobipro extends Exchange {
         $symbol = null;
         if (!$market) {
             if (is_array ($order) && array_key_exists ('symbol', $order)) {
-                if (is_array ($this->markets_by_id) && array_key_exists ($order['symbol'], $this->markets_by_id)) {
-                    $marketId = $order['symbol'];
-                    $market = $this->markets_by_id[$marketId];
-                }
+                $market = $this->find_market($order['symbol']);
             }
         }
         if ($market)
@@ -11,6 +11,8 @@ class kraken extends Exchange {
             'countries' => 'US',
             'version' => '0',
             'rateLimit' => 3000,
+            'ohlcvPageSize' => 720, // candles per OHLCV request
+            'ohlcvLatestOnly' => true, // only the latest 720 candles, whatever the since
             'hasCORS' => false,
             // obsolete metainfo interface
             'hasFetchTickers' => true,
@@ -393,7 +395,7 @@ class kraken extends Exchange {
         $result = array ();
         for ($i = 0; $i < count ($ids); $i++) {
             $id = $ids[$i];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $ticker = $tickers[$id];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
@@ -549,13 +551,7 @@ class kraken extends Exchange {
     }
 
     public function find_market_by_altname_or_id ($id) {
-        $result = null;
-        if (is_array ($this->marketsByAltname) && array_key_exists ($id, $this->marketsByAltname)) {
-            $result = $this->marketsByAltname[$id];
-        } else if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-            $result = $this->markets_by_id[$id];
-        }
-        return $result;
+        return $this->find_market($id);
     }
 
     public function parse_order ($order, $market = null) {
@@ -28,6 +28,7 @@ class liqui extends Exchange {
                 'fetchOpenOrders' => true,
                 'fetchClosedOrders' => 'emulated',
                 'fetchTickers' => true,
+                'fetchOrderBooks' => true,
                 'fetchMyTrades' => true,
                 'withdraw' => true,
             ),
@@ -218,6 +219,38 @@ class liqui extends Exchange {
         return $result;
     }
 
+    public function fetch_order_books ($symbols = null, $params = array ()) {
+        $this->load_markets();
+        $ids = null;
+        if (!$symbols) {
+            $ids = implode ('-', $this->ids);
+            if (strlen ($ids) > 2083) {
+                $numIds = is_array ($this->ids) ? count ($this->ids) : 0;
+                throw new ExchangeError ($this->id . ' has ' . (string) $numIds . ' $symbols exceeding max URL length, you are required to specify a list of $symbols in the first argument to fetchOrderBooks');
+            }
+        } else {
+            $ids = $this->market_ids($symbols);
+            $ids = implode ('-', $ids);
+        }
+        $response = $this->publicGetDepthPair (array_merge (array (
+            'pair' => $ids,
+        ), $params));
+        $result = array ();
+        $ids = is_array ($response) ? array_keys ($response) : array ();
+        for ($i = 0; $i < count ($ids); $i++) {
+            $id = $ids[$i];
+            $symbol = $id;
+            $market = $this->find_market($id);
+            if ($market) {
+                $symbol = $market['symbol'];
+            }
+            $result[$symbol] = $this->parse_order_book($response[$id]);
+            $result[$symbol]['bids'] = $this->sort_by($result[$symbol]['bids'], 0, true);
+            $result[$symbol]['asks'] = $this->sort_by($result[$symbol]['asks'], 0);
+        }
+        return $result;
+    }
+
     public function parse_ticker ($ticker, $market = null) {
         $timestamp = $ticker['updated'] * 1000;
         $symbol = null;
@@ -269,7 +302,7 @@ class liqui extends Exchange {
         for ($k = 0; $k < count ($keys); $k++) {
             $id = $keys[$k];
             $ticker = $tickers[$id];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
         }
@@ -297,7 +330,7 @@ class liqui extends Exchange {
         $order = $this->safe_string($trade, $this->get_order_id_key ());
         if (is_array ($trade) && array_key_exists ('pair', $trade)) {
             $marketId = $trade['pair'];
-            $market = $this->markets_by_id[$marketId];
+            $market = $this->find_market($marketId);
         }
         $symbol = null;
         if ($market)
@@ -411,7 +444,7 @@ class liqui extends Exchange {
         $timestamp = intval ($order['timestamp_created']) * 1000;
         $symbol = null;
         if (!$market)
-            $market = $this->markets_by_id[$order['pair']];
+            $market = $this->find_market($order['pair']);
         if ($market)
             $symbol = $market['symbol'];
         $remaining = null;
@@ -240,8 +240,7 @@ class lykke extends Exchange {
         $symbol = null;
         if (!$market) {
             if (is_array ($order) && array_key_exists ('AssetPairId', $order))
-                if (is_array ($this->markets_by_id) && array_key_exists ($order['AssetPairId'], $this->markets_by_id))
-                    $market = $this->markets_by_id[$order['AssetPairId']];
+                $market = $this->find_market($order['AssetPairId']);
         }
         if ($market)
             $symbol = $market['symbol'];
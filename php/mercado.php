@@ -180,8 +180,7 @@ class mercado extends Exchange {
         $symbol = null;
         if (!$market) {
             if (is_array ($order) && array_key_exists ('coin_pair', $order))
-                if (is_array ($this->markets_by_id) && array_key_exists ($order['coin_pair'], $this->markets_by_id))
-                    $market = $this->markets_by_id[$order['coin_pair']];
+                $market = $this->find_market($order['coin_pair']);
         }
         if ($market)
             $symbol = $market['symbol'];
@@ -12,6 +12,7 @@ class okcoinusd extends Exchange {
             'hasCORS' => false,
             'version' => 'v1',
             'rateLimit' => 1000, // up to 3000 requests per 5 minutes ≈ 600 requests per minute ≈ 10 requests per second ≈ 100 ms
+            'ohlcvPageSize' => 1440, // candles per OHLCV request
             // obsolete metainfo interface
             'hasFetchOHLCV' => true,
             'hasFetchOrder' => true,
@@ -435,8 +436,7 @@ class okcoinusd extends Exchange {
         $symbol = null;
         if (!$market) {
             if (is_array ($order) && array_key_exists ('symbol', $order))
-                if (is_array ($this->markets_by_id) && array_key_exists ($order['symbol'], $this->markets_by_id))
-                    $market = $this->markets_by_id[$order['symbol']];
+                $market = $this->find_market($order['symbol']);
         }
         if ($market)
             $symbol = $market['symbol'];
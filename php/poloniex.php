@@ -288,7 +288,7 @@ class poloniex extends Exchange {
         $result = array ();
         for ($i = 0; $i < count ($ids); $i++) {
             $id = $ids[$i];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $ticker = $tickers[$id];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
@@ -359,9 +359,8 @@ class poloniex extends Exchange {
         $quote = null;
         if ((!$market) && (is_array ($trade) && array_key_exists ('currencyPair', $trade))) {
             $currencyPair = $trade['currencyPair'];
-            if (is_array ($this->markets_by_id) && array_key_exists ($currencyPair, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$currencyPair];
-            } else {
+            $market = $this->find_market($currencyPair);
+            if (!$market) {
                 $parts = explode ('_', $currencyPair);
                 $quote = $parts[0];
                 $base = $parts[1];
@@ -449,9 +448,7 @@ class poloniex extends Exchange {
                 $ids = is_array ($response) ? array_keys ($response) : array ();
                 for ($i = 0; $i < count ($ids); $i++) {
                     $id = $ids[$i];
-                    $market = null;
-                    if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id))
-                        $market = $this->markets_by_id[$id];
+                    $market = $this->find_market($id);
                     $trades = $this->parse_trades($response[$id], $market);
                     for ($j = 0; $j < count ($trades); $j++) {
                         $result[] = $trades[$j];
@@ -544,7 +541,7 @@ class poloniex extends Exchange {
             for ($i = 0; $i < count ($marketIds); $i++) {
                 $marketId = $marketIds[$i];
                 $orders = $response[$marketId];
-                $m = $this->markets_by_id[$marketId];
+                $m = $this->find_market($marketId);
                 $openOrders = $this->parse_open_orders ($orders, $m, $openOrders);
             }
         }
@@ -246,7 +246,7 @@ class qryptos extends Exchange {
     public function parse_order ($order) {
         $timestamp = $order['created_at'] * 1000;
         $marketId = (string) $order['product_id'];
-        $market = $this->marketsById[$marketId];
+        $market = $this->find_market($marketId);
         $status = null;
         if (is_array ($order) && array_key_exists ('status', $order)) {
             if ($order['status'] === 'live') {
@@ -140,8 +140,8 @@ class southxchange extends Exchange {
             $id = $ids[$i];
             $symbol = $id;
             $market = null;
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             }
             $ticker = $tickers[$id];
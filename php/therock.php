@@ -176,7 +176,7 @@ class therock extends Exchange {
         $result = array ();
         for ($i = 0; $i < count ($ids); $i++) {
             $id = $ids[$i];
-            $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
             $symbol = $market['symbol'];
             $ticker = $tickers[$id];
             $result[$symbol] = $this->parse_ticker($ticker, $market);
@@ -195,7 +195,7 @@ class therock extends Exchange {
 
     public function parse_trade ($trade, $market = null) {
         if (!$market)
-            $market = $this->markets_by_id[$trade['fund_id']];
+            $market = $this->find_market($trade['fund_id']);
         $timestamp = $this->parse8601 ($trade['date']);
         return array (
             'info' => $trade,
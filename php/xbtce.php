@@ -204,8 +204,8 @@ class xbtce extends Exchange {
             $id = $ids[$i];
             $market = null;
             $symbol = null;
-            if (is_array ($this->markets_by_id) && array_key_exists ($id, $this->markets_by_id)) {
-                $market = $this->markets_by_id[$id];
+            $market = $this->find_market($id);
+            if ($market) {
                 $symbol = $market['symbol'];
             } else {
                 $base = mb_substr ($id, 0, 3);
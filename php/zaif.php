@@ -176,7 +176,7 @@ class zaif extends Exchange {
         $id = $this->safe_string($trade, 'id');
         $id = $this->safe_string($trade, 'tid', $id);
         if (!$market)
-            $market = $this->markets_by_id[$trade['currency_pair']];
+            $market = $this->find_market($trade['currency_pair']);
         return array (
             'id' => (string) $id,
             'info' => $trade,
@@ -225,7 +225,7 @@ class zaif extends Exchange {
         $side = ($order['action'] == 'bid') ? 'buy' : 'sell';
         $timestamp = intval ($order['timestamp']) * 1000;
         if (!$market)
-            $market = $this->markets_by_id[$order['currency_pair']];
+            $market = $this->find_market($order['currency_pair']);
         $price = $order['price'];
         $amount = $order['amount'];
         return array (
@@ -174,8 +174,8 @@ class acx (Exchange):
             id = ids[i]
             market = None
             symbol = id
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
             else:
                 base = id[0:3]
@@ -251,7 +251,7 @@ class acx (Exchange):
             symbol = market['symbol']
         else:
             marketId = order['market']
-            symbol = self.marketsById[marketId]['symbol']
+            symbol = self.find_market(marketId)['symbol']
         timestamp = self.parse8601(order['created_at'])
         state = order['state']
         status = None
@@ -289,7 +289,7 @@ class acx (Exchange):
         if type == 'limit':
             order['price'] = str(price)
         response = self.privatePostOrders(self.extend(order, params))
-        market = self.marketsById[response['market']]
+        market = self.find_market(response['market'])
         return self.parse_order(response, market)
 
     def cancel_order(self, id, symbol=None, params={}):
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""Process-wide aiohttp session and connector registry keyed by event loop, a loop is dropped
+from it when its last session is released or closed"""
+
+# -----------------------------------------------------------------------------
+
+import ssl
+
+import aiohttp
+import certifi
+
+try:
+    import aiodns  # noqa: F401
+    has_aiodns = True
+except ImportError:
+    has_aiodns = False
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'ssl_context',
+    'connector_options',
+    'create_session',
+    'acquire_session',
+    'release_session',
+    'close_sessions',
+]
+
+# -----------------------------------------------------------------------------
+
+# loop → {name: {'session': ClientSession, 'owners': int}}
+registry = {}
+default_ssl_context = None
+forever = 365 * 86400  # seconds, aiohttp closes idle connections at once with a keep-alive timeout of 0
+
+# -----------------------------------------------------------------------------
+
+
+def ssl_context():
+    """One SSL context with the certifi CA bundle for the whole process"""
+    global default_ssl_context
+    if default_ssl_context is None:
+        default_ssl_context = ssl.create_default_context(cafile=certifi.where())
+    return default_ssl_context
+
+
+def connector_options(config={}):
+    """Translates the connectionPool settings of the sync Exchange into TCPConnector arguments. The
+    per-host pool size only caps the concurrent requests to a host with 'block', like the sync pool
+    does, aiohttp does not limit idle connections otherwise, and 0 keeps idle connections forever"""
+    keep_alive = config.get('keepAliveTimeout', 30000)
+    return {
+        'limit': config.get('maxConnections', 0),
+        'limit_per_host': config.get('maxSizePerHost', 0) if config.get('block') else 0,
+        'keepalive_timeout': keep_alive / 1000 if keep_alive else forever,
+        'ttl_dns_cache': config.get('dnsCacheTtl', 10000) / 1000,
+    }
+
+
+def create_session(loop, config={}):
+    resolver = aiohttp.AsyncResolver(loop=loop) if has_aiodns else None
+    connector = aiohttp.TCPConnector(
+        ssl_context=ssl_context(),
+        loop=loop,
+        resolver=resolver,
+        use_dns_cache=True,
+        **connector_options(config))
+    return aiohttp.ClientSession(loop=loop, connector=connector)
+
+
+def acquire_session(loop, name='default', config={}):
+    """Returns the session shared under this name on this loop and registers one more owner,
+    the connector settings of the first caller win"""
+    sessions = registry.setdefault(loop, {})
+    if (name not in sessions) or sessions[name]['session'].closed:
+        sessions[name] = {
+            'session': create_session(loop, config),
+            'owners': 0,
+        }
+    sessions[name]['owners'] += 1
+    return sessions[name]['session']
+
+
+def release_session(loop, name='default'):
+    """Unregisters an owner, returns the session if it has no owners left and must be closed"""
+    sessions = registry.get(loop, {})
+    if name in sessions:
+        sessions[name]['owners'] -= 1
+        if sessions[name]['owners'] <= 0:
+            session = sessions.pop(name)['session']
+            if not sessions:
+                del registry[loop]
+            return session
+    return None
+
+
+async def close_sessions(loop):
+    sessions = registry.pop(loop, {})
+    for name in sessions:
+        await sessions[name]['session'].close()
@@ -7,23 +7,31 @@ __version__ = '1.10.757'
 # -----------------------------------------------------------------------------
 
 import asyncio
+import collections
 import concurrent
 import socket
 import time
 import math
-import random
-import certifi
-import aiohttp
-import ssl
+import warnings
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async.base.throttle import throttle
+from ccxt.async.base.connection_pool import create_session
+from ccxt.async.base.connection_pool import acquire_session
+from ccxt.async.base.connection_pool import release_session
+from ccxt.async.base.transport import Transport
+from ccxt.async.base.transport import AiohttpTransport
+from ccxt.async.base.transport import transports
 
 # -----------------------------------------------------------------------------
 
+from ccxt.base.errors import BaseError
 from ccxt.base.errors import ExchangeError
+from ccxt.base.errors import NotSupported
+from ccxt.base.errors import DDoSProtection
 from ccxt.base.errors import RequestTimeout
+from ccxt.base.errors import ExchangeNotAvailable
 
 # -----------------------------------------------------------------------------
 
@@ -34,39 +42,149 @@ from ccxt.base.exchange import Exchange as BaseExchange
 __all__ = [
     'BaseExchange',
     'Exchange',
+    'TradeHistory',
 ]
 
 # -----------------------------------------------------------------------------
 
 
+class TradeHistory(object):
+    """The asynchronous iterator returned by Exchange.iter_trades() and iter_my_trades(), a page is
+    fetched when the trades of the previous one are consumed"""
+
+    def __init__(self, exchange, method, symbol, since=None, limit=None, params={}):
+        self.exchange = exchange
+        self.method = method
+        self.symbol = symbol
+        self.params = params
+        self.cursor = exchange.trade_history_cursor(since, limit)
+        self.trades = collections.deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.trades:
+            if self.cursor['done']:
+                raise StopAsyncIteration
+            method = getattr(self.exchange, self.method)
+            trades = await method(self.symbol, self.cursor['since'], self.exchange.tradesPageSize, self.params)
+            self.trades.extend(self.exchange.add_trade_history_page(self.cursor, trades))
+        return self.trades.popleft()
+
+# -----------------------------------------------------------------------------
+
+
 class Exchange(BaseExchange):
 
+    shared_session_name = None
+    transport = 'aiohttp'  # or 'httpx' for HTTP/2, or a Transport instance
+    http_transport = None
+    own_transport = False
+    hedgeRequests = {
+        'enabled': False,
+        'percentile': 95,     # a second request is sent if the first is slower than this share of recent ones
+        'delay': 1000,        # milliseconds, used until minSamples latencies are known
+        'minDelay': 50,
+        'minSamples': 20,
+        'maxSamples': 500,
+        'methods': ['GET'],
+    }
+    hedge_latencies = None
+    hedge_stats = None
+
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
             self.asyncio_loop = config['asyncio_loop']
         self.asyncio_loop = self.asyncio_loop or asyncio.get_event_loop()
-        if 'session' not in config:
-            # Create out SSL context object with our CA cert file
-            context = ssl.create_default_context(cafile=certifi.where())
-            # Pass this SSL context to aiohttp and create a TCPConnector
-            connector = aiohttp.TCPConnector(ssl_context=context, loop=self.asyncio_loop)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector)
         super(Exchange, self).__init__(config)
         self.init_rest_rate_limiter()
+        self.hedge_latencies = collections.deque(maxlen=self.hedgeRequests['maxSamples'])
+        self.hedge_stats = {
+            'requests': 0,
+            'hedged': 0,
+            'hedgeWon': 0,
+        }
+
+    def __del__(self):
+        # the loop can be running or closed here, the session can only be closed by close() or __aexit__
+        session = self.detach_session()
+        if (session and not session.closed) or (self.http_transport and self.own_transport):
+            warnings.warn(str(self.id) + ' requires to release all resources with an explicit call to the .close() coroutine', ResourceWarning)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def create_session(self):
+        if self.transport != 'aiohttp':
+            return None
+        config = self.omit(self.connectionPool, 'shared')
+        shared = self.connectionPool['shared']
+        if shared:
+            self.shared_session_name = shared if isinstance(shared, str) else 'default'
+            return acquire_session(self.asyncio_loop, self.shared_session_name, config)
+        self.own_session = True
+        return create_session(self.asyncio_loop, config)
+
+    def detach_session(self):
+        """Drops the reference to the session, returns it if nobody else uses it anymore"""
+        session = self.session
+        self.session = None
+        if self.shared_session_name:
+            return release_session(self.asyncio_loop, self.shared_session_name)
+        return session if self.own_session else None
+
+    def create_transport(self):
+        if isinstance(self.transport, Transport):
+            return self.transport
+        if self.transport == 'aiohttp':
+            return AiohttpTransport(self.session)
+        if self.transport in transports:
+            self.own_transport = True
+            return transports[self.transport](self.omit(self.connectionPool, 'shared'))
+        raise NotSupported(self.id + ' transport ' + str(self.transport) + ' is not supported')
+
+    async def close(self):
+        session = self.detach_session()
+        if session and not session.closed:
+            await session.close()
+        transport = self.http_transport
+        self.http_transport = None
+        if transport and self.own_transport:
+            await transport.close()
 
     def init_rest_rate_limiter(self):
-        self.throttle = throttle(self.extend({
-            'loop': self.asyncio_loop,
-        }, self.tokenBucket))
+        self.throttles = {}
+        for bucket, limits in self.rate_limit_buckets().items():
+            config = self.extend({'loop': self.asyncio_loop}, self.tokenBucket)
+            if (bucket != 'default') or (bucket in self.rateLimits):
+                config = self.extend(config, {'refillRate': 1.0 / limits['rateLimit']}, self.omit(limits, 'rateLimit'))
+            self.throttles[bucket] = throttle(config)
+        self.throttle = self.throttles['default']
+
+    def apply_rate_limit_factor(self):
+        factor = max(self.rateLimitFactor, self.rateLimitWeightFactor)
+        for bucket in self.throttles:
+            self.throttles[bucket].factor = factor
+
+    def pause_rate_limiter(self, milliseconds):
+        for bucket in self.throttles:
+            self.throttles[bucket].pause(milliseconds / 1000.0)
+
+    def request_priority(self, path, api='public', method='GET'):
+        """Lower values leave the rate limiter queue first, orders go before market data"""
+        return 1 if method == 'GET' else 0
 
     async def wait_for_token(self):
         while self.rateLimitTokens <= 1:
-            # if self.verbose:
-            #     print('Waiting for tokens: Exchange: {0}'.format(self.id))
             self.add_new_tokens()
-            seconds_delays = [0.001, 0.005, 0.022, 0.106, 0.5]
-            delay = random.choice(seconds_delays)
-            await asyncio.sleep(delay)
+            if self.rateLimitTokens <= 1:
+                # sleep once until add_new_tokens() is due to add at least two tokens
+                due = self.rateLimitUpdateTime + (2 * self.rateLimit) / (0.8 * 1000.0)
+                await asyncio.sleep(max(due - time.monotonic(), 0))
         self.rateLimitTokens -= 1
 
     def add_new_tokens(self):
@@ -80,15 +198,100 @@ class Exchange(BaseExchange):
             self.rateLimitUpdateTime = now
 
     async def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
-        """A better wrapper over request for deferred signing"""
+        """A better wrapper over request for deferred signing, retries idempotent requests on network errors"""
+        retryable = self.is_retryable(path, api, method)
+        started = self.milliseconds()
+        attempt = 0
+        while True:
+            try:
+                response = await self.fetch_signed(path, api, method, params, headers, body)
+            except (RequestTimeout, ExchangeNotAvailable, DDoSProtection):
+                delay = self.retry_delay(attempt, started) if retryable else None
+                if delay is None:
+                    self.record_retries(path, api, method, attempt, False)
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay / 1000.0)
+            else:
+                self.record_retries(path, api, method, attempt, True)
+                return response
+
+    async def fetch_signed(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        """A single attempt, signed anew so that every retry gets a fresh nonce"""
+        cost = self.request_cost(path, api, method, params)
+        priority = self.request_priority(path, api, method)
         if self.enableRateLimit:
-            await self.throttle()
+            await self.throttle_request(cost, priority)
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
-        return await self.fetch(request['url'], request['method'], request['headers'], request['body'])
+        try:
+            if self.hedges(request['method']):
+                # the hedged request counts against the same buckets with the same priority
+                return await self.fetch_hedged(request['url'], request['method'], request['headers'], request['body'], cost, priority)
+            return await self.fetch(request['url'], request['method'], request['headers'], request['body'])
+        except DDoSProtection:
+            self.slow_down_rate_limit()
+            raise
+
+    def throttle_request(self, cost, priority=0):
+        """Waits for every bucket the request counts against at once"""
+        return asyncio.gather(*[self.throttles[bucket](cost[bucket], priority) for bucket in cost if bucket in self.throttles])
 
     async def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
+        if self.hedges(method):
+            return await self.fetch_hedged(url, method, headers, body)
+        return await self.fetch_once(url, method, headers, body)
+
+    def hedges(self, method):
+        return self.hedgeRequests['enabled'] and (method in self.hedgeRequests['methods'])
+
+    def hedge_delay(self):
+        """Returns the configured percentile of recent latencies in milliseconds"""
+        config = self.hedgeRequests
+        if len(self.hedge_latencies) < config['minSamples']:
+            return config['delay']
+        latencies = sorted(self.hedge_latencies)
+        index = min(int(len(latencies) * config['percentile'] / 100.0), len(latencies) - 1)
+        return max(latencies[index], config['minDelay'])
+
+    async def fetch_hedged(self, url, method='GET', headers=None, body=None, cost=None, priority=None):
+        """Sends a second identical request if the first one has not answered within hedge_delay(),
+        returns whichever succeeds first and cancels the other one. The second request waits for the
+        rate limiter with the cost and priority of the first one, by default those of a GET"""
+        self.hedge_stats['requests'] += 1
+        first = asyncio.ensure_future(self.fetch_once(url, method, headers, body), loop=self.asyncio_loop)
+        done, pending = await asyncio.wait([first], timeout=self.hedge_delay() / 1000.0)
+        if done:
+            return first.result()
+        if self.enableRateLimit:
+            # the hedged request takes a token too, unless the first one answers while it waits for it
+            cost = {'default': self.tokenBucket['defaultCost']} if cost is None else cost
+            priority = self.request_priority(None, None, method) if priority is None else priority
+            token = asyncio.ensure_future(self.throttle_request(cost, priority), loop=self.asyncio_loop)
+            done, pending = await asyncio.wait([first, token], return_when=asyncio.FIRST_COMPLETED)
+            if first.done():
+                token.cancel()
+                return first.result()
+        self.hedge_stats['hedged'] += 1
+        attempts = [first, asyncio.ensure_future(self.fetch_once(url, method, headers, body), loop=self.asyncio_loop)]
+        pending = set(attempts)
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in attempts:
+                if (attempt in done) and (attempt.exception() is None):
+                    for other in pending:
+                        other.cancel()
+                    if attempt is not first:
+                        self.hedge_stats['hedgeWon'] += 1
+                    return attempt.result()
+                if (attempt in done) and (error is None):
+                    error = attempt.exception()
+        raise error
+
+    async def fetch_once(self, url, method='GET', headers=None, body=None):
+        started = time.monotonic()
         headers = headers or {}
         headers.update(self.headers)
         if self.userAgent:
@@ -103,20 +306,18 @@ class Exchange(BaseExchange):
         if self.verbose:
             print(url, method, url, "\nRequest:", headers, body)
         encoded_body = body.encode() if body else None
-        session_method = getattr(self.session, method.lower())
+        if self.http_transport is None:
+            self.http_transport = self.create_transport()
         try:
-            async with session_method(url, data=encoded_body, headers=headers, timeout=(self.timeout / 1000), proxy=self.aiohttp_proxy) as response:
-                text = await response.text()
-                self.handle_errors(response.status, text, url, method, None, text)
-                self.handle_rest_errors(None, response.status, text, url, method)
-        except socket.gaierror as e:
-            self.raise_error(ExchangeError, url, method, e, None)
-        except concurrent.futures._base.TimeoutError as e:
+            status, response_headers, text = await self.http_transport.request(method, url, headers, encoded_body, self.timeout / 1000, self.aiohttp_proxy)
+        except (socket.gaierror, ConnectionError) as e:
+            self.raise_error(ExchangeNotAvailable, url, method, e, None)
+        except (concurrent.futures._base.TimeoutError, asyncio.TimeoutError) as e:
             raise RequestTimeout(' '.join([self.id, method, url, 'request timeout']))
-        except aiohttp.client_exceptions.ServerDisconnectedError as e:
-            self.raise_error(ExchangeError, url, method, e, None)
-        except aiohttp.client_exceptions.ClientConnectorError as e:
-            self.raise_error(ExchangeError, url, method, e, None)
+        self.adapt_rate_limit(status, response_headers)
+        self.handle_errors(status, text, url, method, None, text)
+        self.handle_rest_errors(None, status, text, url, method)
+        self.hedge_latencies.append((time.monotonic() - started) * 1000)
         if self.verbose:
             print(method, url, "\nResponse:", headers, text)
         return self.handle_rest_response(text, url, method, headers, body)
@@ -127,11 +328,13 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.load_cached_markets():
+                return self.markets
         markets = await self.fetch_markets()
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = await self.fetch_currencies()
-        return self.set_markets(markets, currencies)
+        return self.set_cached_markets(markets, currencies)
 
     async def fetch_markets(self):
         return self.markets
@@ -140,6 +343,107 @@ class Exchange(BaseExchange):
         order = await self.fetch_order(id)
         return order['status']
 
+    async def fetch_tickers(self, symbols=None, params={}):
+        """Emulated with one fetch_ticker() per symbol, see fan_out(), only for an explicit list of symbols
+        since one request per market of the exchange can be thousands"""
+        if not self.has['fetchTicker'] or not symbols:
+            raise NotSupported(self.id + ' API does not allow to fetch all tickers at once with a single call to fetch_tickers() for now')
+        await self.load_markets()
+        return await self.fan_out('fetch_ticker', symbols, params)
+
+    async def fetch_order_books(self, symbols=None, params={}):
+        """Emulated with one fetch_order_book() per symbol, see fan_out()"""
+        await self.load_markets()
+        return await self.fan_out('fetch_order_book', symbols or self.symbols, params)
+
+    async def fan_out(self, method, symbols, params={}):
+        """Calls a single-symbol method for every symbol with at most fanOutConcurrency requests in flight,
+        returns a FanOutResult, see the synchronous version"""
+        semaphore = asyncio.Semaphore(self.fanOutConcurrency)
+
+        async def call(symbol):
+            async with semaphore:
+                try:
+                    return await getattr(self, method)(symbol, params), None
+                except BaseError as e:
+                    return None, e
+
+        responses = await asyncio.gather(*[call(symbol) for symbol in symbols])
+        return self.fan_out_results(symbols, responses)
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        if self.has['fetchOHLCV'] != 'emulated':
+            raise NotSupported(self.id + ' API does not allow to fetch OHLCV series for now')
+        return await self.fetch_ohlcv_from_trades(symbol, timeframe, since, limit, params)
+
+    async def fetch_ohlcv_from_trades(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        state = self.ohlcv_trades_state()
+        async for trade in self.iter_trades(symbol, since, None, params):
+            if not self.add_ohlcv_trade(state, trade, timeframe, since, limit):
+                break
+        return self.build_ohlcv(state['trades'], timeframe, since, limit)
+
+    async def fetch_resampled_ohlcv(self, symbol, timeframe='1h', since=None, limit=None, params={}):
+        source = self.resample_source_timeframe(timeframe)
+        if source == timeframe:
+            return await self.fetch_ohlcv(symbol, timeframe, since, limit, params)
+        if not limit:
+            ohlcvs = await self.fetch_ohlcv(symbol, source, since, None, params)
+            return self.resample_complete_ohlcv(ohlcvs, source, timeframe, since)
+        since, until = self.resample_range(timeframe, since, limit)
+        ohlcvs = await self.fetch_ohlcv_range(symbol, source, since, until, params)
+        return self.resample_complete_ohlcv(ohlcvs, source, timeframe, since, limit, until)
+
+    async def fetch_ohlcv_range(self, symbol, timeframe='1m', since=None, until=None, params={}, checkpoint=None):
+        """Fetches the pages concurrently within fanOutConcurrency and the rate limit if ohlcvPageSize is known,
+        one after another otherwise, see the synchronous version for the checkpoint. A page that returns fewer candles
+        than its window is continued sequentially, the ohlcvLatestOnly exchanges are paged sequentially from the start"""
+        checkpoint = self.ohlcv_range_checkpoint(checkpoint, since, until)
+        duration = self.parse_timeframe(timeframe) * 1000
+        if not self.ohlcvPageSize or self.ohlcvLatestOnly:
+            while checkpoint['since'] < checkpoint['until']:
+                start = checkpoint['since']
+                ohlcvs = await self.fetch_ohlcv(symbol, timeframe, start, self.ohlcvPageSize, params)
+                next_since = self.add_ohlcv_range_page(checkpoint, start, ohlcvs, duration)
+                if next_since is None:
+                    break
+                checkpoint['since'] = next_since
+            return self.merge_ohlcvs(checkpoint['ohlcvs'])
+        step = self.ohlcvPageSize * duration
+        starts = [start for start in range(int(checkpoint['since']), int(checkpoint['until']), step) if start not in checkpoint['done']]
+        semaphore = asyncio.Semaphore(self.fanOutConcurrency)
+
+        async def fetch_page(start):
+            end = min(start + step, checkpoint['until'])
+            ohlcvs = []
+            page_since = start
+            async with semaphore:
+                # a page that does not reach the end of its window is continued from its last candle,
+                # until the window is complete or a page brings nothing new (a gap in the history)
+                while page_since < end:
+                    page = await self.fetch_ohlcv(symbol, timeframe, page_since, self.ohlcvPageSize, params)
+                    page = [ohlcv for ohlcv in page if page_since <= ohlcv[0] < end]
+                    if not page:
+                        break
+                    ohlcvs.extend(page)
+                    page_since = max([ohlcv[0] for ohlcv in page]) + duration
+            checkpoint['ohlcvs'].extend(ohlcvs)
+            checkpoint['done'].append(start)
+
+        results = await asyncio.gather(*[fetch_page(start) for start in starts], return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+        checkpoint['since'] = checkpoint['until']
+        return self.merge_ohlcvs(checkpoint['ohlcvs'])
+
+    def iter_trades(self, symbol, since=None, limit=None, params={}):
+        """async for trade in exchange.iter_trades(symbol, since), see the synchronous version"""
+        return TradeHistory(self, 'fetch_trades', symbol, since, limit, params)
+
+    def iter_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        return TradeHistory(self, 'fetch_my_trades', symbol, since, limit, params)
+
     async def fetch_partial_balance(self, part, params={}):
         balance = await self.fetch_balance(params)
         return balance[part]
@@ -147,10 +451,13 @@ class Exchange(BaseExchange):
     async def fetch_l2_order_book(self, symbol, params={}):
         orderbook = await self.fetch_order_book(symbol, params)
         return self.extend(orderbook, {
-            'bids': self.sort_by(self.aggregate(orderbook['bids']), 0, True),
-            'asks': self.sort_by(self.aggregate(orderbook['asks']), 0),
+            'bids': self.aggregate_bids_asks(orderbook['bids'], True),
+            'asks': self.aggregate_bids_asks(orderbook['asks']),
         })
 
+    async def update_order_book(self, symbol, params={}):
+        return self.apply_order_book(symbol, await self.fetch_order_book(symbol, params))
+
     async def fetch_full_tickers(self, symbols=None, params={}):
         tickers = await self.fetch_tickers(symbols, params)
         return tickers
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+"""The OHLCVStore for the async exchanges, sync() awaits fetch_ohlcv_range()"""
+
+# -----------------------------------------------------------------------------
+
+from ccxt.base.ohlcv_store import OHLCVStore as BaseOHLCVStore
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'OHLCVStore',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class OHLCVStore(BaseOHLCVStore):
+
+    async def sync(self, exchange, symbol, timeframe, since, until=None):
+        """See the synchronous version"""
+        for start, end in self.missing(exchange.id, symbol, timeframe, since, self.closed(timeframe, until)):
+            checkpoint = {}
+            ohlcvs = await exchange.fetch_ohlcv_range(symbol, timeframe, start, end, {}, checkpoint)
+            self.store_range(exchange, symbol, timeframe, ohlcvs, start, end, checkpoint)
+        return self.read(exchange.id, symbol, timeframe, since, self.closed(timeframe, until))
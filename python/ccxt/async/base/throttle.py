@@ -1,51 +1,131 @@
 # -*- coding: utf-8 -*-
 
-from asyncio import Queue, sleep, Future, ensure_future, get_event_loop
+from asyncio import Future, sleep, ensure_future, get_event_loop
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
 from time import time
 
 __all__ = [
+    'Throttle',
     'throttle',
 ]
 
 
-def throttle(config=None):
+class Throttle(object):
+    """Token bucket scheduler, sleeps exactly until the next token is due
+    instead of polling, releases queued requests by priority (lower first)
+    and in FIFO order within the same priority"""
+
+    def __init__(self, config=None):
+        self.config = {
+            'loop': None,
+            'refillRate': 0.001,  # tokens per millisecond
+            'defaultCost': 1.000,
+            'capacity': 1.000,
+            'maxCapacity': 100,
+            'maxSamples': 1000,   # wait times kept for percentiles
+        }
+        self.config.update(config or {})
+        self.loop = self.config['loop'] or get_event_loop()
+        self.num_tokens = 0
+        self.last_timestamp = time()
+        self.queue = []
+        self.sequence = count()
+        self.running = False
+        self.factor = 1.0  # divides the refill rate, set by the adaptive rate limiter
+        self.paused_until = 0
+        self.waits = deque(maxlen=self.config['maxSamples'])
+        self.counters = {
+            'released': 0,
+            'cancelled': 0,
+            'totalWait': 0.0,
+            'maxWait': 0.0,
+        }
 
-    cfg = {
-        'lastTimestamp': time(),
-        'numTokens': 0,
-        'running': False,
-        'queue': Queue(),
-        'loop': get_event_loop(),
-        'delay': 0.001,
-        'refillRate': 0.001,
-        'defaultCost': 1.000,
-        'capacity': 1.000,
-        'maxCapacity': 100,
-    }
-
-    cfg.update(config)
-
-    async def run():
-        if not cfg['running']:
-            cfg['running'] = True
-            while not cfg['queue'].empty():
-                now = time()
-                elapsed = (now - cfg['lastTimestamp'])
-                cfg['lastTimestamp'] = now
-                cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
-                if cfg['numTokens'] > 0:
-                    if not cfg['queue'].empty():
-                        cost, future = cfg['queue'].get_nowait()
-                        cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
-                        if not future.done():
-                            future.set_result(None)
-                await sleep(cfg['delay'])
-            cfg['running'] = False
-
-    def throttle(cost=None):
-        future = Future()
-        cfg['queue'].put_nowait((cost, future))
-        ensure_future(run())
+    def __call__(self, cost=None, priority=0):
+        future = Future(loop=self.loop)
+        cost = self.config['defaultCost'] if cost is None else cost
+        heappush(self.queue, (priority, next(self.sequence), cost, future, time()))
+        if not self.running:
+            self.running = True
+            ensure_future(self.run(), loop=self.loop)
         return future
 
-    return throttle
+    def refill(self):
+        now = time()
+        elapsed = now - self.last_timestamp
+        self.last_timestamp = now
+        self.num_tokens = min(self.config['capacity'], self.num_tokens + elapsed * self.refill_rate())
+
+    def refill_rate(self):
+        return self.config['refillRate'] * 1000 / self.factor  # tokens per second
+
+    def pause(self, seconds):
+        """Holds the queue for the given number of seconds"""
+        self.paused_until = max(self.paused_until, time() + seconds)
+
+    async def run(self):
+        try:
+            while self.queue:
+                priority, sequence, cost, future, timestamp = self.queue[0]
+                if future.done():
+                    heappop(self.queue)
+                    self.counters['cancelled'] += 1
+                    continue
+                paused = self.paused_until - time()
+                if paused > 0:
+                    await sleep(paused)
+                    continue
+                self.refill()
+                if self.num_tokens > 0:
+                    heappop(self.queue)
+                    self.num_tokens -= cost
+                    self.record_wait((time() - timestamp) * 1000)
+                    future.set_result(None)
+                else:
+                    # one sleep until the bucket is positive again
+                    await sleep(-self.num_tokens / self.refill_rate())
+        finally:
+            self.running = False
+
+    def record_wait(self, wait):
+        self.waits.append(wait)
+        self.counters['released'] += 1
+        self.counters['totalWait'] += wait
+        self.counters['maxWait'] = max(self.counters['maxWait'], wait)
+
+    def cancel(self, priority=None):
+        """Cancels the queued requests (of one priority class if specified)"""
+        cancelled = 0
+        for entry in self.queue:
+            if (priority is None or entry[0] == priority) and not entry[3].done():
+                entry[3].cancel()
+                cancelled += 1
+        return cancelled
+
+    def queue_depth(self):
+        return len([entry for entry in self.queue if not entry[3].done()])
+
+    def percentile(self, p):
+        if not self.waits:
+            return 0.0
+        waits = sorted(self.waits)
+        return waits[min(int(len(waits) * p / 100.0), len(waits) - 1)]
+
+    def stats(self):
+        """Returns the queue depth and wait times in milliseconds"""
+        released = self.counters['released']
+        return {
+            'queueDepth': self.queue_depth(),
+            'released': released,
+            'cancelled': self.counters['cancelled'],
+            'averageWait': self.counters['totalWait'] / released if released else 0.0,
+            'maxWait': self.counters['maxWait'],
+            'p50Wait': self.percentile(50),
+            'p99Wait': self.percentile(99),
+        }
+
+
+def throttle(config=None):
+    return Throttle(config)
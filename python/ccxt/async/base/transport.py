@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""HTTP transports for the async Exchange, aiohttp by default, httpx for HTTP/2"""
+
+# -----------------------------------------------------------------------------
+
+import asyncio
+
+import aiohttp
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from ccxt.async.base.connection_pool import ssl_context
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Transport',
+    'AiohttpTransport',
+    'HttpxTransport',
+    'transports',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class Transport(object):
+    """Sends one request and returns (status, headers, text), raises asyncio.TimeoutError
+    on timeouts and ConnectionError when the request could not be delivered"""
+
+    async def request(self, method, url, headers=None, body=None, timeout=None, proxy=None):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class AiohttpTransport(Transport):
+    """HTTP/1.1 over the aiohttp session of the exchange, the session is closed by the exchange"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def request(self, method, url, headers=None, body=None, timeout=None, proxy=None):
+        session_method = getattr(self.session, method.lower())
+        try:
+            async with session_method(url, data=body, headers=headers, timeout=timeout, proxy=proxy) as response:
+                text = await response.text()
+                return response.status, response.headers, text
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError) as e:
+            raise ConnectionError(str(e)) from e
+
+
+class HttpxTransport(Transport):
+    """Multiplexes concurrent requests to the same host over one HTTP/2 connection,
+    requires httpx and h2, falls back to HTTP/1.1 if the server does not negotiate HTTP/2,
+    aiohttp_proxy is not supported"""
+
+    def __init__(self, config={}):
+        if httpx is None:
+            raise ImportError('HttpxTransport requires httpx, install it with: pip install httpx[http2]')
+        keep_alive = config.get('keepAliveTimeout', 30000)
+        limits = httpx.Limits(
+            max_connections=config.get('maxConnections') or None,
+            max_keepalive_connections=config.get('maxSizePerHost') or None,
+            keepalive_expiry=keep_alive / 1000 if keep_alive else None)  # 0 never expires like the sync pool
+        self.client = httpx.AsyncClient(
+            http1=config.get('http1', True),  # False talks HTTP/2 to plain http:// urls with prior knowledge
+            http2=config.get('http2', True),
+            verify=ssl_context(),
+            limits=limits)
+
+    async def request(self, method, url, headers=None, body=None, timeout=None, proxy=None):
+        try:
+            response = await self.client.request(method, url, content=body, headers=headers, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        return response.status_code, response.headers, response.text
+
+    async def close(self):
+        await self.client.aclose()
+
+
+transports = {
+    'aiohttp': AiohttpTransport,
+    'httpx': HttpxTransport,
+}
@@ -2,7 +2,6 @@
 
 from ccxt.async.base.exchange import Exchange
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import InsufficientFunds
 from ccxt.base.errors import InvalidOrder
@@ -18,6 +17,31 @@ class binance (Exchange):
             'name': 'Binance',
             'countries': 'JP',  # Japan
             'rateLimit': 500,
+            'ohlcvPageSize': 500,  # candles per OHLCV request
+            'rateLimits': {
+                'default': {'rateLimit': 50},  # 1200 request weight per minute
+                'orders': {'rateLimit': 100},  # 10 orders per second
+            },
+            # request weights, 1 if not listed
+            'apiCosts': {
+                'private': {
+                    'get': {
+                        'allOrders': 5,
+                        'account': 5,
+                        'myTrades': 5,
+                    },
+                    'post': {
+                        'order': {'default': 1, 'orders': 1},
+                    },
+                    'delete': {
+                        'order': {'default': 1, 'orders': 1},
+                    },
+                },
+            },
+            'adaptiveRateLimit': {
+                'usedWeightHeader': 'X-MBX-USED-WEIGHT',
+                'weightLimit': 1200,
+            },
             'hasCORS': False,
             # obsolete metainfo interface
             'hasFetchBidsAsks': True,
@@ -373,17 +397,17 @@ class binance (Exchange):
     def calculate_fee(self, symbol, type, side, amount, price, takerOrMaker='taker', params={}):
         market = self.markets[symbol]
         key = 'quote'
-        rate = market[takerOrMaker]
-        cost = float(self.cost_to_precision(symbol, amount * rate))
+        rate = self.to_number(market[takerOrMaker])
+        cost = self.to_number(self.cost_to_precision(symbol, self.to_number(amount) * rate))
         if side == 'sell':
-            cost *= price
+            cost *= self.to_number(price)
         else:
             key = 'base'
         return {
             'type': takerOrMaker,
             'currency': market[key],
             'rate': rate,
-            'cost': float(self.fee_to_precision(symbol, cost)),
+            'cost': self.to_number(self.fee_to_precision(symbol, cost)),
         }
 
     async def fetch_balance(self, params={}):
@@ -396,8 +420,8 @@ class binance (Exchange):
             asset = balance['asset']
             currency = self.common_currency_code(asset)
             account = {
-                'free': float(balance['free']),
-                'used': float(balance['locked']),
+                'free': self.safe_float(balance, 'free', 0.0),
+                'used': self.safe_float(balance, 'locked', 0.0),
                 'total': 0.0,
             }
             account['total'] = self.sum(account['free'], account['used'])
@@ -411,7 +435,9 @@ class binance (Exchange):
             'symbol': market['id'],
             'limit': 100,  # default = maximum = 100
         }, params))
-        return self.parse_order_book(orderbook)
+        result = self.parse_order_book(orderbook)
+        result['nonce'] = self.safe_integer(orderbook, 'lastUpdateId')
+        return result
 
     def parse_ticker(self, ticker, market=None):
         timestamp = self.safe_integer(ticker, 'closeTime')
@@ -419,8 +445,7 @@ class binance (Exchange):
             timestamp = self.milliseconds()
         symbol = ticker['symbol']
         if not market:
-            if symbol in self.markets_by_id:
-                market = self.markets_by_id[symbol]
+            market = self.find_market(symbol)
         if market:
             symbol = market['symbol']
         return {
@@ -507,9 +532,9 @@ class binance (Exchange):
         timestampField = 'T' if ('T' in list(trade.keys())) else 'time'
         timestamp = trade[timestampField]
         priceField = 'p' if ('p' in list(trade.keys())) else 'price'
-        price = float(trade[priceField])
+        price = self.safe_float(trade, priceField)
         amountField = 'q' if ('q' in list(trade.keys())) else 'qty'
-        amount = float(trade[amountField])
+        amount = self.safe_float(trade, amountField)
         idField = 'a' if ('a' in list(trade.keys())) else 'id'
         id = str(trade[idField])
         side = None
@@ -523,7 +548,7 @@ class binance (Exchange):
         fee = None
         if 'commission' in trade:
             fee = {
-                'cost': float(trade['commission']),
+                'cost': self.safe_float(trade, 'commission'),
                 'currency': self.common_currency_code(trade['commissionAsset']),
             }
         return {
@@ -577,8 +602,8 @@ class binance (Exchange):
             symbol = market['symbol']
         else:
             id = order['symbol']
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
         timestamp = None
         if 'time' in order:
@@ -587,10 +612,10 @@ class binance (Exchange):
             timestamp = order['transactTime']
         else:
             raise ExchangeError(self.id + ' malformed order: ' + self.json(order))
-        price = float(order['price'])
-        amount = float(order['origQty'])
-        filled = self.safe_float(order, 'executedQty', 0.0)
-        remaining = max(amount - filled, 0.0)
+        price = self.safe_float(order, 'price')
+        amount = self.safe_float(order, 'origQty')
+        filled = self.safe_float(order, 'executedQty', 0)
+        remaining = max(amount - filled, self.to_number(0))
         result = {
             'info': order,
             'id': str(order['orderId']),
@@ -735,6 +760,19 @@ class binance (Exchange):
             'id': self.safe_string(response, 'id'),
         }
 
+    def request_cost(self, path, api='public', method='GET', params={}):
+        cost = super(binance, self).request_cost(path, api, method, params)
+        if path == 'depth':
+            limit = self.safe_integer(params, 'limit', 100)
+            if limit > 500:
+                cost['default'] = 10
+            elif limit > 100:
+                cost['default'] = 5
+        elif (path == 'ticker/24hr') or (path == 'openOrders'):
+            if not('symbol' in list(params.keys())):
+                cost['default'] = 40
+        return cost
+
     def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
         url = self.urls['api'][api]
         url += '/' + path
@@ -784,7 +822,7 @@ class binance (Exchange):
             if body.find('Order does not exist') >= 0:
                 raise OrderNotFound(self.id + ' ' + body)
         if body[0] == '{':
-            response = json.loads(body)
+            response = self.parse_json(body)
             error = self.safe_value(response, 'code')
             if error is not None:
                 if error == -2010:
@@ -4,7 +4,6 @@ from ccxt.async.base.exchange import Exchange
 import base64
 import hashlib
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import NotSupported
 from ccxt.base.errors import AuthenticationError
@@ -23,6 +22,7 @@ class bitfinex (Exchange):
             'countries': 'VG',
             'version': 'v1',
             'rateLimit': 1500,
+            'ohlcvPageSize': 1000,  # candles per OHLCV request
             'hasCORS': False,
             # old metainfo interface
             'hasFetchOrder': True,
@@ -309,8 +309,8 @@ class bitfinex (Exchange):
             ticker = tickers[i]
             if 'pair' in ticker:
                 id = ticker['pair']
-                if id in self.markets_by_id:
-                    market = self.markets_by_id[id]
+                market = self.find_market(id)
+                if market:
                     symbol = market['symbol']
                     result[symbol] = self.parse_ticker(ticker, market)
                 else:
@@ -334,8 +334,8 @@ class bitfinex (Exchange):
             symbol = market['symbol']
         elif 'pair' in ticker:
             id = ticker['pair']
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
             else:
                 raise ExchangeError(self.id + ' unrecognized ticker symbol ' + id + ' ' + self.json(ticker))
@@ -442,8 +442,7 @@ class bitfinex (Exchange):
         symbol = None
         if not market:
             exchange = order['symbol'].upper()
-            if exchange in self.markets_by_id:
-                market = self.markets_by_id[exchange]
+            market = self.find_market(exchange)
         if market:
             symbol = market['symbol']
         orderType = order['type']
@@ -634,7 +633,7 @@ class bitfinex (Exchange):
             return
         if code >= 400:
             if body[0] == '{':
-                response = json.loads(body)
+                response = self.parse_json(body)
                 if 'message' in response:
                     message = response['message']
                     error = self.id + ' ' + message
@@ -176,8 +176,8 @@ class bithumb (Exchange):
             id = ids[i]
             symbol = id
             market = None
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
             ticker = tickers[id]
             ticker['date'] = timestamp
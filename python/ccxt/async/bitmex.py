@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from ccxt.async.base.exchange import Exchange
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import DDoSProtection
 
@@ -16,6 +15,7 @@ class bitmex (Exchange):
             'version': 'v1',
             'userAgent': None,
             'rateLimit': 1500,
+            'ohlcvPageSize': 500,  # candles per OHLCV request
             'hasCORS': False,
             'hasFetchOHLCV': True,
             'hasWithdraw': True,
@@ -293,7 +293,7 @@ class bitmex (Exchange):
         symbol = None
         if not market:
             if 'symbol' in trade:
-                market = self.markets_by_id[trade['symbol']]
+                market = self.find_market(trade['symbol'])
         if market:
             symbol = market['symbol']
         return {
@@ -367,7 +367,7 @@ class bitmex (Exchange):
         if code >= 400:
             if body:
                 if body[0] == '{':
-                    response = json.loads(body)
+                    response = self.parse_json(body)
                     if 'error' in response:
                         if 'message' in response['error']:
                             # stub code, need proper handling
@@ -170,7 +170,7 @@ class bitso (Exchange):
         symbol = None
         if not market:
             if 'book' in trade:
-                market = self.markets_by_id[trade['book']]
+                market = self.find_market(trade['book'])
         if market:
             symbol = market['symbol']
         return {
@@ -119,8 +119,9 @@ class bitstamp1 (Exchange):
         if 'order_id' in trade:
             order = str(trade['order_id'])
         if 'currency_pair' in trade:
-            if trade['currency_pair'] in self.markets_by_id:
-                market = self.markets_by_id[trade['currency_pair']]
+            found = self.find_market(trade['currency_pair'])
+            if found:
+                market = found
         return {
             'id': str(trade['tid']),
             'info': trade,
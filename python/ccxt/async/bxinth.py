@@ -153,7 +153,7 @@ class bxinth (Exchange):
         for i in range(0, len(ids)):
             id = ids[i]
             ticker = tickers[id]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             result[symbol] = self.parse_ticker(ticker, market)
         return result
@@ -159,8 +159,8 @@ class ccex (Exchange):
             uppercase = id.upper()
             market = None
             symbol = None
-            if uppercase in self.markets_by_id:
-                market = self.markets_by_id[uppercase]
+            market = self.find_market(uppercase)
+            if market:
                 symbol = market['symbol']
             else:
                 base, quote = uppercase.split('-')
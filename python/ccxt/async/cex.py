@@ -2,7 +2,6 @@
 
 from ccxt.async.base.exchange import Exchange
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import InvalidOrder
 
@@ -199,7 +198,7 @@ class cex (Exchange):
         }
         response = await self.publicGetOhlcvHdYyyymmddPair(self.extend(request, params))
         key = 'data' + self.timeframes[timeframe]
-        ohlcvs = json.loads(response[key])
+        ohlcvs = self.parse_json(response[key])
         return self.parse_ohlcvs(ohlcvs, market, timeframe, since, limit)
 
     def parse_ticker(self, ticker, market=None):
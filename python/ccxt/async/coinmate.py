@@ -120,7 +120,7 @@ class coinmate (Exchange):
 
     def parse_trade(self, trade, market=None):
         if not market:
-            market = self.markets_by_id[trade['currencyPair']]
+            market = self.find_market(trade['currencyPair'])
         return {
             'id': trade['transactionId'],
             'info': trade,
@@ -183,7 +183,7 @@ class exmo (Exchange):
         ids = list(response.keys())
         for i in range(0, len(ids)):
             id = ids[i]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             ticker = response[id]
             result[symbol] = self.parse_ticker(ticker, market)
@@ -266,7 +266,7 @@ class gatecoin (Exchange):
         for t in range(0, len(tickers)):
             ticker = tickers[t]
             id = ticker['currencyPair']
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             result[symbol] = self.parse_ticker(ticker, market)
         return result
@@ -289,7 +289,7 @@ class gatecoin (Exchange):
             order = trade[orderId]
         timestamp = int(trade['transactionTime']) * 1000
         if not market:
-            market = self.markets_by_id[trade['currencyPair']]
+            market = self.find_market(trade['currencyPair'])
         return {
             'info': trade,
             'id': str(trade['transactionId']),
@@ -347,9 +347,7 @@ class huobipro (Exchange):
         symbol = None
         if not market:
             if 'symbol' in order:
-                if order['symbol'] in self.markets_by_id:
-                    marketId = order['symbol']
-                    market = self.markets_by_id[marketId]
+                market = self.find_market(order['symbol'])
         if market:
             symbol = market['symbol']
         timestamp = order['created-at']
@@ -4,7 +4,6 @@ from ccxt.async.base.exchange import Exchange
 import base64
 import hashlib
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import AuthenticationError
 from ccxt.base.errors import InvalidNonce
@@ -576,7 +575,7 @@ class kucoin (Exchange):
 
     def handle_errors(self, code, reason, url, method, headers, body):
         if body and(body[0] == '{'):
-            response = json.loads(body)
+            response = self.parse_json(body)
             self.throw_exception_on_error(response)
 
     async def request(self, path, api='public', method='GET', params={}, headers=None, body=None):
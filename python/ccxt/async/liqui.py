@@ -11,7 +11,6 @@ except NameError:
 
 
 import hashlib
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import AuthenticationError
 from ccxt.base.errors import InsufficientFunds
@@ -46,6 +45,7 @@ class liqui (Exchange):
                 'fetchOpenOrders': True,
                 'fetchClosedOrders': 'emulated',
                 'fetchTickers': True,
+                'fetchOrderBooks': True,
                 'fetchMyTrades': True,
                 'withdraw': True,
             },
@@ -225,6 +225,33 @@ class liqui (Exchange):
         result['asks'] = self.sort_by(result['asks'], 0)
         return result
 
+    async def fetch_order_books(self, symbols=None, params={}):
+        await self.load_markets()
+        ids = None
+        if not symbols:
+            ids = '-'.join(self.ids)
+            if len(ids) > 2083:
+                numIds = len(self.ids)
+                raise ExchangeError(self.id + ' has ' + str(numIds) + ' symbols exceeding max URL length, you are required to specify a list of symbols in the first argument to fetchOrderBooks')
+        else:
+            ids = self.market_ids(symbols)
+            ids = '-'.join(ids)
+        response = await self.publicGetDepthPair(self.extend({
+            'pair': ids,
+        }, params))
+        result = {}
+        ids = list(response.keys())
+        for i in range(0, len(ids)):
+            id = ids[i]
+            symbol = id
+            market = self.find_market(id)
+            if market:
+                symbol = market['symbol']
+            result[symbol] = self.parse_order_book(response[id])
+            result[symbol]['bids'] = self.sort_by(result[symbol]['bids'], 0, True)
+            result[symbol]['asks'] = self.sort_by(result[symbol]['asks'], 0)
+        return result
+
     def parse_ticker(self, ticker, market=None):
         timestamp = ticker['updated'] * 1000
         symbol = None
@@ -273,7 +300,7 @@ class liqui (Exchange):
         for k in range(0, len(keys)):
             id = keys[k]
             ticker = tickers[id]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             result[symbol] = self.parse_ticker(ticker, market)
         return result
@@ -298,7 +325,7 @@ class liqui (Exchange):
         order = self.safe_string(trade, self.get_order_id_key())
         if 'pair' in trade:
             marketId = trade['pair']
-            market = self.markets_by_id[marketId]
+            market = self.find_market(marketId)
         symbol = None
         if market:
             symbol = market['symbol']
@@ -404,7 +431,7 @@ class liqui (Exchange):
         timestamp = int(order['timestamp_created']) * 1000
         symbol = None
         if not market:
-            market = self.markets_by_id[order['pair']]
+            market = self.find_market(order['pair'])
         if market:
             symbol = market['symbol']
         remaining = None
@@ -588,7 +615,7 @@ class liqui (Exchange):
         if (not isinstance(body, basestring)) or len((body) < 2):
             return  # fallback to default error handler
         if (body[0] == '{') or (body[0] == '['):
-            response = json.loads(body)
+            response = self.parse_json(body)
             if 'success' in response:
                 #
                 # 1 - Liqui only returns the integer 'success' key from their private API
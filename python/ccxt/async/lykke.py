@@ -230,8 +230,7 @@ class lykke (Exchange):
         symbol = None
         if not market:
             if 'AssetPairId' in order:
-                if order['AssetPairId'] in self.markets_by_id:
-                    market = self.markets_by_id[order['AssetPairId']]
+                market = self.find_market(order['AssetPairId'])
         if market:
             symbol = market['symbol']
         timestamp = None
@@ -173,8 +173,7 @@ class mercado (Exchange):
         symbol = None
         if not market:
             if 'coin_pair' in order:
-                if order['coin_pair'] in self.markets_by_id:
-                    market = self.markets_by_id[order['coin_pair']]
+                market = self.find_market(order['coin_pair'])
         if market:
             symbol = market['symbol']
         timestamp = None
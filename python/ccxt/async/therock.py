@@ -172,7 +172,7 @@ class therock (Exchange):
         result = {}
         for i in range(0, len(ids)):
             id = ids[i]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             ticker = tickers[id]
             result[symbol] = self.parse_ticker(ticker, market)
@@ -188,7 +188,7 @@ class therock (Exchange):
 
     def parse_trade(self, trade, market=None):
         if not market:
-            market = self.markets_by_id[trade['fund_id']]
+            market = self.find_market(trade['fund_id'])
         timestamp = self.parse8601(trade['date'])
         return {
             'info': trade,
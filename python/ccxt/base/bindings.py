@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Class-level camelCase aliases and hybrid methods of an exchange"""
+
+# -----------------------------------------------------------------------------
+
+import functools
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Alias',
+    'HybridMethod',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class Alias(object):
+    """Reads another attribute of the instance, assigning the alias on an instance shadows it"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return getattr(owner, self.name)
+        return getattr(instance, self.name)
+
+
+class HybridMethod(object):
+    """A method that can be called on the class as well, then it gets None for self, so the helpers
+    that used to be static, like Exchange.safe_float(dictionary, key), keep working unbound"""
+
+    def __init__(self, function):
+        self.function = function
+        functools.update_wrapper(self, function)
+
+    def __get__(self, instance, owner):
+        return functools.partial(self.function, instance)
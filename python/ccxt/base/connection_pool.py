@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""HTTP connection pooling for the synchronous Exchange"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'PoolingAdapter',
+    'create_session',
+    'shared_session',
+    'close_shared_sessions',
+]
+
+# -----------------------------------------------------------------------------
+
+# sessions shared between several exchange instances, keyed by a pool name
+shared_sessions = {}
+shared_sessions_lock = threading.Lock()
+
+# -----------------------------------------------------------------------------
+
+
+class PoolingAdapter(HTTPAdapter):
+    """A requests adapter that keeps per-host connection usage stats
+    and drops pooled connections that have been idle for too long"""
+
+    def __init__(self, config={}):
+        self.pool_config = {
+            'maxHosts': 10,           # number of per-host pools kept alive
+            'maxSizePerHost': 10,     # connections kept open per host
+            'maxConnections': 0,      # total in-flight requests, 0 = unlimited
+            'keepAliveTimeout': 30000,  # milliseconds, 0 = never expire
+            'block': False,           # wait for a free connection instead of opening a new one
+        }
+        self.pool_config.update(config)
+        self.stats = {}
+        self.last_used = {}
+        self.stats_lock = threading.Lock()
+        self.semaphore = None
+        if self.pool_config['maxConnections']:
+            self.semaphore = threading.BoundedSemaphore(self.pool_config['maxConnections'])
+        super(PoolingAdapter, self).__init__(
+            pool_connections=self.pool_config['maxHosts'],
+            pool_maxsize=self.pool_config['maxSizePerHost'],
+            pool_block=self.pool_config['block'])
+
+    def host_stats(self, host):
+        if host not in self.stats:
+            self.stats[host] = {
+                'requests': 0,
+                'connections': 0,
+                'reused': 0,
+                'handshakes': 0,
+                'expired': 0,
+            }
+        return self.stats[host]
+
+    def expire_idle_connections(self, pool, host, now):
+        timeout = self.pool_config['keepAliveTimeout']
+        last_used = self.last_used.get(host)
+        if timeout and last_used and (now - last_used) * 1000 > timeout:
+            # drop the whole host pool, a fresh one is created on demand
+            pools = self.poolmanager.pools
+            for key in pools.keys():
+                if pools.get(key) is pool:
+                    del pools[key]
+                    self.host_stats(host)['expired'] += 1
+                    return True
+        return False
+
+    def connection_pool(self, request, kwargs):
+        proxies = kwargs.get('proxies')
+        if hasattr(self, 'get_connection_with_tls_context'):  # requests >= 2.32
+            return self.get_connection_with_tls_context(request, kwargs.get('verify', True), proxies, kwargs.get('cert'))
+        return self.get_connection(request.url, proxies)
+
+    def send(self, request, **kwargs):
+        pool = self.connection_pool(request, kwargs)
+        host = pool.scheme + '://' + pool.host + ':' + str(pool.port)
+        with self.stats_lock:
+            if self.expire_idle_connections(pool, host, time.time()):
+                pool = self.connection_pool(request, kwargs)
+            num_connections = pool.num_connections
+        if self.semaphore:
+            self.semaphore.acquire()
+        try:
+            return super(PoolingAdapter, self).send(request, **kwargs)
+        finally:
+            if self.semaphore:
+                self.semaphore.release()
+            with self.stats_lock:
+                stats = self.host_stats(host)
+                new_connections = max(pool.num_connections - num_connections, 0)
+                stats['requests'] += 1
+                stats['connections'] += new_connections
+                if new_connections:
+                    if pool.scheme == 'https':
+                        stats['handshakes'] += new_connections
+                else:
+                    stats['reused'] += 1
+                self.last_used[host] = time.time()
+
+    def get_stats(self):
+        with self.stats_lock:
+            return dict((host, dict(stats)) for host, stats in self.stats.items())
+
+
+# -----------------------------------------------------------------------------
+
+
+def create_session(config={}):
+    session = Session()
+    adapter = PoolingAdapter(config)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def shared_session(name, config={}):
+    """Returns a session that is shared by every caller using the same name,
+    the pool settings of the first caller win"""
+    with shared_sessions_lock:
+        if name not in shared_sessions:
+            shared_sessions[name] = create_session(config)
+        return shared_sessions[name]
+
+
+def close_shared_sessions():
+    with shared_sessions_lock:
+        for name in list(shared_sessions.keys()):
+            shared_sessions.pop(name).close()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""JSON decoders for response bodies, the standard library and optional faster backends"""
+
+# -----------------------------------------------------------------------------
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'decoders',
+    'get_decoder',
+]
+
+# -----------------------------------------------------------------------------
+
+decoders = {
+    'json': json.loads,
+}
+
+if orjson:
+    decoders['orjson'] = orjson.loads
+
+if ujson:
+    decoders['ujson'] = ujson.loads
+
+# -----------------------------------------------------------------------------
+
+
+def get_decoder(name=None):
+    """Returns the decoder by name, by default orjson if it is installed and the standard library otherwise,
+    ujson is only used on request because it does not round floats as precisely"""
+    if name is None:
+        return decoders.get('orjson', json.loads)
+    if name not in decoders:
+        raise ImportError('JSON decoder ' + name + ' is not installed')
+    return decoders[name]
@@ -8,6 +8,7 @@ __version__ = '1.10.757'
 
 # -----------------------------------------------------------------------------
 
+from ccxt.base.errors import BaseError
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import NotSupported
 from ccxt.base.errors import AuthenticationError
@@ -17,6 +18,23 @@ from ccxt.base.errors import ExchangeNotAvailable
 
 # -----------------------------------------------------------------------------
 
+from ccxt.base.connection_pool import create_session
+from ccxt.base.connection_pool import shared_session
+from ccxt.base.throttle import Throttle
+from ccxt.base.decoder import get_decoder
+from ccxt.base.bindings import Alias
+from ccxt.base.bindings import HybridMethod
+from ccxt.base.market_cache import market_cache
+from ccxt.base.fan_out import FanOutResult
+from ccxt.base.order_book import BookSide
+from ccxt.base.order_book import LocalOrderBook
+from ccxt.base.ohlcv import OHLCVArray
+from ccxt.base.ohlcv import timeframe_end
+from ccxt.base.ohlcv import timeframe_start
+from ccxt.base.numeric_string import NumericString
+
+# -----------------------------------------------------------------------------
+
 __all__ = [
     'Exchange',
 ]
@@ -28,6 +46,7 @@ import base64
 import calendar
 import collections
 import datetime
+import email.utils
 import functools
 import gzip
 import hashlib
@@ -35,8 +54,9 @@ import hmac
 import io
 import json
 import math
+from multiprocessing.pool import ThreadPool
+import random
 import re
-from requests import Session
 from requests.utils import default_user_agent
 from requests.exceptions import ConnectionError, HTTPError, Timeout, TooManyRedirects, RequestException
 # import socket
@@ -44,6 +64,7 @@ from requests.exceptions import ConnectionError, HTTPError, Timeout, TooManyRedi
 # import sys
 import time
 import uuid
+import warnings
 import zlib
 from decimal import Decimal
 
@@ -76,10 +97,56 @@ class Exchange(object):
     # rate limiter settings
     enableRateLimit = False
     rateLimit = 2000  # milliseconds = seconds * 1000
+    rateLimits = {}   # additional buckets, {'orders': {'rateLimit': 100}}, 'default' overrides rateLimit
+    adaptiveRateLimit = {
+        'enabled': False,
+        'decrease': 0.5,           # the rate is multiplied by this on DDoSProtection
+        'increase': 0.05,          # share of the configured rate added back per successful request
+        'minRate': 0.05,           # never slower than this share of the configured rate
+        'usedWeightHeader': None,  # response header with the weight used in the current window
+        'weightLimit': None,       # weight allowed per window
+        'weightThreshold': 0.8,    # slow down proportionally once this share of the window is used
+    }
+    rateLimitFactor = 1.0        # multiplies the delays of all buckets, > 1 is slower
+    rateLimitWeightFactor = 1.0
+    retryPolicy = {
+        'maxAttempts': 1,     # attempts per request including the first one, 1 disables retries
+        'deadline': 30000,    # milliseconds since the first attempt after which no retry is started
+        'backoff': 250,       # milliseconds, the upper bound of the jittered delay doubles every attempt
+        'maxBackoff': 5000,
+        'methods': ['GET'],   # only idempotent requests are retried
+    }
+    retry_stats = None
+    ohlcvPageSize = None   # max candles per fetch_ohlcv() request, None if unknown, see fetch_ohlcv_range()
+    ohlcvLatestOnly = False  # fetch_ohlcv() returns the latest ohlcvPageSize candles only, whatever the since
+    tradesPageSize = None  # the limit of the fetch_trades() requests of iter_trades(), None for the default of the exchange
+    fanOutConcurrency = 5  # requests in flight in fetch_order_books() and the emulated fetch_tickers()
+    jsonDecoder = None       # 'json', 'orjson', 'ujson' or a function, None picks the fastest one installed, float numbers only
+    last_parsed_json = None  # (body, decoded) of the last body decoded by parse_json()
+    number = float           # float, Decimal or str, the type of the numbers returned by the parsers
+    timeframes = None
+    ohlcvArrays = False      # parse_ohlcvs() returns an OHLCVArray with a column per field instead of lists
+    orderBookArrays = False  # parse the bids and asks into array-backed BookSide sequences, float numbers only, they are not lists, see BookSide
+    sharedMetadata = False   # share describe() data and loaded markets read-only between the instances of the class
+    marketCache = {
+        'enabled': False,  # reuse the markets loaded by other instances of the exchange, implied by sharedMetadata
+        'ttl': 3600000,    # milliseconds after which the markets are fetched again, None = never expire
+        'path': None,      # directory of the JSON snapshots reused by other processes
+    }
     timeout = 20000   # milliseconds = seconds * 1000
     asyncio_loop = None
     aiohttp_proxy = None
     session = None  # Session ()
+    own_session = False
+    connectionPool = {
+        'maxHosts': 10,             # number of per-host pools kept alive
+        'maxSizePerHost': 10,       # connections kept open per host
+        'maxConnections': 0,        # total in-flight requests, 0 = unlimited
+        'keepAliveTimeout': 30000,  # milliseconds, 0 = never expire
+        'block': False,             # wait for a free pooled connection instead of opening a new one
+        'dnsCacheTtl': 10000,       # milliseconds, async only
+        'shared': False,            # True or a pool name to share the session with other instances
+    }
     userAgent = None
     userAgents = {
         'chrome': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/62.0.3202.94 Safari/537.36',
@@ -95,6 +162,7 @@ class Exchange(object):
     currencies = None
     tickers = None
     api = None
+    apiCosts = {}  # {api: {method: {path: cost}}} where the cost is a weight or {bucket: weight}, 1 by default
     parseJsonResponse = True
     exceptions = {}
     headers = {}
@@ -113,6 +181,16 @@ class Exchange(object):
     twofa = False
     marketsById = None
     markets_by_id = None
+    markets_by_base = None
+    markets_by_quote = None
+    markets_by_base_id = None
+    markets_by_quote_id = None
+    markets_by_raw_id = None  # every form of a market id the exchange returns, see find_market()
+    marketIdSeparators = ['', '_', '-', '/']
+    markets_changes = None  # {'added': [], 'removed': [], 'changed': []} symbols of the last set_markets()
+    markets_raw = None      # shallow copies of the markets by symbol as passed to set_markets(), before the defaults are applied
+    markets_defaults = None
+    markets_attributes = ['markets', 'markets_by_id', 'symbols', 'ids', 'currencies', 'markets_by_base', 'markets_by_quote', 'markets_by_base_id', 'markets_by_quote_id', 'markets_by_raw_id', 'markets_raw', 'markets_defaults']
 
     hasPublicAPI = True
     hasPrivateAPI = True
@@ -154,19 +232,21 @@ class Exchange(object):
         'fetchDepositAddress': False,
         'fetchMarkets': True,
         'fetchMyTrades': False,
-        'fetchOHLCV': False,
+        'fetchOHLCV': False,  # 'emulated' builds the candles from the trades, see fetch_ohlcv_from_trades()
         'fetchOpenOrders': False,
         'fetchOrder': False,
         'fetchOrderBook': True,
+        'fetchOrderBooks': 'emulated',  # one fetch_order_book() per symbol, see fan_out()
         'fetchOrders': False,
         'fetchTicker': True,
-        'fetchTickers': False,
+        'fetchTickers': 'emulated',  # one fetch_ticker() per symbol, for an explicit list of symbols only
         'fetchTrades': True,
         'withdraw': False,
     }
 
     substituteCommonCurrencyCodes = True
     lastRestRequestTimestamp = 0
+    rate_limiter = None
     lastRestPollTimestamp = 0
     restRequestQueue = None
     restPollerLoopIsRunning = False
@@ -175,6 +255,7 @@ class Exchange(object):
     rateLimitUpdateTime = 0
     last_http_response = None
     last_json_response = None
+    last_response_headers = None
 
     def __init__(self, config={}):
 
@@ -185,26 +266,35 @@ class Exchange(object):
 
         self.userAgent = default_user_agent()
 
-        settings = self.deep_extend(self.describe(), config)
+        cls = type(self)
+        if config.get('sharedMetadata', self.sharedMetadata):
+            # the describe() data is merged once per class, instances only copy what the config overrides
+            if '_shared_settings' not in cls.__dict__:
+                cls._shared_settings = self.merge_settings(self.describe())
+            for key, value in cls._shared_settings.items():
+                setattr(self, key, value)
+            settings = self.merge_settings(config)
+        else:
+            settings = self.merge_settings(self.deep_extend(self.describe(), config))
 
         for key in settings:
-            if hasattr(self, key) and isinstance(getattr(self, key), dict):
-                setattr(self, key, self.deep_extend(getattr(self, key), settings[key]))
-            else:
-                setattr(self, key, settings[key])
+            setattr(self, key, settings[key])
+
+        if '_aliases_defined' not in cls.__dict__:
+            cls.define_aliases()
 
         if self.api:
-            self.define_rest_api(self.api, 'request')
+            if 'api' in config:
+                self.define_rest_api(self.api, 'request')
+            elif '_rest_api_defined' not in cls.__dict__:
+                cls.define_class_rest_api(self.api, 'request')
 
         if self.markets:
-            self.set_markets(self.markets)
-
-        # format camel case
-        for attr in dir(self):
-            if attr[0] != '_'and attr[-1] != '_' and '_' in attr:
-                conv = attr.split('_')
-                camel_case = conv[0] + ''.join(i[0].upper() + i[1:] for i in conv[1:])
-                setattr(self, camel_case, getattr(self, attr))
+            # the markets passed in the config take precedence over the cached ones and stay out of the cache
+            if 'markets' in config:
+                self.set_markets(self.markets)
+            elif not (self.sharedMetadata and self.load_cached_markets()):
+                self.set_cached_markets(self.markets)
 
         self.tokenBucket = self.extend({
             'refillRate': 1.0 / self.rateLimit,
@@ -214,19 +304,50 @@ class Exchange(object):
             'maxCapacity': 1000,
         }, getattr(self, 'tokenBucket') if hasattr(self, 'tokenBucket') else {})
 
-        self.session = self.session if self.session else Session()
+        self.rate_limiter = Throttle()
+        self.retry_stats = {}
+        self.orderbooks = {}
+
+        if not self.session:
+            self.session = self.create_session()
+
+    def merge_settings(self, settings):
+        """Deep-extends the dict attributes with the settings, returns the new values by attribute"""
+        result = {}
+        for key in settings:
+            if hasattr(self, key) and isinstance(getattr(self, key), dict):
+                result[key] = self.deep_extend(getattr(self, key), settings[key])
+            else:
+                result[key] = settings[key]
+        return result
 
     def __del__(self):
-        if self.session:
+        if self.session and self.own_session:
             self.session.close()
 
+    def create_session(self):
+        config = self.omit(self.connectionPool, 'shared')
+        shared = self.connectionPool['shared']
+        if shared:
+            return shared_session(shared if isinstance(shared, basestring) else 'default', config)
+        self.own_session = True
+        return create_session(config)
+
+    def connection_pool_stats(self):
+        """Returns per-host counters of requests, new and reused connections and TLS handshakes"""
+        adapter = self.session.get_adapter('https://') if self.session else None
+        return adapter.get_stats() if hasattr(adapter, 'get_stats') else {}
+
     def describe(self):
         return {}
 
-    def define_rest_api(self, api, method_name, options={}):
+    @staticmethod
+    def rest_api_methods(api, options={}):
+        """Returns the camelcase and underscore method names of every endpoint"""
         delimiters = re.compile('[^a-zA-Z0-9]')
-        for api_type, methods in api.items():
-            for http_method, urls in methods.items():
+        methods = []
+        for api_type, http_methods in api.items():
+            for http_method, urls in http_methods.items():
                 for url in urls:
                     url = url.strip()
                     split_path = delimiters.split(url)
@@ -253,9 +374,51 @@ class Exchange(object):
                         if 'underscore' in options['suffixes']:
                             underscore += options['suffixes']['underscore']
 
-                    partial = functools.partial(getattr(self, method_name), url, api_type, uppercase_method)
-                    setattr(self, camelcase, partial)
-                    setattr(self, underscore, partial)
+                    methods.append((url, api_type, uppercase_method, camelcase, underscore))
+        return methods
+
+    def define_rest_api(self, api, method_name, options={}):
+        """Binds the endpoints of an api passed in the config to this instance only"""
+        for url, api_type, uppercase_method, camelcase, underscore in self.rest_api_methods(api, options):
+            partial = functools.partial(getattr(self, method_name), url, api_type, uppercase_method)
+            setattr(self, camelcase, partial)
+            setattr(self, underscore, partial)
+
+    @classmethod
+    def define_class_rest_api(cls, api, method_name, options={}):
+        """Computes the endpoint table once per class, instances bind the methods on access in __getattr__"""
+        cls._rest_api_methods = {}
+        for url, api_type, uppercase_method, camelcase, underscore in cls.rest_api_methods(api, options):
+            endpoint = (method_name, url, api_type, uppercase_method)
+            cls._rest_api_methods[camelcase] = endpoint
+            cls._rest_api_methods[underscore] = endpoint
+            cls._rest_api_methods[Exchange.camelcase(underscore)] = endpoint
+        cls._rest_api_defined = True
+
+    def __getattr__(self, name):
+        # only called for attributes that are not found otherwise, the table of the class itself
+        # is used so that a subclass does not inherit the endpoints of its parent
+        endpoint = type(self).__dict__.get('_rest_api_methods', {}).get(name)
+        if endpoint is None:
+            raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+        method_name, url, api_type, uppercase_method = endpoint
+        return functools.partial(getattr(self, method_name), url, api_type, uppercase_method)
+
+    def __dir__(self):
+        return sorted(set(dir(type(self))) | set(self.__dict__.keys()) | set(type(self).__dict__.get('_rest_api_methods', {}).keys()))
+
+    @staticmethod
+    def camelcase(underscore):
+        conv = underscore.split('_')
+        return conv[0] + ''.join(i[0].upper() + i[1:] for i in conv[1:] if len(i))
+
+    @classmethod
+    def define_aliases(cls):
+        """Defines a camelCase alias for every underscore attribute of the class once"""
+        for attr in dir(cls):
+            if attr[0] != '_' and attr[-1] != '_' and '_' in attr:
+                setattr(cls, Exchange.camelcase(attr), Alias(attr))
+        cls._aliases_defined = True
 
     def raise_error(self, exception_type, url, method='GET', error=None, details=None):
         details = details if details else ''
@@ -281,20 +444,130 @@ class Exchange(object):
         else:
             raise exception_type(' '.join([self.id, method, url, details]))
 
-    def throttle(self):
-        now = float(self.milliseconds())
-        elapsed = now - self.lastRestRequestTimestamp
-        if elapsed < self.rateLimit:
-            delay = self.rateLimit - elapsed
-            time.sleep(delay / 1000.0)
+    def rate_limit_buckets(self):
+        factor = max(self.rateLimitFactor, self.rateLimitWeightFactor)
+        buckets = {'default': {'rateLimit': self.rateLimit * factor}}
+        for bucket in self.rateLimits:
+            limits = self.rateLimits[bucket]
+            limits = limits if isinstance(limits, dict) else {'rateLimit': limits}
+            buckets[bucket] = self.extend(limits, {'rateLimit': limits['rateLimit'] * factor})
+        return buckets
+
+    def apply_rate_limit_factor(self):
+        # the sync rate limiter reads the factor from rate_limit_buckets() on every call
+        pass
+
+    def pause_rate_limiter(self, milliseconds):
+        self.rate_limiter.pause(Exchange.milliseconds() + milliseconds)
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Returns the Retry-After header (seconds or an HTTP date) in milliseconds"""
+        try:
+            return max(float(value) * 1000, 0)
+        except ValueError:
+            parsed = email.utils.parsedate_tz(value)
+            if parsed is None:
+                return None
+            return max(email.utils.mktime_tz(parsed) * 1000 - Exchange.milliseconds(), 0)
+
+    def adapt_rate_limit(self, http_status_code, headers):
+        """Speeds the rate limiter back up additively after successful responses,
+        honours Retry-After and slows down as the used request weight approaches the limit"""
+        self.last_response_headers = headers
+        config = self.adaptiveRateLimit
+        if not config['enabled'] or headers is None:
+            return
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            delay = self.parse_retry_after(retry_after)
+            if delay:
+                self.pause_rate_limiter(delay)
+        if http_status_code < 400:
+            rate = 1.0 / self.rateLimitFactor + config['increase']
+            self.rateLimitFactor = max(1.0 / rate, 1.0)
+        header = config['usedWeightHeader']
+        if header and config['weightLimit'] and (headers.get(header) is not None):
+            used = float(headers.get(header)) / config['weightLimit']
+            self.rateLimitWeightFactor = max(used / config['weightThreshold'], 1.0)
+        self.apply_rate_limit_factor()
+
+    def slow_down_rate_limit(self):
+        """Multiplicative decrease of the request rate on DDoSProtection"""
+        config = self.adaptiveRateLimit
+        if config['enabled']:
+            self.rateLimitFactor = min(self.rateLimitFactor / config['decrease'], 1.0 / config['minRate'])
+            self.apply_rate_limit_factor()
+
+    def request_cost(self, path, api='public', method='GET', params={}):
+        """Returns the weight of a request in every rate limit bucket it counts against,
+        as declared in apiCosts, override for params-dependent weights"""
+        cost = self.apiCosts.get(api, {}).get(method.lower(), {}).get(path)
+        if cost is None:
+            return {'default': self.tokenBucket['defaultCost']}
+        if isinstance(cost, dict):
+            return self.extend(cost)
+        return {'default': cost}
+
+    def throttle(self, cost=None, blocking=True):
+        """Waits for the rate limiter and returns the delay in milliseconds,
+        with blocking=False it returns the delay without waiting or reserving a slot"""
+        return self.rate_limiter.acquire(cost or {'default': 1}, self.rate_limit_buckets(), blocking)
+
+    def is_retryable(self, path, api='public', method='GET'):
+        """Override to exclude or include specific endpoints, requests that change state must never be retried"""
+        return method.upper() in self.retryPolicy['methods']
+
+    def retry_delay(self, attempt, started):
+        """Returns the jittered backoff in milliseconds before the next attempt or None if the policy is exhausted"""
+        policy = self.retryPolicy
+        if attempt + 1 >= policy['maxAttempts']:
+            return None
+        delay = random.uniform(0, min(policy['maxBackoff'], policy['backoff'] * 2 ** attempt))
+        if Exchange.milliseconds() - started + delay > policy['deadline']:
+            return None
+        return delay
+
+    def record_retries(self, path, api, method, retries, succeeded):
+        endpoint = ' '.join([api, method.upper(), path])
+        stats = self.retry_stats.setdefault(endpoint, {'requests': 0, 'retries': 0, 'recovered': 0, 'failed': 0})
+        stats['requests'] += 1
+        stats['retries'] += retries
+        if retries and succeeded:
+            stats['recovered'] += 1
+        elif not succeeded:
+            stats['failed'] += 1
 
     def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
-        """A better wrapper over request for deferred signing"""
+        """A better wrapper over request for deferred signing, retries idempotent requests on network errors"""
+        retryable = self.is_retryable(path, api, method)
+        started = Exchange.milliseconds()
+        attempt = 0
+        while True:
+            try:
+                response = self.fetch_signed(path, api, method, params, headers, body)
+            except (RequestTimeout, ExchangeNotAvailable, DDoSProtection):
+                delay = self.retry_delay(attempt, started) if retryable else None
+                if delay is None:
+                    self.record_retries(path, api, method, attempt, False)
+                    raise
+                attempt += 1
+                time.sleep(delay / 1000.0)
+            else:
+                self.record_retries(path, api, method, attempt, True)
+                return response
+
+    def fetch_signed(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        """A single attempt, signed anew so that every retry gets a fresh nonce"""
         if self.enableRateLimit:
-            self.throttle()
+            self.throttle(self.request_cost(path, api, method, params))
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
-        return self.fetch(request['url'], request['method'], request['headers'], request['body'])
+        try:
+            return self.fetch(request['url'], request['method'], request['headers'], request['body'])
+        except DDoSProtection:
+            self.slow_down_rate_limit()
+            raise
 
     def request(self, path, api='public', method='GET', params={}, headers=None, body=None):
         return self.fetch2(path, api, method, params, headers, body)
@@ -346,6 +619,7 @@ class Exchange(object):
                 timeout=int(self.timeout / 1000),
                 proxies=self.proxies
             )
+            self.adapt_rate_limit(response.status_code, response.headers)
             self.last_http_response = response.text
             response.raise_for_status()
 
@@ -393,10 +667,25 @@ class Exchange(object):
         if error:
             self.raise_error(error, url, method, exception if exception else http_status_code, response)
 
+    def parse_json(self, body):
+        """Decodes a response body with jsonDecoder, decoding the same body again returns
+        the previous result, so handle_errors() and handle_rest_response() parse it only once"""
+        parsed = self.last_parsed_json
+        if parsed and (parsed[0] is body):
+            return parsed[1]
+        if self.number is float:
+            decoder = self.jsonDecoder if callable(self.jsonDecoder) else get_decoder(self.jsonDecoder)
+            result = decoder(body)
+        else:
+            # fractional numbers go from the body to the number type without a float in between
+            result = json.loads(body, parse_float=NumericString if self.number is str else self.number)
+        self.last_parsed_json = (body, result)
+        return result
+
     def handle_rest_response(self, response, url, method='GET', headers=None, body=None):
         try:
             if self.parseJsonResponse:
-                self.last_json_response = json.loads(response) if len(response) > 1 else None
+                self.last_json_response = self.parse_json(response) if len(response) > 1 else None
                 return self.last_json_response
             else:
                 return response
@@ -418,9 +707,28 @@ class Exchange(object):
                 raise ExchangeError(' '.join([self.id, method, url, response, str(e)]))
             raise
 
-    @staticmethod
-    def safe_float(dictionary, key, default_value=None):
-        return float(dictionary[key]) if key is not None and (key in dictionary) and dictionary[key] else default_value
+    @HybridMethod
+    def safe_float(self, dictionary, key, default_value=None):
+        """Returns the value in the number type of the instance, the default too, called on the
+        class as Exchange.safe_float(dictionary, key) it returns a float like before"""
+        if key is not None and (key in dictionary) and dictionary[key]:
+            value = dictionary[key]
+        elif default_value is None:
+            return None
+        else:
+            value = default_value
+        return float(value) if self is None else self.to_number(value)
+
+    def to_number(self, value):
+        """Converts a number or a numeric string to the number type of the instance, with str
+        the values stay as the exchange sent them, as NumericString that computes like Decimal"""
+        if self.number is float:
+            return float(value)
+        if self.number is str:
+            return value if isinstance(value, NumericString) else NumericString(str(value))
+        if isinstance(value, self.number):
+            return value
+        return self.number(str(value))
 
     @staticmethod
     def safe_string(dictionary, key, default_value=None):
@@ -597,7 +905,7 @@ class Exchange(object):
 
     @staticmethod
     def sum(*args):
-        return sum([arg for arg in args if isinstance(arg, (float, int))])
+        return sum([arg for arg in args if isinstance(arg, (float, int, Decimal, NumericString))])
 
     @staticmethod
     def ordered(array):
@@ -731,7 +1039,13 @@ class Exchange(object):
 
     @staticmethod
     def json(input):
-        return json.dumps(input, separators=(',', ':'))
+        return json.dumps(input, separators=(',', ':'), default=Exchange.json_default)
+
+    @staticmethod
+    def json_default(value):
+        if isinstance(value, BookSide):
+            return value.to_list()
+        raise TypeError(repr(value) + ' is not JSON serializable')
 
     @staticmethod
     def encode(string):
@@ -796,44 +1110,174 @@ class Exchange(object):
         return ('{:.' + str(self.markets[symbol]['precision']['price']) + 'f}').format(float(fee))
 
     def set_markets(self, markets, currencies=None):
+        """Applies the defaults to the markets and indexes them, a reload only extends the markets
+        that were added or changed since the previous call and reports them in markets_changes"""
         values = list(markets.values()) if type(markets) is dict else markets
-        for i in range(0, len(values)):
-            values[i] = self.extend(
+        defaults = [self.fees['trading'], self.precision, self.limits]
+        old_markets = self.markets or {}
+        known = self.markets_raw or {}
+        # every market is extended again when the defaults have changed
+        previous = known if (self.markets_defaults == defaults) else {}
+        raw = {}
+        result = {}
+        changes = {'added': [], 'removed': [], 'changed': []}
+        for market in values:
+            symbol = market.get('symbol')
+            raw[symbol] = dict(market)
+            if (symbol in previous) and (symbol in old_markets) and (previous[symbol] == market):
+                result[symbol] = old_markets[symbol]
+                continue
+            changes['changed' if symbol in known else 'added'].append(symbol)
+            result[symbol] = self.extend(
                 self.fees['trading'],
                 {'precision': self.precision, 'limits': self.limits},
-                values[i]
+                market
             )
-        self.markets = self.index_by(values, 'symbol')
+        changes['removed'] = [symbol for symbol in known if symbol not in result]
+        self.markets_raw = raw
+        self.markets_defaults = [self.extend(default) for default in defaults]
+        self.markets_changes = changes
+        if self.markets_by_id is not None and not (changes['added'] or changes['removed'] or changes['changed']):
+            self.markets = result
+            if currencies:
+                self.currencies = self.deep_extend(currencies, self.currencies)
+            return self.markets
+        values = list(result.values())
+        self.markets = result
         self.markets_by_id = self.index_by(values, 'id')
         self.marketsById = self.markets_by_id
-        self.symbols = sorted(list(self.markets.keys()))
-        self.ids = sorted(list(self.markets_by_id.keys()))
+        self.symbols = sorted(result.keys())
+        self.ids = sorted(self.markets_by_id.keys())
+        self.markets_by_base = self.group_by(values, 'base')
+        self.markets_by_quote = self.group_by(values, 'quote')
+        self.markets_by_base_id = self.group_by(values, 'baseId')
+        self.markets_by_quote_id = self.group_by(values, 'quoteId')
+        self.markets_by_raw_id = self.index_by_raw_id(values)
         if currencies:
             self.currencies = self.deep_extend(currencies, self.currencies)
+        elif previous:
+            # the currencies of the other markets are merged already and the merged values take precedence
+            touched = [result[symbol] for symbol in changes['added'] + changes['changed']]
+            self.currencies = self.extend(self.currencies)
+            for code, currency in self.markets_currencies(touched).items():
+                self.currencies[code] = self.deep_extend(currency, self.currencies.get(code, {}))
         else:
-            base_currencies = [{
-                'id': market['baseId'] if 'baseId' in market else market['base'],
-                'code': market['base'],
-            } for market in values if 'base' in market]
-            quote_currencies = [{
-                'id': market['quoteId'] if 'quoteId' in market else market['quote'],
-                'code': market['quote'],
-            } for market in values if 'quote' in market]
-            currencies = self.sort_by(base_currencies + quote_currencies, 'code')
-            self.currencies = self.deep_extend(self.index_by(currencies, 'code'), self.currencies)
+            self.currencies = self.deep_extend(self.markets_currencies(values), self.currencies)
+        if changes['removed']:
+            # the currencies that only the removed markets had are dropped, unless they were passed in
+            used = self.markets_currencies(values)
+            removed = self.markets_currencies([old_markets[symbol] for symbol in changes['removed'] if symbol in old_markets])
+            dropped = [code for code in removed if (code not in used) and (code not in (currencies or {}))]
+            self.currencies = self.omit(self.currencies, dropped)
         return self.markets
 
+    def index_by_raw_id(self, markets):
+        result = {}
+        ambiguous = set()
+        for market in markets:
+            ids = [market.get('id'), market.get('symbol'), market.get('altname')]
+            for base, quote in ((market.get('baseId'), market.get('quoteId')), (market.get('base'), market.get('quote'))):
+                if base and quote:
+                    ids.extend([base + separator + quote for separator in self.marketIdSeparators])
+            for id in ids:
+                if isinstance(id, basestring):
+                    for form in (id, id.lower(), id.upper()):
+                        if result.setdefault(form, market) is not market:
+                            ambiguous.add(form)
+        # a form shared by several markets, like ABC for AB/C and A/BC, finds none of them
+        for form in ambiguous:
+            del result[form]
+        # the exact symbols and ids take precedence over the forms derived from other markets
+        for key in ('symbol', 'id'):
+            for market in markets:
+                if key in market:
+                    result[market[key]] = market
+        return result
+
+    def find_market(self, id):
+        """Returns the market for an id as the exchange returns it (id, symbol, altname, any case,
+        base and quote joined by one of the marketIdSeparators) or None"""
+        if self.markets_by_raw_id is None:
+            return None
+        return self.markets_by_raw_id.get(id)
+
+    def markets_currencies(self, markets):
+        base_currencies = [{
+            'id': market['baseId'] if 'baseId' in market else market['base'],
+            'code': market['base'],
+        } for market in markets if 'base' in market]
+        quote_currencies = [{
+            'id': market['quoteId'] if 'quoteId' in market else market['quote'],
+            'code': market['quote'],
+        } for market in markets if 'quote' in market]
+        currencies = self.sort_by(base_currencies + quote_currencies, 'code')
+        return self.index_by(currencies, 'code')
+
     def load_markets(self, reload=False):
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.load_cached_markets():
+                return self.markets
         markets = self.fetch_markets()
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = self.fetch_currencies()
-        return self.set_markets(markets, currencies)
+        return self.set_cached_markets(markets, currencies)
+
+    def uses_market_cache(self):
+        return self.sharedMetadata or self.marketCache['enabled']
+
+    def market_cache_key(self):
+        urls = getattr(self, 'urls', None) or {}
+        return self.id + '-' + hashlib.md5(self.encode(self.json(urls.get('api')))).hexdigest()[:8]
+
+    def markets_defaults_key(self):
+        """The markets are shared as loaded only between the instances that extend them with the same fees, precision and limits"""
+        return json.dumps([self.fees['trading'], self.precision, self.limits], sort_keys=True, default=str)
+
+    def load_cached_markets(self):
+        """Uses the markets another instance or process has loaded, returns False if there are none or they expired"""
+        if not self.uses_market_cache():
+            return False
+        entry = market_cache.get(self.market_cache_key(), self.marketCache['ttl'], self.marketCache['path'])
+        if entry is None:
+            return False
+        if not self.sharedMetadata:
+            self.set_markets(list(entry['markets']), entry['currencies'])
+            return True
+        loaded = entry.setdefault('loaded', {})
+        key = self.markets_defaults_key()
+        if key in loaded:
+            for name, value in loaded[key].items():
+                setattr(self, name, value)
+        else:
+            self.set_markets(list(entry['markets']), entry['currencies'])
+            loaded[key] = dict((name, getattr(self, name)) for name in self.markets_attributes)
+        return True
+
+    def set_cached_markets(self, markets, currencies=None):
+        """set_markets() that also stores the markets as fetched in the market cache"""
+        if not self.uses_market_cache():
+            return self.set_markets(markets, currencies)
+        entry = {
+            'timestamp': self.milliseconds(),
+            'markets': list(markets.values()) if type(markets) is dict else list(markets),
+            'currencies': currencies,
+        }
+        result = self.set_markets(markets, currencies)
+        if self.sharedMetadata:
+            entry['loaded'] = {
+                self.markets_defaults_key(): dict((name, getattr(self, name)) for name in self.markets_attributes),
+            }
+        market_cache.set(self.market_cache_key(), entry, self.marketCache['path'])
+        return result
+
+    def invalidate_markets(self):
+        """Drops the cached markets of the exchange, in this process and on disk, the next load_markets() fetches them"""
+        market_cache.invalidate(self.market_cache_key(), self.marketCache['path'])
 
     def fetch_markets(self):
         return self.markets
@@ -842,7 +1286,45 @@ class Exchange(object):
         raise NotSupported(self.id + ' API does not allow to fetch all prices at once with a single call to fetch_bid_asks() for now')
 
     def fetch_tickers(self, symbols=None, params={}):
-        raise NotSupported(self.id + ' API does not allow to fetch all tickers at once with a single call to fetch_tickers() for now')
+        """Emulated with one fetch_ticker() per symbol, see fan_out(), only for an explicit list of symbols
+        since one request per market of the exchange can be thousands"""
+        if not self.has['fetchTicker'] or not symbols:
+            raise NotSupported(self.id + ' API does not allow to fetch all tickers at once with a single call to fetch_tickers() for now')
+        self.load_markets()
+        return self.fan_out('fetch_ticker', symbols, params)
+
+    def fetch_order_books(self, symbols=None, params={}):
+        """Emulated with one fetch_order_book() per symbol, see fan_out()"""
+        self.load_markets()
+        return self.fan_out('fetch_order_book', symbols or self.symbols, params)
+
+    def fan_out(self, method, symbols, params={}):
+        """Calls a single-symbol method for every symbol with at most fanOutConcurrency requests in flight,
+        returns a FanOutResult, the results by symbol with the errors by symbol in its errors attribute"""
+        def call(symbol):
+            try:
+                return getattr(self, method)(symbol, params), None
+            except BaseError as e:
+                return None, e
+        pool = ThreadPool(max(min(self.fanOutConcurrency, len(symbols)), 1))
+        try:
+            responses = pool.map(call, symbols)
+        finally:
+            pool.close()
+            pool.join()
+        return self.fan_out_results(symbols, responses)
+
+    def fan_out_results(self, symbols, responses):
+        """Raises the first error if every symbol failed"""
+        result = FanOutResult()
+        for symbol, (response, error) in zip(symbols, responses):
+            if error is None:
+                result[symbol] = response
+            else:
+                result.errors[symbol] = error
+        if result.errors and not result:
+            raise result.errors[symbols[0]]
+        return result
 
     def fetch_order_status(self, id, market=None):
         order = self.fetch_order(id)
@@ -871,6 +1353,11 @@ class Exchange(object):
 
     def parse_ohlcvs(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
         ohlcvs = self.to_array(ohlcvs)
+        if self.ohlcvArrays:
+            # the rows are used as they are unless the exchange overrides parse_ohlcv()
+            if self.parse_ohlcv.__func__ is not getattr(Exchange.parse_ohlcv, '__func__', Exchange.parse_ohlcv):
+                ohlcvs = [self.parse_ohlcv(ohlcv, market, timeframe, since, limit) for ohlcv in ohlcvs]
+            return OHLCVArray.from_rows(ohlcvs).filter_by_since_limit(since, limit)
         num_ohlcvs = len(ohlcvs)
         result = []
         i = 0
@@ -885,9 +1372,13 @@ class Exchange(object):
         return result
 
     def parse_bid_ask(self, bidask, price_key=0, amount_key=0):
-        return [float(bidask[price_key]), float(bidask[amount_key])]
+        return [self.to_number(bidask[price_key]), self.to_number(bidask[amount_key])]
 
     def parse_bids_asks(self, bidasks, price_key=0, amount_key=1):
+        if self.orderBookArrays and self.number is float:
+            if len(bidasks) and type(bidasks[0]) not in (list, dict):
+                raise ExchangeError(self.id + ' unrecognized bidask format: ' + str(bidasks[0]))
+            return BookSide.from_rows(bidasks, price_key, amount_key)
         result = []
         if len(bidasks):
             if type(bidasks[0]) is list:
@@ -905,10 +1396,25 @@ class Exchange(object):
     def fetch_l2_order_book(self, symbol, params={}):
         orderbook = self.fetch_order_book(symbol, params)
         return self.extend(orderbook, {
-            'bids': self.sort_by(self.aggregate(orderbook['bids']), 0, True),
-            'asks': self.sort_by(self.aggregate(orderbook['asks']), 0),
+            'bids': self.aggregate_bids_asks(orderbook['bids'], True),
+            'asks': self.aggregate_bids_asks(orderbook['asks']),
         })
 
+    def update_order_book(self, symbol, params={}):
+        """Fetches a snapshot and applies its changes to the local order book of the symbol in orderbooks"""
+        return self.apply_order_book(symbol, self.fetch_order_book(symbol, params))
+
+    def apply_order_book(self, symbol, snapshot):
+        if symbol not in self.orderbooks:
+            self.orderbooks[symbol] = LocalOrderBook(None, self.to_number)
+        self.orderbooks[symbol].apply(snapshot)
+        return self.orderbooks[symbol]
+
+    def aggregate_bids_asks(self, bidasks, descending=False):
+        if isinstance(bidasks, BookSide):
+            return bidasks.aggregate(descending)
+        return self.sort_by(self.aggregate(bidasks), 0, descending)
+
     def parse_order_book(self, orderbook, timestamp=None, bids_key='bids', asks_key='asks', price_key=0, amount_key=1):
         timestamp = timestamp or self.milliseconds()
         return {
@@ -939,8 +1445,249 @@ class Exchange(object):
     def fetch_total_balance(self, params={}):
         return self.fetch_partial_balance('total', params)
 
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        raise NotSupported(self.id + ' fetch_trades() is not implemented yet')
+
     def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
-        raise NotSupported(self.id + ' API does not allow to fetch OHLCV series for now')
+        """Emulated with fetch_ohlcv_from_trades() where has['fetchOHLCV'] is 'emulated'"""
+        if self.has['fetchOHLCV'] != 'emulated':
+            raise NotSupported(self.id + ' API does not allow to fetch OHLCV series for now')
+        return self.fetch_ohlcv_from_trades(symbol, timeframe, since, limit, params)
+
+    def fetch_ohlcv_from_trades(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        """Builds the candles with build_ohlcv() from the trades since since, fetched page by page with
+        iter_trades() until the limit-th candle is complete or there are no more trades"""
+        state = self.ohlcv_trades_state()
+        for trade in self.iter_trades(symbol, since, None, params):
+            if not self.add_ohlcv_trade(state, trade, timeframe, since, limit):
+                break
+        return self.build_ohlcv(state['trades'], timeframe, since, limit)
+
+    @staticmethod
+    def ohlcv_trades_state():
+        return {
+            'trades': [],
+            'start': None,  # the start of the candle of the last trade
+            'count': 0,     # the number of candles from since on
+        }
+
+    def add_ohlcv_trade(self, state, trade, timeframe, since=None, limit=None):
+        """Keeps a trade for fetch_ohlcv_from_trades(), False once it starts a candle after the limit-th one"""
+        start = timeframe_start(trade['timestamp'], timeframe)
+        if (since is None or start >= since) and start != state['start']:
+            if limit and state['count'] >= limit:
+                return False
+            state['count'] += 1
+            state['start'] = start
+        state['trades'].append(trade)
+        return True
+
+    def fetch_resampled_ohlcv(self, symbol, timeframe='1h', since=None, limit=None, params={}):
+        """fetch_ohlcv() for any timeframe, resampled from the coarsest timeframe of the exchange that fits into it,
+        with a limit the source candles are paged until the limit-th candle is complete, only complete candles are returned"""
+        source = self.resample_source_timeframe(timeframe)
+        if source == timeframe:
+            return self.fetch_ohlcv(symbol, timeframe, since, limit, params)
+        if not limit:
+            ohlcvs = self.fetch_ohlcv(symbol, source, since, None, params)
+            return self.resample_complete_ohlcv(ohlcvs, source, timeframe, since)
+        since, until = self.resample_range(timeframe, since, limit)
+        ohlcvs = self.fetch_ohlcv_range(symbol, source, since, until, params)
+        return self.resample_complete_ohlcv(ohlcvs, source, timeframe, since, limit, until)
+
+    def resample_range(self, timeframe, since, limit):
+        """The since and until of the source candles of the first limit candles of the timeframe from since on,
+        of the latest limit complete candles without since"""
+        now = self.milliseconds()
+        if since is None:
+            since = timeframe_start(now, timeframe)
+            for i in range(0, limit):
+                since = timeframe_start(since - 1, timeframe)
+        until = timeframe_start(since, timeframe)
+        if until < since:
+            until = timeframe_end(since, timeframe)
+        for i in range(0, limit):
+            until = timeframe_end(until, timeframe)
+        return since, min(until, now)
+
+    def resample_complete_ohlcv(self, ohlcvs, source, timeframe, since=None, limit=None, until=None):
+        """resample_ohlcv() without the candles that the source candles do not cover entirely, the first one
+        of a page fetched without since and the last one if it has not ended at until or after the last source candle"""
+        if not isinstance(ohlcvs, OHLCVArray):
+            ohlcvs = OHLCVArray.from_rows(ohlcvs)
+        resampled = ohlcvs.resample(timeframe)
+        if len(ohlcvs):
+            if until is None:
+                until = min(int(ohlcvs.timestamps[-1]) + self.parse_timeframe(source) * 1000, self.milliseconds())
+            if timeframe_end(resampled.timestamps[-1], timeframe) > until:
+                resampled = resampled[0:-1]
+            if since is None:
+                since = int(ohlcvs.timestamps[0])
+        resampled = resampled.filter_by_since_limit(since, limit)
+        return resampled if self.ohlcvArrays else resampled.to_list()
+
+    def resample_source_timeframe(self, timeframe):
+        """The coarsest of the timeframes of the exchange whose candles fit into the candles of the timeframe,
+        the timeframe itself if the exchange supports it or has no timeframes"""
+        if not self.timeframes or (timeframe in self.timeframes):
+            return timeframe
+        if timeframe[-1] in ('M', 'y'):
+            target = 86400  # calendar months are made of whole days
+        else:
+            target = self.parse_timeframe(timeframe)
+            if timeframe[-1] == 'w':
+                target = 86400  # weeks start on Mondays, only candles of days or less are aligned with them
+        candidates = [source for source in self.timeframes if source[-1] not in ('M', 'y') and target % self.parse_timeframe(source) == 0]
+        if not candidates:
+            raise NotSupported(self.id + ' cannot resample OHLCV to the ' + timeframe + ' timeframe')
+        return max(candidates, key=self.parse_timeframe)
+
+    def build_ohlcv(self, trades, timeframe='1m', since=None, limit=None):
+        """The candles of the timeframe from unified trades"""
+        ohlcvs = OHLCVArray.from_trades(trades, timeframe).filter_by_since_limit(since, limit)
+        return ohlcvs if self.ohlcvArrays else ohlcvs.to_list()
+
+    def resample_ohlcv(self, ohlcvs, timeframe, since=None, limit=None):
+        """Merges candles into the candles of a coarser timeframe"""
+        if not isinstance(ohlcvs, OHLCVArray):
+            ohlcvs = OHLCVArray.from_rows(ohlcvs)
+        ohlcvs = ohlcvs.resample(timeframe).filter_by_since_limit(since, limit)
+        return ohlcvs if self.ohlcvArrays else ohlcvs.to_list()
+
+    def fetch_ohlcv_range(self, symbol, timeframe='1m', since=None, until=None, params={}, checkpoint=None):
+        """Fetches the candles from since until until (exclusive, now by default) page by page, the progress is
+        kept in the checkpoint dict, calling again with the same dict after an error resumes after the last page"""
+        checkpoint = self.ohlcv_range_checkpoint(checkpoint, since, until)
+        duration = self.parse_timeframe(timeframe) * 1000
+        while checkpoint['since'] < checkpoint['until']:
+            start = checkpoint['since']
+            ohlcvs = self.fetch_ohlcv(symbol, timeframe, start, self.ohlcvPageSize, params)
+            next_since = self.add_ohlcv_range_page(checkpoint, start, ohlcvs, duration)
+            if next_since is None:
+                break
+            checkpoint['since'] = next_since
+        return self.merge_ohlcvs(checkpoint['ohlcvs'])
+
+    def ohlcv_range_checkpoint(self, checkpoint=None, since=None, until=None):
+        checkpoint = {} if checkpoint is None else checkpoint
+        if since is None and 'since' not in checkpoint:
+            raise ExchangeError(self.id + ' fetch_ohlcv_range() requires a since argument')
+        checkpoint.setdefault('since', since)
+        checkpoint.setdefault('until', until or self.milliseconds())
+        checkpoint.setdefault('ohlcvs', [])
+        checkpoint.setdefault('done', [])  # the pages fetched concurrently by the async version
+        return checkpoint
+
+    def add_ohlcv_range_page(self, checkpoint, start, ohlcvs, duration):
+        """Keeps the candles of a page that fall in the range, returns where the next page starts or None
+        if the page is empty and the page size is unknown"""
+        ohlcvs = [ohlcv for ohlcv in ohlcvs if start <= ohlcv[0] < checkpoint['until']]
+        checkpoint['ohlcvs'].extend(ohlcvs)
+        last = max([ohlcv[0] for ohlcv in ohlcvs]) if ohlcvs else None
+        if last is not None:
+            # a short page is continued after its last candle too, the exchange may return fewer than asked
+            return last + duration
+        if not self.ohlcvPageSize:
+            return None
+        # an empty page is a gap in the history, the next page starts after the whole page
+        return start + self.ohlcvPageSize * duration
+
+    @staticmethod
+    def merge_ohlcvs(ohlcvs):
+        """Sorts the candles by time, the last one of the candles with the same timestamp wins"""
+        candles = dict((ohlcv[0], ohlcv) for ohlcv in ohlcvs)
+        return [candles[timestamp] for timestamp in sorted(candles.keys())]
+
+    @staticmethod
+    def parse_timeframe(timeframe):
+        """The duration of a timeframe such as '1m', '4h' or '1M' in seconds"""
+        amount = int(timeframe[0:-1])
+        unit = timeframe[-1]
+        scales = {
+            'y': 60 * 60 * 24 * 365,
+            'M': 60 * 60 * 24 * 30,
+            'w': 60 * 60 * 24 * 7,
+            'd': 60 * 60 * 24,
+            'h': 60 * 60,
+            'm': 60,
+            's': 1,
+        }
+        if unit not in scales:
+            raise NotSupported('timeframe unit ' + unit + ' is not supported')
+        return amount * scales[unit]
+
+    def iter_trades(self, symbol, since=None, limit=None, params={}):
+        """Yields the trades from since on in order of time, the next page is only fetched once the previous
+        one is consumed and only the ids of the trades of the last millisecond are kept to skip duplicates"""
+        return self.iter_trade_history('fetch_trades', symbol, since, limit, params)
+
+    def iter_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        """iter_trades() for fetch_my_trades()"""
+        return self.iter_trade_history('fetch_my_trades', symbol, since, limit, params)
+
+    def iter_trade_history(self, method, symbol, since, limit, params):
+        cursor = self.trade_history_cursor(since, limit)
+        while not cursor['done']:
+            trades = getattr(self, method)(symbol, cursor['since'], self.tradesPageSize, params)
+            for trade in self.add_trade_history_page(cursor, trades):
+                yield trade
+
+    def trade_history_cursor(self, since=None, limit=None):
+        return {
+            'since': since,      # the since argument of the next request
+            'last': since,       # the timestamp of the last trade returned
+            'seen': set(),       # the keys of the trades returned at that timestamp
+            'remaining': limit,
+            'done': bool(limit is not None and limit <= 0),
+        }
+
+    def add_trade_history_page(self, cursor, trades):
+        """Returns the trades of a page that were not returned before in order of time and moves the cursor past
+        them, the cursor is done when a page brings nothing new or the limit is reached"""
+        last = cursor['last']
+        result = []
+        for trade in sorted([trade for trade in trades if trade['timestamp'] is not None], key=lambda trade: trade['timestamp']):
+            if last is not None:
+                if trade['timestamp'] < last:
+                    continue
+                if trade['timestamp'] == last and self.trade_key(trade) in cursor['seen']:
+                    continue
+            result.append(trade)
+        if not result and trades and (last is not None):
+            # a full page of the last millisecond alone, the rest of it can not be paged with since,
+            # without a tradesPageSize a full page can not be told from the end of the history
+            full = (self.tradesPageSize is not None) and (len(trades) >= self.tradesPageSize)
+            overflow = full and all(trade['timestamp'] == last for trade in trades)
+            if cursor['since'] < last:
+                if overflow:
+                    warnings.warn(str(self.id) + ' returns ' + str(len(trades)) + ' trades or more at ' + str(last) + ', the trades of that millisecond that do not fit in a page of tradesPageSize are skipped')
+                # the page was filled with the trades before the last millisecond, it is fetched again from there
+                cursor['since'] = last
+                return result
+            if overflow and (cursor['since'] == last):
+                # the exchange returns the trades from since on, the next millisecond is fetched
+                cursor['since'] = last + 1
+                return result
+        if cursor['remaining'] is not None:
+            result = result[0:cursor['remaining']]
+            cursor['remaining'] -= len(result)
+        if not result or cursor['remaining'] == 0:
+            cursor['done'] = True
+        if result:
+            timestamp = result[-1]['timestamp']
+            if timestamp != last:
+                cursor['seen'] = set()
+            cursor['seen'].update(self.trade_key(trade) for trade in result if trade['timestamp'] == timestamp)
+            cursor['last'] = timestamp
+            # some exchanges only return the trades after since, the last millisecond is fetched again
+            cursor['since'] = timestamp - 1
+        return result
+
+    @staticmethod
+    def trade_key(trade):
+        if trade.get('id') is not None:
+            return trade['id']
+        return (trade['timestamp'], trade.get('side'), trade.get('price'), trade.get('amount'))
 
     def parse_trades(self, trades, market=None, since=None, limit=None):
         array = self.to_array(trades)
@@ -990,13 +1737,13 @@ class Exchange(object):
 
     def calculate_fee(self, symbol, type, side, amount, price, taker_or_maker='taker', params={}):
         market = self.markets[symbol]
-        rate = market[taker_or_maker]
-        cost = float(self.cost_to_precision(symbol, amount * price))
+        rate = self.to_number(market[taker_or_maker])
+        cost = self.to_number(self.cost_to_precision(symbol, self.to_number(amount) * self.to_number(price)))
         return {
             'rate': rate,
             'type': taker_or_maker,
             'currency': market['quote'],
-            'cost': float(self.fee_to_precision(symbol, rate * cost)),
+            'cost': self.to_number(self.fee_to_precision(symbol, rate * cost)),
         }
 
     def edit_limit_buy_order(self, id, symbol, *args):
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+"""The results of the calls that Exchange.fan_out() makes for many symbols"""
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'FanOutResult',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class FanOutResult(dict):
+    """The results by symbol of fetch_order_books() and the emulated fetch_tickers(), the errors of
+    the symbols that failed are in the errors dict of the same call, so concurrent calls keep their own"""
+
+    def __init__(self, results=None, errors=None):
+        super(FanOutResult, self).__init__(results or {})
+        self.errors = errors or {}
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""Packages that import the module of an exchange the first time its class is accessed"""
+
+# -----------------------------------------------------------------------------
+
+import importlib
+import sys
+import types
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'LazyModule',
+    'lazy_module',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class LazyModule(types.ModuleType):
+    """Resolves the names listed in the exchanges attribute of the package to the classes
+    of the same name in the submodules, which are imported on first access"""
+
+    def __getattr__(self, name):
+        if name not in self.__dict__.get('exchanges', ()):
+            raise AttributeError("module '" + self.__name__ + "' has no attribute '" + name + "'")
+        importlib.import_module(self.__name__ + '.' + name)
+        self.bind_exchanges()
+        return self.__dict__[name]
+
+    def __setattr__(self, name, value):
+        # the import system binds every imported submodule to its package, bind the class instead
+        if isinstance(value, types.ModuleType) and (name in self.__dict__.get('exchanges', ())):
+            value = getattr(value, name)
+        types.ModuleType.__setattr__(self, name, value)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__.keys()) | set(self.__dict__.get('exchanges', ())))
+
+    def bind_exchanges(self):
+        # Python 2 binds the submodules directly in the dict of the package, bypassing __setattr__
+        for id in self.__dict__['exchanges']:
+            value = self.__dict__.get(id)
+            if isinstance(value, types.ModuleType):
+                self.__dict__[id] = getattr(value, id)
+
+
+class LegacyLazyModule(LazyModule):
+    """The LazyModule of Python 2, the import system writes the submodules in the dict of the package
+    without calling __setattr__, so they are replaced by their classes when they are read"""
+
+    def __getattribute__(self, name):
+        value = types.ModuleType.__getattribute__(self, name)
+        if isinstance(value, types.ModuleType) and (name in types.ModuleType.__getattribute__(self, '__dict__').get('exchanges', ())):
+            self.bind_exchanges()
+            value = getattr(value, name)
+        return value
+
+
+def lazy_module(name):
+    """Turns the already imported module into a LazyModule"""
+    module = sys.modules[name]
+    try:
+        module.__class__ = LazyModule  # Python 3.5+
+    except TypeError:
+        lazy = LegacyLazyModule(name, module.__doc__)
+        lazy.__dict__.update(module.__dict__)
+        lazy.__dict__['_module'] = module  # Python 2 clears the globals of a module once it is collected
+        sys.modules[name] = lazy
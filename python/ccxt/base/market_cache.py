@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""Process-wide store of loaded markets shared between the instances of an exchange,
+with an expiry and optional JSON snapshots on disk shared between processes"""
+
+# -----------------------------------------------------------------------------
+
+import json
+import os
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'MarketCache',
+    'market_cache',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class MarketCache(object):
+    """Maps a key (exchange id and api urls) to an entry with the timestamp and the markets and
+    currencies as fetched, set_markets() is applied to them by every instance that uses them"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    @staticmethod
+    def milliseconds():
+        return int(time.time() * 1000)
+
+    @staticmethod
+    def filename(key, path):
+        return os.path.join(path, key + '.json')
+
+    def expired(self, entry, ttl):
+        return (entry is None) or ((ttl is not None) and (self.milliseconds() - entry['timestamp'] > ttl))
+
+    def get(self, key, ttl=None, path=None):
+        """Returns the entry unless it is older than ttl milliseconds, looks for a snapshot
+        written by another process if there is no fresh entry in this one"""
+        entry = self.entries.get(key)
+        if self.expired(entry, ttl) and path:
+            entry = self.read(key, path)
+            if entry is not None:
+                self.entries[key] = entry
+        return None if self.expired(entry, ttl) else entry
+
+    def set(self, key, entry, path=None):
+        with self.lock:
+            self.entries[key] = entry
+        if path:
+            self.write(key, entry, path)
+
+    def invalidate(self, key=None, path=None):
+        """Drops one entry or all of them, and the snapshot of the entry on disk"""
+        with self.lock:
+            if key is None:
+                self.entries = {}
+            else:
+                self.entries.pop(key, None)
+        if key is not None and path and os.path.exists(self.filename(key, path)):
+            os.remove(self.filename(key, path))
+
+    def read(self, key, path):
+        try:
+            with open(self.filename(key, path)) as file:
+                return json.load(file)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def write(self, key, entry, path):
+        snapshot = {
+            'timestamp': entry['timestamp'],
+            'markets': entry['markets'],
+            'currencies': entry['currencies'],
+        }
+        filename = self.filename(key, path)
+        temporary = filename + '.' + str(os.getpid()) + '.tmp'
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        with open(temporary, 'w') as file:
+            json.dump(snapshot, file, default=str, separators=(',', ':'))
+        # readers in other processes never see a partially written snapshot
+        try:
+            os.replace(temporary, filename)
+        except AttributeError:
+            os.rename(temporary, filename)  # Python 2
+
+
+market_cache = MarketCache()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""The numbers of the str number mode, strings as the exchange sent them that compute like Decimal"""
+
+# -----------------------------------------------------------------------------
+
+from decimal import Decimal
+
+try:
+    integer_types = (int, long)  # Python 2
+except NameError:
+    integer_types = (int,)  # Python 3
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'NumericString',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def operand(value):
+    """The Decimal value of a number or a NumericString, None for anything else, plain strings keep
+    the str behaviour, 'x' + NumericString('1') concatenates"""
+    if isinstance(value, NumericString):
+        return Decimal(value)
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, Decimal) or (isinstance(value, integer_types) and not isinstance(value, bool)):
+        return Decimal(value)
+    return None
+
+
+class NumericString(str):
+    """A str that keeps the digits of the exchange, the arithmetic operators return NumericString and the
+    comparisons compare the values, so the parsers can compute costs and sort prices in the str mode.
+    Equality with the numbers and hashing are those of the value too, '1.10' and '1.1' are the same dict key,
+    a plain str still compares as a string, the truth value is that of the number"""
+
+    __slots__ = ()
+
+    def decimal(self):
+        return Decimal(self)
+
+    def compute(self, other, operation):
+        value = operand(other)
+        if value is None:
+            return NotImplemented
+        return NumericString(str(operation(Decimal(self), value)))
+
+    def __add__(self, other):
+        result = self.compute(other, lambda a, b: a + b)
+        return str.__add__(self, other) if result is NotImplemented else result
+
+    def __radd__(self, other):
+        result = self.compute(other, lambda a, b: b + a)
+        return str.__add__(other, self) if (result is NotImplemented) and isinstance(other, str) else result
+
+    def __sub__(self, other):
+        return self.compute(other, lambda a, b: a - b)
+
+    def __rsub__(self, other):
+        return self.compute(other, lambda a, b: b - a)
+
+    def __mul__(self, other):
+        return self.compute(other, lambda a, b: a * b)
+
+    def __rmul__(self, other):
+        return self.compute(other, lambda a, b: b * a)
+
+    def __truediv__(self, other):
+        return self.compute(other, lambda a, b: a / b)
+
+    def __rtruediv__(self, other):
+        return self.compute(other, lambda a, b: b / a)
+
+    __div__ = __truediv__  # Python 2
+    __rdiv__ = __rtruediv__
+
+    def __neg__(self):
+        return NumericString(str(-Decimal(self)))
+
+    def __abs__(self):
+        return NumericString(str(abs(Decimal(self))))
+
+    def __float__(self):
+        return float(Decimal(self))
+
+    def __bool__(self):
+        # like the other number types, '0.00' is false
+        return Decimal(self) != 0
+
+    __nonzero__ = __bool__  # Python 2
+
+    def compare(self, other, comparison, fallback):
+        value = operand(other)
+        if value is None:
+            return fallback(self, other)
+        return comparison(Decimal(self), value)
+
+    def __lt__(self, other):
+        return self.compare(other, lambda a, b: a < b, str.__lt__)
+
+    def __le__(self, other):
+        return self.compare(other, lambda a, b: a <= b, str.__le__)
+
+    def __gt__(self, other):
+        return self.compare(other, lambda a, b: a > b, str.__gt__)
+
+    def __ge__(self, other):
+        return self.compare(other, lambda a, b: a >= b, str.__ge__)
+
+    def __eq__(self, other):
+        return self.compare(other, lambda a, b: a == b, str.__eq__)
+
+    def __ne__(self, other):
+        return self.compare(other, lambda a, b: a != b, str.__ne__)
+
+    def __hash__(self):
+        # the hash of the Decimal, that of the int for the integer values
+        return hash(Decimal(self))
+
+    def __repr__(self):
+        return str.__repr__(self)
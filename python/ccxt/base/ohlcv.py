@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+"""OHLCV candles stored as one array per column, int64 timestamps and float64 prices and volumes,
+the timestamps are float64 on Python 2 builds without a 64 bit array type"""
+
+# -----------------------------------------------------------------------------
+
+from array import array
+from bisect import bisect_left
+import calendar
+import datetime
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'OHLCVArray',
+    'timeframe_end',
+    'timeframe_start',
+    'timeframe_starts',
+]
+
+# -----------------------------------------------------------------------------
+
+names = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+try:
+    timestamp_type = array('q').typecode
+except ValueError:
+    # Python 2 has no 'q', its 'l' is 64 bits wide on most platforms, a double holds any timestamp in ms exactly
+    timestamp_type = 'l' if array('l').itemsize == 8 else 'd'
+
+
+def timestamp_column(values):
+    return array(timestamp_type, [int(value) for value in values])
+
+
+def column(values):
+    return array('d', [float('nan') if value is None else float(value) for value in values])
+
+
+scales = {'w': 604800000, 'd': 86400000, 'h': 3600000, 'm': 60000, 's': 1000}
+monday = 4 * 86400000  # the epoch is a Thursday, weekly candles start on Mondays
+
+
+def timeframe_start(timestamp, timeframe):
+    """The start of the candle of a timeframe such as '5m', '1w' or '3M' that contains the timestamp"""
+    amount = int(timeframe[0:-1])
+    unit = timeframe[-1]
+    if unit in ('M', 'y'):
+        date = datetime.datetime.utcfromtimestamp(timestamp // 1000)
+        months = date.year * 12 + date.month - 1
+        months -= months % (amount * 12 if unit == 'y' else amount)
+        return calendar.timegm((months // 12, months % 12 + 1, 1, 0, 0, 0)) * 1000
+    duration = amount * scales[unit]
+    offset = monday if unit == 'w' else 0
+    return timestamp - (timestamp - offset) % duration
+
+
+def timeframe_end(timestamp, timeframe):
+    """The end of the candle that contains the timestamp, the start of the next one"""
+    amount = int(timeframe[0:-1])
+    unit = timeframe[-1]
+    start = timeframe_start(timestamp, timeframe)
+    if unit in ('M', 'y'):
+        date = datetime.datetime.utcfromtimestamp(start // 1000)
+        months = date.year * 12 + date.month - 1 + (amount * 12 if unit == 'y' else amount)
+        return calendar.timegm((months // 12, months % 12 + 1, 1, 0, 0, 0)) * 1000
+    return start + amount * scales[unit]
+
+
+def timeframe_starts(timestamps, timeframe):
+    """timeframe_start() of every timestamp, a NumPy array if NumPy is installed"""
+    if not numpy:
+        return [timeframe_start(timestamp, timeframe) for timestamp in timestamps]
+    timestamps = numpy.asarray(timestamps, dtype=numpy.int64)
+    amount = int(timeframe[0:-1])
+    unit = timeframe[-1]
+    if unit in ('M', 'y'):
+        months = timestamps.astype('datetime64[ms]').astype('datetime64[M]').astype(numpy.int64)
+        months -= months % (amount * 12 if unit == 'y' else amount)
+        return months.astype('datetime64[M]').astype('datetime64[ms]').astype(numpy.int64)
+    duration = amount * scales[unit]
+    offset = monday if unit == 'w' else 0
+    return timestamps - (timestamps - offset) % duration
+
+
+class OHLCVArray(object):
+    """A sequence of [timestamp, open, high, low, close, volume] candles sorted by timestamp, the lists are
+    built on access, slices copy the columns, to_numpy() shares their memory"""
+
+    def __init__(self, timestamps=None, opens=None, highs=None, lows=None, closes=None, volumes=None):
+        self.timestamps = array(timestamp_type) if timestamps is None else timestamps
+        self.opens = array('d') if opens is None else opens
+        self.highs = array('d') if highs is None else highs
+        self.lows = array('d') if lows is None else lows
+        self.closes = array('d') if closes is None else closes
+        self.volumes = array('d') if volumes is None else volumes
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Builds the columns from [timestamp, open, high, low, close, volume] lists in any order"""
+        rows = list(rows)
+        if any(rows[i][0] > rows[i + 1][0] for i in range(0, len(rows) - 1)):
+            rows = sorted(rows, key=lambda row: row[0])
+        return cls(
+            timestamp_column([row[0] for row in rows]),
+            column([row[1] for row in rows]),
+            column([row[2] for row in rows]),
+            column([row[3] for row in rows]),
+            column([row[4] for row in rows]),
+            column([row[5] for row in rows]),
+        )
+
+    @classmethod
+    def from_trades(cls, trades, timeframe='1m'):
+        """Builds the candles of a timeframe from unified trades"""
+        trades = sorted((trade for trade in trades if trade.get('timestamp') is not None), key=lambda trade: trade['timestamp'])
+        prices = column([trade['price'] for trade in trades])
+        return cls.aggregate(
+            timestamp_column([trade['timestamp'] for trade in trades]),
+            prices, prices, prices, prices,
+            column([trade['amount'] for trade in trades]),
+            timeframe,
+        )
+
+    @classmethod
+    def aggregate(cls, timestamps, opens, highs, lows, closes, volumes, timeframe):
+        """Merges the consecutive rows that fall into the same candle of the timeframe, the rows are sorted by time"""
+        count = len(timestamps)
+        if not count:
+            return cls()
+        starts = timeframe_starts(timestamps, timeframe)
+        if numpy:
+            first = numpy.flatnonzero(numpy.concatenate(([True], starts[1:] != starts[:-1])))
+            last = numpy.concatenate((first[1:] - 1, [count - 1]))
+            return cls(
+                timestamp_column(starts[first].tolist()),
+                array('d', numpy.asarray(opens)[first].tolist()),
+                array('d', numpy.maximum.reduceat(numpy.asarray(highs), first).tolist()),
+                array('d', numpy.minimum.reduceat(numpy.asarray(lows), first).tolist()),
+                array('d', numpy.asarray(closes)[last].tolist()),
+                array('d', numpy.add.reduceat(numpy.asarray(volumes), first).tolist()),
+            )
+        result = cls()
+        for i in range(0, count):
+            if i and starts[i] == starts[i - 1]:
+                result.highs[-1] = max(result.highs[-1], highs[i])
+                result.lows[-1] = min(result.lows[-1], lows[i])
+                result.closes[-1] = closes[i]
+                result.volumes[-1] += volumes[i]
+            else:
+                result.timestamps.append(starts[i])
+                result.opens.append(opens[i])
+                result.highs.append(highs[i])
+                result.lows.append(lows[i])
+                result.closes.append(closes[i])
+                result.volumes.append(volumes[i])
+        return result
+
+    def resample(self, timeframe):
+        """The candles of a coarser timeframe, which must start at the start of a candle of this one"""
+        return self.aggregate(self.timestamps, self.opens, self.highs, self.lows, self.closes, self.volumes, timeframe)
+
+    def columns(self):
+        return [self.timestamps, self.opens, self.highs, self.lows, self.closes, self.volumes]
+
+    def index(self, timestamp):
+        """The position of the first candle at or after the timestamp"""
+        return bisect_left(self.timestamps, timestamp)
+
+    def filter_by_since_limit(self, since=None, limit=None):
+        start = self.index(since) if since else 0
+        end = len(self) if not limit else min(start + limit, len(self))
+        return self[start:end]
+
+    def to_list(self):
+        return list(self)
+
+    def to_numpy(self):
+        """The columns by name as NumPy arrays sharing the memory of this container"""
+        types = dict((name, numpy.float64) for name in names)
+        types['timestamp'] = numpy.float64 if timestamp_type == 'd' else numpy.int64
+        return dict((name, numpy.frombuffer(values, dtype=types[name])) for name, values in zip(names, self.columns()))
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OHLCVArray(*[values[index] for values in self.columns()])
+        candle = [values[index] for values in self.columns()]
+        candle[0] = int(candle[0])
+        return candle
+
+    def __iter__(self):
+        if timestamp_type == 'd':
+            return ([int(candle[0])] + list(candle[1:]) for candle in zip(*self.columns()))
+        return (list(candle) for candle in zip(*self.columns()))
+
+    def __eq__(self, other):
+        return self.to_list() == (other.to_list() if isinstance(other, OHLCVArray) else other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'OHLCVArray(' + repr(self.to_list()) + ')'
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+"""On-disk store of OHLCV candles by exchange id, symbol and timeframe, a binary file of float64 rows
+per series with one row per candle period, read through mmap"""
+
+# -----------------------------------------------------------------------------
+
+from array import array
+import mmap
+import os
+import sys
+import time
+
+from ccxt.base.errors import NotSupported
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'OHLCVStore',
+]
+
+# -----------------------------------------------------------------------------
+
+nan = float('nan')
+columns = 6          # timestamp, open, high, low, close, volume
+header_size = 2      # start timestamp and duration of the series, in milliseconds
+
+
+def from_bytes(values, data):
+    if sys.version_info[0] < 3:
+        values.fromstring(data)
+    else:
+        values.frombytes(data)
+    return values
+
+
+def to_bytes(values):
+    return values.tostring() if sys.version_info[0] < 3 else values.tobytes()
+
+
+class OHLCVStore(object):
+    """Row i of a series holds the candle that starts at start + i * duration. A NaN timestamp marks a
+    period that was never fetched, a timestamp with NaN prices a period without trades, which is
+    fetched and not reported by missing() again"""
+
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def duration(timeframe):
+        unit = timeframe[-1]
+        if unit in ('M', 'y'):
+            raise NotSupported('OHLCVStore does not support the variable duration timeframe ' + timeframe)
+        scales = {'w': 604800000, 'd': 86400000, 'h': 3600000, 'm': 60000, 's': 1000}
+        if unit not in scales:
+            raise NotSupported('timeframe unit ' + unit + ' is not supported')
+        return int(timeframe[0:-1]) * scales[unit]
+
+    def filename(self, exchange_id, symbol, timeframe):
+        return os.path.join(self.path, exchange_id, symbol.replace('/', '-') + '-' + timeframe + '.ohlcv')
+
+    def load(self, exchange_id, symbol, timeframe):
+        """Returns the start of the series and all its values as array('d'), (None, empty) if there is no file"""
+        filename = self.filename(exchange_id, symbol, timeframe)
+        if not os.path.exists(filename):
+            return None, array('d')
+        with open(filename, 'rb') as file:
+            values = from_bytes(array('d'), file.read())
+        return int(values[0]), values[header_size:]
+
+    def save(self, exchange_id, symbol, timeframe, start, values):
+        filename = self.filename(exchange_id, symbol, timeframe)
+        directory = os.path.dirname(filename)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        temporary = filename + '.' + str(os.getpid()) + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(to_bytes(array('d', [start, self.duration(timeframe)])))
+            file.write(to_bytes(values))
+        try:
+            os.replace(temporary, filename)
+        except AttributeError:
+            os.rename(temporary, filename)  # Python 2
+
+    def start(self, filename):
+        """The start timestamp in the header of a series, None if there is no file"""
+        if not os.path.exists(filename) or not os.path.getsize(filename):
+            return None
+        with open(filename, 'rb') as file:
+            return int(from_bytes(array('d'), file.read(8))[0])
+
+    def write(self, exchange_id, symbol, timeframe, ohlcvs, since=None, until=None):
+        """Stores the candles, the periods from since until until without a candle are marked as fetched.
+        Only the rows from the first to the last period are read and written in place, the file is written
+        again only when it is created or the candles start before it"""
+        duration = self.duration(timeframe)
+        timestamps = [ohlcv[0] for ohlcv in ohlcvs]
+        if since is not None:
+            timestamps.append(since - since % duration)
+        if until is not None:
+            timestamps.append(until - 1 - (until - 1) % duration)
+        if not timestamps:
+            return
+        first = min(timestamps)
+        filename = self.filename(exchange_id, symbol, timeframe)
+        start = self.start(filename)
+        if start is None or first < start:
+            values = self.load(exchange_id, symbol, timeframe)[1]
+            if start is not None:
+                values = array('d', [nan]) * (((start - first) // duration) * columns) + values
+            start = first
+            self.save(exchange_id, symbol, timeframe, start, values)
+        low = (first - start) // duration
+        high = (max(timestamps) - start) // duration + 1
+        with open(filename, 'r+b') as file:
+            file.seek(0, os.SEEK_END)
+            count = (file.tell() // 8 - header_size) // columns
+            # the rows between the end of the file and the first period are written as never fetched
+            low = min(low, count)
+            file.seek((header_size + low * columns) * 8)
+            values = from_bytes(array('d'), file.read(max(min(high, count) - low, 0) * columns * 8))
+            values.extend(array('d', [nan]) * ((high - low) * columns - len(values)))
+            if since is not None and until is not None:
+                offset = ((since - since % duration - start) // duration - low) * columns
+                for timestamp in range(since - since % duration, until, duration):
+                    if values[offset] != values[offset]:  # NaN
+                        values[offset] = timestamp
+                    offset += columns
+            for ohlcv in ohlcvs:
+                offset = ((ohlcv[0] - start) // duration - low) * columns
+                for i in range(0, columns):
+                    values[offset + i] = nan if ohlcv[i] is None else ohlcv[i]
+            file.seek((header_size + low * columns) * 8)
+            file.write(to_bytes(values))
+
+    def read(self, exchange_id, symbol, timeframe, since=None, until=None, arrays=False):
+        """Returns the stored candles from since until until as [timestamp, open, high, low, close, volume]
+        lists, or with arrays=True as a NumPy array with a row per candle if NumPy is installed and a flat
+        array('d') otherwise"""
+        filename = self.filename(exchange_id, symbol, timeframe)
+        if not os.path.exists(filename) or not os.path.getsize(filename):
+            return (numpy.empty((0, columns)) if numpy else array('d')) if arrays else []
+        with open(filename, 'rb') as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            header = from_bytes(array('d'), mapped[0:header_size * 8])
+            start, duration = int(header[0]), int(header[1])
+            count = (len(mapped) // 8 - header_size) // columns
+            first = 0 if since is None else min(max((since - start + duration - 1) // duration, 0), count)
+            last = count if until is None else min(max((until - start + duration - 1) // duration, first), count)
+            if numpy:
+                rows = numpy.frombuffer(mapped[(header_size + first * columns) * 8:(header_size + last * columns) * 8], dtype=numpy.float64)
+                rows = rows.reshape(-1, columns)
+                rows = rows[~numpy.isnan(rows[:, 1])]
+                if arrays:
+                    return rows
+                return [[int(row[0])] + row[1:] for row in rows.tolist()]
+            values = from_bytes(array('d'), mapped[(header_size + first * columns) * 8:(header_size + last * columns) * 8])
+        finally:
+            mapped.close()
+        opens = values[1::columns]
+        if arrays:
+            if all(value == value for value in opens):  # no NaN
+                return values
+            result = array('d')
+            for offset in range(0, len(values), columns):
+                if values[offset + 1] == values[offset + 1]:
+                    result.extend(values[offset:offset + columns])
+            return result
+        # not named open, Python 2 list comprehensions would shadow the builtin in the whole function
+        return [
+            [int(timestamp), opening, high, low, close, volume]
+            for timestamp, opening, high, low, close, volume
+            in zip(values[0::columns], opens, values[2::columns], values[3::columns], values[4::columns], values[5::columns])
+            if opening == opening
+        ]
+
+    def missing(self, exchange_id, symbol, timeframe, since, until):
+        """The [start, end] ranges of the periods from since until until that were never fetched"""
+        duration = self.duration(timeframe)
+        since = since - since % duration
+        start, values = self.load(exchange_id, symbol, timeframe)
+        if numpy and start is not None:
+            return self.missing_ranges(numpy.frombuffer(values, dtype=numpy.float64)[0::columns], start, duration, since, until)
+        timestamps = values[0::columns]
+        first = 0 if start is None else (since - start) // duration
+        result = []
+        for index, timestamp in enumerate(range(since, until, duration)):
+            position = first + index
+            if (start is not None) and (0 <= position < len(timestamps)) and (timestamps[position] == timestamps[position]):
+                continue
+            if result and result[-1][1] == timestamp:
+                result[-1][1] = timestamp + duration
+            else:
+                result.append([timestamp, timestamp + duration])
+        return result
+
+    @staticmethod
+    def missing_ranges(timestamps, start, duration, since, until):
+        first = (since - start) // duration
+        count = max((until - since + duration - 1) // duration, 0)
+        fetched = numpy.zeros(count, dtype=bool)
+        low = max(first, 0)
+        high = min(first + count, len(timestamps))
+        if high > low:
+            fetched[low - first:high - first] = ~numpy.isnan(timestamps[low:high])
+        # the bounds of the runs of periods that were never fetched
+        edges = numpy.flatnonzero(numpy.diff(numpy.concatenate(([1], fetched.view(numpy.int8), [1]))))
+        return [[since + int(edges[i]) * duration, since + int(edges[i + 1]) * duration] for i in range(0, len(edges), 2)]
+
+    def sync(self, exchange, symbol, timeframe, since, until=None):
+        """Fetches the missing ranges with exchange.fetch_ohlcv_range() and stores them, the candle in
+        progress is not stored, returns the candles from since until until. For the synchronous exchanges,
+        the OHLCVStore of ccxt.async.base.ohlcv_store has a coroutine sync() for the async ones"""
+        for start, end in self.missing(exchange.id, symbol, timeframe, since, self.closed(timeframe, until)):
+            checkpoint = {}
+            ohlcvs = exchange.fetch_ohlcv_range(symbol, timeframe, start, end, {}, checkpoint)
+            self.store_range(exchange, symbol, timeframe, ohlcvs, start, end, checkpoint)
+        return self.read(exchange.id, symbol, timeframe, since, self.closed(timeframe, until))
+
+    def closed(self, timeframe, until=None):
+        duration = self.duration(timeframe)
+        closed = int(time.time() * 1000) // duration * duration
+        return closed if until is None else min(until, closed)
+
+    def store_range(self, exchange, symbol, timeframe, ohlcvs, start, end, checkpoint):
+        """Writes the candles of a range and marks as fetched only the periods the pages covered,
+        fetch_ohlcv_range() can stop before the end and an ohlcvLatestOnly exchange starts late"""
+        end = min(end, checkpoint.get('since', start))
+        if getattr(exchange, 'ohlcvLatestOnly', False):
+            start = min([ohlcv[0] for ohlcv in ohlcvs]) if ohlcvs else end
+        if start < end:
+            self.write(exchange.id, symbol, timeframe, ohlcvs, start, end)
+        else:
+            self.write(exchange.id, symbol, timeframe, ohlcvs)
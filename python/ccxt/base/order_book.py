@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+"""Order book sides backed by contiguous arrays of prices and amounts, NumPy arrays
+if it is installed and array('d') otherwise"""
+
+# -----------------------------------------------------------------------------
+
+from array import array
+from bisect import bisect_left
+from bisect import insort
+from itertools import islice
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'BookSide',
+    'LocalBookSide',
+    'LocalOrderBook',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class BookSide(object):
+    """A read-only sequence of [price, amount] levels, the lists are only built when the side
+    is indexed or iterated, aggregate() works on the arrays.
+
+    A BookSide is not a list: isinstance(side, list) is False and json.dumps() rejects it,
+    Exchange.json() and to_list() return the levels as a list of lists. It compares equal
+    to that list and side + list returns a list"""
+
+    def __init__(self, prices=None, amounts=None):
+        if prices is None:
+            prices = numpy.empty(0) if numpy else array('d')
+            amounts = numpy.empty(0) if numpy else array('d')
+        self.prices = prices
+        self.amounts = amounts
+        self.rows = None
+
+    @classmethod
+    def from_rows(cls, rows, price_key=0, amount_key=1):
+        """Parses decoded [price, amount] lists or dicts, skipping the levels with a zero or missing price or amount"""
+        if len(rows) and type(rows[0]) is dict:
+            rows = [row for row in rows if (price_key in row) and (amount_key in row)]
+        if not len(rows):
+            return cls()
+        if numpy:
+            if type(rows[0]) is list:
+                try:
+                    values = numpy.array(rows, dtype=float)
+                    prices, amounts = values[:, price_key], values[:, amount_key]
+                except (ValueError, TypeError, IndexError):  # levels of different lengths or with nulls
+                    prices = numpy.array([row[price_key] for row in rows], dtype=float)
+                    amounts = numpy.array([row[amount_key] for row in rows], dtype=float)
+            else:
+                prices = numpy.array([row[price_key] for row in rows], dtype=float)
+                amounts = numpy.array([row[amount_key] for row in rows], dtype=float)
+            keep = (prices != 0) & (amounts != 0) & ~numpy.isnan(prices) & ~numpy.isnan(amounts)
+            if keep.all():
+                return cls(prices, amounts)
+            return cls(prices[keep], amounts[keep])
+        prices = array('d')
+        amounts = array('d')
+        for row in rows:
+            if row[price_key] and row[amount_key]:
+                price = float(row[price_key])
+                amount = float(row[amount_key])
+                if price and amount:
+                    prices.append(price)
+                    amounts.append(amount)
+        return cls(prices, amounts)
+
+    def aggregate(self, descending=False):
+        """Sums the amounts of the levels with the same price, drops the levels without a positive
+        amount and sorts by price"""
+        if numpy:
+            positive = self.amounts > 0
+            prices, inverse = numpy.unique(self.prices[positive], return_inverse=True)
+            amounts = numpy.bincount(inverse, weights=self.amounts[positive], minlength=len(prices))
+            if descending:
+                return BookSide(prices[::-1], amounts[::-1])
+            return BookSide(prices, amounts)
+        volumes = {}
+        for price, amount in zip(self.prices, self.amounts):
+            if amount > 0:
+                volumes[price] = volumes.get(price, 0) + amount
+        prices = sorted(volumes.keys(), reverse=descending)
+        return BookSide(array('d', prices), array('d', [volumes[price] for price in prices]))
+
+    def to_list(self):
+        if self.rows is None:
+            prices = self.prices.tolist()
+            amounts = self.amounts.tolist()
+            self.rows = [[prices[i], amounts[i]] for i in range(0, len(prices))]
+        return self.rows
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __reversed__(self):
+        return reversed(self.to_list())
+
+    def __contains__(self, level):
+        return level in self.to_list()
+
+    def __add__(self, other):
+        return self.to_list() + list(other)
+
+    def __radd__(self, other):
+        return list(other) + self.to_list()
+
+    def __eq__(self, other):
+        if isinstance(other, BookSide):
+            other = other.to_list()
+        return self.to_list() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'BookSide(' + repr(self.to_list()) + ')'
+
+
+class LocalBookSide(object):
+    """The price levels of one side of a local order book, a dict of the amounts by price and the
+    prices in ascending order, in a SortedList if sortedcontainers is installed and in a list kept
+    sorted with bisect otherwise, the bids are read from the end"""
+
+    def __init__(self, descending=False, to_number=float):
+        self.descending = descending
+        self.to_number = to_number
+        self.keys = SortedList() if SortedList else []
+        self.amounts = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def prices(self):
+        """The prices best first"""
+        return reversed(self.keys) if self.descending else iter(self.keys)
+
+    def price(self, index):
+        return self.keys[-1 - index] if self.descending else self.keys[index]
+
+    def store(self, price, amount):
+        """Sets the amount at a price level, a zero amount removes the level"""
+        price = self.to_number(price)
+        amount = self.to_number(amount)
+        if amount:
+            if price not in self.amounts:
+                if SortedList:
+                    self.keys.add(price)
+                else:
+                    insort(self.keys, price)
+            self.amounts[price] = amount
+        elif price in self.amounts:
+            del self.amounts[price]
+            if SortedList:
+                self.keys.remove(price)
+            else:
+                del self.keys[bisect_left(self.keys, price)]
+
+    def best(self):
+        if not self.keys:
+            return None
+        price = self.price(0)
+        return [price, self.amounts[price]]
+
+    def amount_at(self, price):
+        return self.amounts.get(self.to_number(price), self.to_number(0))
+
+    def vwap(self, amount):
+        """The average price of taking the amount from the best levels, None if the side is not deep enough"""
+        amount = self.to_number(amount)
+        remaining = amount
+        cost = self.to_number(0)
+        for price in self.prices():
+            filled = min(remaining, self.amounts[price])
+            cost += filled * price
+            remaining -= filled
+            if remaining <= 0:
+                return cost / amount
+        return None
+
+    def levels(self, limit=None):
+        return [[price, self.amounts[price]] for price in islice(self.prices(), limit)]
+
+    def diff(self, levels):
+        """The [price, amount] changes that turn this side into the levels of a snapshot"""
+        zero = self.to_number(0)
+        amounts = {}
+        for price, amount in levels:
+            price = self.to_number(price)
+            amounts[price] = amounts.get(price, zero) + self.to_number(amount)
+        changes = [[price, zero] for price in self.amounts if price not in amounts]
+        for price, amount in amounts.items():
+            if self.amounts.get(price) != amount:
+                changes.append([price, amount])
+        return changes
+
+
+class LocalOrderBook(object):
+    """An order book kept up to date from consecutive snapshots or from diffs, applying only the
+    levels that changed, see Exchange.update_order_book()"""
+
+    def __init__(self, snapshot=None, to_number=float):
+        self.bids = LocalBookSide(True, to_number)
+        self.asks = LocalBookSide(False, to_number)
+        self.timestamp = None
+        self.datetime = None
+        self.nonce = None
+        if snapshot is not None:
+            self.apply(snapshot)
+
+    def stale(self, nonce):
+        return (nonce is not None) and (self.nonce is not None) and (nonce <= self.nonce)
+
+    def apply(self, snapshot):
+        """Applies the differences to a parsed order book snapshot, returns them as an order book of
+        the changed levels (zero amounts for the removed ones), or None if the snapshot is older
+        than the book according to its nonce"""
+        nonce = snapshot.get('nonce')
+        if self.stale(nonce):
+            return None
+        return self.update(self.bids.diff(snapshot['bids']), self.asks.diff(snapshot['asks']), nonce, snapshot.get('timestamp'), snapshot.get('datetime'))
+
+    def update(self, bids, asks, nonce=None, timestamp=None, datetime=None):
+        """Applies [price, amount] changes, a zero amount removes the level, returns None
+        and changes nothing if the nonce is not newer than the one of the book"""
+        if self.stale(nonce):
+            return None
+        for price, amount in bids:
+            self.bids.store(price, amount)
+        for price, amount in asks:
+            self.asks.store(price, amount)
+        self.nonce = nonce if nonce is not None else self.nonce
+        self.timestamp = timestamp
+        self.datetime = datetime
+        return {'bids': bids, 'asks': asks, 'nonce': nonce}
+
+    def best_bid(self):
+        return self.bids.best()
+
+    def best_ask(self):
+        return self.asks.best()
+
+    def vwap(self, side, amount):
+        """The average price to buy ('buy' takes the asks) or sell the amount"""
+        return (self.asks if side == 'buy' else self.bids).vwap(amount)
+
+    def order_book(self, limit=None):
+        """The book in the structure of fetch_order_book()"""
+        return {
+            'bids': self.bids.levels(limit),
+            'asks': self.asks.levels(limit),
+            'timestamp': self.timestamp,
+            'datetime': self.datetime,
+            'nonce': self.nonce,
+        }
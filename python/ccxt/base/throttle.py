@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""Thread-safe rate limiter for the synchronous Exchange"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Throttle',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class Throttle(object):
+    """Schedules requests on a virtual timeline per bucket: every request
+    reserves the earliest slot that is free in all of its buckets and pushes
+    the next free slot of each bucket by rateLimit * weight. Reservations are
+    made under a lock and never wait inside it, so concurrent threads are
+    released one by one in the order they asked, instead of computing the
+    same delay and firing together."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.next_slots = {}  # bucket → millisecond timestamp of the next free slot
+        self.paused_until = 0
+
+    @staticmethod
+    def milliseconds():
+        return time.time() * 1000
+
+    def reserve(self, cost, buckets, blocking=True):
+        with self.lock:
+            now = self.milliseconds()
+            slot = max(now, self.paused_until)
+            for bucket in cost:
+                if bucket in buckets:
+                    slot = max(slot, self.next_slots.get(bucket, 0))
+            if blocking or slot <= now:
+                for bucket in cost:
+                    if bucket in buckets:
+                        self.next_slots[bucket] = slot + buckets[bucket]['rateLimit'] * cost[bucket]
+            return slot - now
+
+    def acquire(self, cost, buckets, blocking=True):
+        """Returns the delay in milliseconds before the request may be sent,
+        blocking waits for it, non-blocking reserves nothing unless the delay is zero"""
+        delay = self.reserve(cost, buckets, blocking)
+        if blocking and delay > 0:
+            time.sleep(delay / 1000.0)
+        return delay
+
+    def pause(self, until):
+        """Holds every bucket until the given millisecond timestamp"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, until)
+
+    def reset(self):
+        with self.lock:
+            self.next_slots = {}
+            self.paused_until = 0
@@ -11,7 +11,6 @@ except NameError:
 
 
 import hashlib
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import AuthenticationError
 from ccxt.base.errors import InvalidNonce
@@ -283,7 +282,7 @@ class bitbay (Exchange):
         if (not isinstance(body, basestring)) or len((body) < 2):
             return  # fallback to default error handler
         if (body[0] == '{') or (body[0] == '['):
-            response = json.loads(body)
+            response = self.parse_json(body)
             if 'code' in response:
                 #
                 # bitbay returns the integer 'success': 1 key from their private API
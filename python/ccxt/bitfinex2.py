@@ -300,7 +300,7 @@ class bitfinex2 (bitfinex):
         for i in range(0, len(tickers)):
             ticker = tickers[i]
             id = ticker[0]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             result[symbol] = self.parse_ticker(ticker, market)
         return result
@@ -243,9 +243,9 @@ class bitstamp (Exchange):
         if 'id' in trade:
             order = str(trade['id'])
         if 'currency_pair' in trade:
-            marketId = trade['currency_pair']
-            if marketId in self.markets_by_id:
-                market = self.markets_by_id[marketId]
+            found = self.find_market(trade['currency_pair'])
+            if found:
+                market = found
         price = self.safe_float(trade, 'price')
         price = self.safe_float(trade, market['symbolId'], price)
         amount = self.safe_float(trade, 'amount')
@@ -12,7 +12,6 @@ except NameError:
 
 import hashlib
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import AuthenticationError
 from ccxt.base.errors import InsufficientFunds
@@ -324,8 +323,8 @@ class bittrex (Exchange):
             id = ticker['MarketName']
             market = None
             symbol = id
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
             else:
                 symbol = self.parse_symbol(id)
@@ -472,9 +471,8 @@ class bittrex (Exchange):
         if not market:
             if 'Exchange' in order:
                 marketId = order['Exchange']
-                if marketId in self.markets_by_id:
-                    market = self.markets_by_id[marketId]
-                else:
+                market = self.find_market(marketId)
+                if not market:
                     symbol = self.parse_symbol(marketId)
         if market:
             symbol = market['symbol']
@@ -649,7 +647,7 @@ class bittrex (Exchange):
     def handle_errors(self, code, reason, url, method, headers, body):
         if code >= 400:
             if body[0] == '{':
-                response = json.loads(body)
+                response = self.parse_json(body)
                 self.throw_exception_on_error(response)
                 if 'success' in response:
                     success = response['success']
@@ -221,7 +221,7 @@ class braziliex (Exchange):
         ids = list(tickers.keys())
         for i in range(0, len(ids)):
             id = ids[i]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             ticker = {
                 'date': timestamp,
@@ -294,8 +294,7 @@ class braziliex (Exchange):
         if not market:
             marketId = self.safe_string(order, 'market')
             if marketId:
-                if marketId in self.markets_by_id:
-                    market = self.markets_by_id[marketId]
+                market = self.find_market(marketId)
         if market:
             symbol = market['symbol']
         timestamp = self.safe_value(order, 'timestamp')
@@ -116,8 +116,8 @@ class btcturk (Exchange):
             ticker = tickers[i]
             symbol = ticker['pair']
             market = None
-            if symbol in self.markets_by_id:
-                market = self.markets_by_id[symbol]
+            market = self.find_market(symbol)
+            if market:
                 symbol = market['symbol']
             result[symbol] = self.parse_ticker(ticker, market)
         return result
@@ -180,11 +180,9 @@ class bter (Exchange):
             quote = self.common_currency_code(quote)
             symbol = base + '/' + quote
             ticker = tickers[id]
-            market = None
-            if symbol in self.markets:
-                market = self.markets[symbol]
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if not market:
+                market = self.find_market(symbol)
             result[symbol] = self.parse_ticker(ticker, market)
         return result
 
@@ -122,7 +122,7 @@ class coinexchange (Exchange):
     def parse_ticker(self, ticker, market=None):
         if not market:
             marketId = ticker['MarketID']
-            market = self.marketsById[marketId]
+            market = self.find_market(marketId)
         symbol = None
         if market:
             symbol = market['symbol']
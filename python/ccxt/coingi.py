@@ -225,7 +225,7 @@ class coingi (Exchange):
 
     def parse_trade(self, trade, market=None):
         if not market:
-            market = self.markets_by_id[trade['currencyPair']]
+            market = self.find_market(trade['currencyPair'])
         return {
             'id': trade['id'],
             'info': trade,
@@ -181,8 +181,8 @@ class coinmarketcap (Exchange):
             id = ticker['id'] + '/' + currency
             symbol = id
             market = None
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
             tickers[symbol] = self.parse_ticker(ticker, market)
         return tickers
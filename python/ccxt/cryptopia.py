@@ -217,10 +217,9 @@ class cryptopia (Exchange):
         for i in range(0, len(tickers)):
             ticker = tickers[i]
             id = ticker['TradePairId']
-            recognized = (id in list(self.markets_by_id.keys()))
-            if not recognized:
+            market = self.find_market(id)
+            if not market:
                 raise ExchangeError(self.id + ' fetchTickers() returned unrecognized pair id ' + id)
-            market = self.markets_by_id[id]
             symbol = market['symbol']
             result[symbol] = self.parse_ticker(ticker, market)
         return result
@@ -238,8 +237,7 @@ class cryptopia (Exchange):
         id = self.safe_string(trade, 'TradeId')
         if not market:
             if 'TradePairId' in trade:
-                if trade['TradePairId'] in self.markets_by_id:
-                    market = self.markets_by_id[trade['TradePairId']]
+                market = self.find_market(trade['TradePairId'])
         symbol = None
         fee = None
         if market:
@@ -429,8 +427,8 @@ class cryptopia (Exchange):
             symbol = market['symbol']
         elif 'Market' in order:
             id = order['Market']
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
         timestamp = self.parse8601(order['TimeStamp'])
         amount = self.safe_float(order, 'Amount')
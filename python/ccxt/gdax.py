@@ -5,7 +5,6 @@ from ccxt.base.exchange import Exchange
 import base64
 import hashlib
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import NotSupported
 from ccxt.base.errors import AuthenticationError
@@ -216,7 +215,9 @@ class gdax (Exchange):
             'id': self.market_id(symbol),
             'level': 2,  # 1 best bidask, 2 aggregated, 3 full
         }, params))
-        return self.parse_order_book(orderbook)
+        result = self.parse_order_book(orderbook)
+        result['nonce'] = self.safe_integer(orderbook, 'sequence')
+        return result
 
     def fetch_ticker(self, symbol, params={}):
         self.load_markets()
@@ -330,8 +331,7 @@ class gdax (Exchange):
         timestamp = self.parse8601(order['created_at'])
         symbol = None
         if not market:
-            if order['product_id'] in self.markets_by_id:
-                market = self.markets_by_id[order['product_id']]
+            market = self.find_market(order['product_id'])
         status = self.parse_order_status(order['status'])
         price = self.safe_float(order, 'price')
         amount = self.safe_float(order, 'size')
@@ -499,7 +499,7 @@ class gdax (Exchange):
     def handle_errors(self, code, reason, url, method, headers, body):
         if code == 400:
             if body[0] == "{":
-                response = json.loads(body)
+                response = self.parse_json(body)
                 message = response['message']
                 if message.find('price too small') >= 0:
                     raise InvalidOrder(self.id + ' ' + message)
@@ -598,7 +598,7 @@ class hitbtc (Exchange):
         result = {}
         for i in range(0, len(ids)):
             id = ids[i]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             ticker = tickers[id]
             result[symbol] = self.parse_ticker(ticker, market)
@@ -696,7 +696,7 @@ class hitbtc (Exchange):
             timestamp = self.safe_integer(order, 'timestamp')
         symbol = None
         if not market:
-            market = self.markets_by_id[order['symbol']]
+            market = self.find_market(order['symbol'])
         status = self.safe_string(order, 'orderStatus')
         if status:
             status = self.parse_order_status(status)
@@ -3,7 +3,6 @@
 from ccxt.hitbtc import hitbtc
 import base64
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import InsufficientFunds
 from ccxt.base.errors import InvalidOrder
@@ -719,7 +718,7 @@ class hitbtc2 (hitbtc):
         for i in range(0, len(tickers)):
             ticker = tickers[i]
             id = ticker['symbol']
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             result[symbol] = self.parse_ticker(ticker, market)
         return result
@@ -741,8 +740,8 @@ class hitbtc2 (hitbtc):
             symbol = market['symbol']
         else:
             id = trade['symbol']
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
             else:
                 symbol = id
@@ -822,7 +821,7 @@ class hitbtc2 (hitbtc):
         if 'updatedAt' in order:
             updated = self.parse8601(order['updatedAt'])
         if not market:
-            market = self.markets_by_id[order['symbol']]
+            market = self.find_market(order['symbol'])
         symbol = market['symbol']
         amount = self.safe_float(order, 'quantity')
         filled = self.safe_float(order, 'cumQuantity')
@@ -1007,7 +1006,7 @@ class hitbtc2 (hitbtc):
     def handle_errors(self, code, reason, url, method, headers, body):
         if code == 400:
             if body[0] == '{':
-                response = json.loads(body)
+                response = self.parse_json(body)
                 if 'error' in response:
                     if 'message' in response['error']:
                         message = response['error']['message']
@@ -23,6 +23,8 @@ class kraken (Exchange):
             'countries': 'US',
             'version': '0',
             'rateLimit': 3000,
+            'ohlcvPageSize': 720,  # candles per OHLCV request
+            'ohlcvLatestOnly': True,  # only the latest 720 candles, whatever the since
             'hasCORS': False,
             # obsolete metainfo interface
             'hasFetchTickers': True,
@@ -391,7 +393,7 @@ class kraken (Exchange):
         result = {}
         for i in range(0, len(ids)):
             id = ids[i]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             ticker = tickers[id]
             result[symbol] = self.parse_ticker(ticker, market)
@@ -534,12 +536,7 @@ class kraken (Exchange):
         }
 
     def find_market_by_altname_or_id(self, id):
-        result = None
-        if id in self.marketsByAltname:
-            result = self.marketsByAltname[id]
-        elif id in self.markets_by_id:
-            result = self.markets_by_id[id]
-        return result
+        return self.find_market(id)
 
     def parse_order(self, order, market=None):
         description = order['descr']
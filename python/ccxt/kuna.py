@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from ccxt.acx import acx
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import InsufficientFunds
 from ccxt.base.errors import OrderNotFound
@@ -92,7 +91,7 @@ class kuna (acx):
 
     def handle_errors(self, code, reason, url, method, headers, body):
         if code == 400:
-            response = json.loads(body)
+            response = self.parse_json(body)
             error = self.safe_value(response, 'error')
             errorCode = self.safe_integer(error, 'code')
             if errorCode == 2002:
@@ -3,7 +3,6 @@
 from ccxt.base.exchange import Exchange
 import hashlib
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import NotSupported
 from ccxt.base.errors import AuthenticationError
@@ -288,7 +287,7 @@ class livecoin (Exchange):
         result = {}
         for i in range(0, len(ids)):
             id = ids[i]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             ticker = tickers[id]
             result[symbol] = self.parse_ticker(ticker, market)
@@ -485,7 +484,7 @@ class livecoin (Exchange):
     def handle_errors(self, code, reason, url, method, headers, body):
         if code >= 300:
             if body[0] == "{":
-                response = json.loads(body)
+                response = self.parse_json(body)
                 if 'errorCode' in response:
                     error = response['errorCode']
                     if error == 1:
@@ -2,7 +2,6 @@
 
 from ccxt.base.exchange import Exchange
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import AuthenticationError
 from ccxt.base.errors import InsufficientFunds
@@ -20,6 +19,7 @@ class okcoinusd (Exchange):
             'hasCORS': False,
             'version': 'v1',
             'rateLimit': 1000,  # up to 3000 requests per 5 minutes ≈ 600 requests per minute ≈ 10 requests per second ≈ 100 ms
+            'ohlcvPageSize': 1440,  # candles per OHLCV request
             # obsolete metainfo interface
             'hasFetchOHLCV': True,
             'hasFetchOrder': True,
@@ -417,8 +417,7 @@ class okcoinusd (Exchange):
         symbol = None
         if not market:
             if 'symbol' in order:
-                if order['symbol'] in self.markets_by_id:
-                    market = self.markets_by_id[order['symbol']]
+                market = self.find_market(order['symbol'])
         if market:
             symbol = market['symbol']
         timestamp = None
@@ -596,7 +595,7 @@ class okcoinusd (Exchange):
         if len(body) < 2:
             return  # fallback to default error handler
         if body[0] == '{':
-            response = json.loads(body)
+            response = self.parse_json(body)
             if 'error_code' in response:
                 error = self.safe_string(response, 'error_code')
                 message = self.id + ' ' + self.json(response)
@@ -3,7 +3,6 @@
 from ccxt.base.exchange import Exchange
 import hashlib
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import InsufficientFunds
 from ccxt.base.errors import InvalidOrder
@@ -284,7 +283,7 @@ class poloniex (Exchange):
         result = {}
         for i in range(0, len(ids)):
             id = ids[i]
-            market = self.markets_by_id[id]
+            market = self.find_market(id)
             symbol = market['symbol']
             ticker = tickers[id]
             result[symbol] = self.parse_ticker(ticker, market)
@@ -350,9 +349,8 @@ class poloniex (Exchange):
         quote = None
         if (not market) and('currencyPair' in list(trade.keys())):
             currencyPair = trade['currencyPair']
-            if currencyPair in self.markets_by_id:
-                market = self.markets_by_id[currencyPair]
-            else:
+            market = self.find_market(currencyPair)
+            if not market:
                 parts = currencyPair.split('_')
                 quote = parts[0]
                 base = parts[1]
@@ -431,9 +429,7 @@ class poloniex (Exchange):
                 ids = list(response.keys())
                 for i in range(0, len(ids)):
                     id = ids[i]
-                    market = None
-                    if id in self.markets_by_id:
-                        market = self.markets_by_id[id]
+                    market = self.find_market(id)
                     trades = self.parse_trades(response[id], market)
                     for j in range(0, len(trades)):
                         result.append(trades[j])
@@ -514,7 +510,7 @@ class poloniex (Exchange):
             for i in range(0, len(marketIds)):
                 marketId = marketIds[i]
                 orders = response[marketId]
-                m = self.markets_by_id[marketId]
+                m = self.find_market(marketId)
                 openOrders = self.parse_open_orders(orders, m, openOrders)
         for j in range(0, len(openOrders)):
             self.orders[openOrders[j]['id']] = openOrders[j]
@@ -717,7 +713,7 @@ class poloniex (Exchange):
     def handle_errors(self, code, reason, url, method, headers, body):
         if code >= 400:
             if body[0] == '{':
-                response = json.loads(body)
+                response = self.parse_json(body)
                 if 'error' in response:
                     error = self.id + ' ' + body
                     if response['error'].find('Total must be at least') >= 0:
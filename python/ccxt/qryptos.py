@@ -2,7 +2,6 @@
 
 from ccxt.base.exchange import Exchange
 import math
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import AuthenticationError
 from ccxt.base.errors import InsufficientFunds
@@ -238,7 +237,7 @@ class qryptos (Exchange):
     def parse_order(self, order):
         timestamp = order['created_at'] * 1000
         marketId = str(order['product_id'])
-        market = self.marketsById[marketId]
+        market = self.find_market(marketId)
         status = None
         if 'status' in order:
             if order['status'] == 'live':
@@ -307,7 +306,7 @@ class qryptos (Exchange):
         response = None
         if code == 200 or code == 404 or code == 422:
             if (body[0] == '{') or (body[0] == '['):
-                response = json.loads(body)
+                response = self.parse_json(body)
             else:
                 # if not a JSON response
                 raise ExchangeError(self.id + ' returned a non-JSON reply: ' + body)
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from ccxt.base.exchange import Exchange
-import json
 from ccxt.base.errors import ExchangeError
 
 
@@ -245,7 +244,7 @@ class virwox (Exchange):
     def handle_errors(self, code, reason, url, method, headers, body):
         if code == 200:
             if (body[0] == '{') or (body[0] == '['):
-                response = json.loads(body)
+                response = self.parse_json(body)
                 if 'result' in response:
                     result = response['result']
                     if 'errorCode' in result:
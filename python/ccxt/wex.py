@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 from ccxt.liqui import liqui
-import json
 from ccxt.base.errors import ExchangeError
 from ccxt.base.errors import InsufficientFunds
 from ccxt.base.errors import OrderNotFound
@@ -108,7 +107,7 @@ class wex (liqui):
             if body[0] != '{':
                 # response is not JSON
                 raise ExchangeError(self.id + ' returned a non-JSON reply: ' + body)
-            response = json.loads(body)
+            response = self.parse_json(body)
             if 'success' in response:
                 if not response['success']:
                     error = self.safe_value(response, 'error')
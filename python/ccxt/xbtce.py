@@ -200,8 +200,8 @@ class xbtce (Exchange):
             id = ids[i]
             market = None
             symbol = None
-            if id in self.markets_by_id:
-                market = self.markets_by_id[id]
+            market = self.find_market(id)
+            if market:
                 symbol = market['symbol']
             else:
                 base = id[0:3]
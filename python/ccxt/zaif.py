@@ -170,7 +170,7 @@ class zaif (Exchange):
         id = self.safe_string(trade, 'id')
         id = self.safe_string(trade, 'tid', id)
         if not market:
-            market = self.markets_by_id[trade['currency_pair']]
+            market = self.find_market(trade['currency_pair'])
         return {
             'id': str(id),
             'info': trade,
@@ -215,7 +215,7 @@ class zaif (Exchange):
         side = 'buy' if (order['action'] == 'bid') else 'sell'
         timestamp = int(order['timestamp']) * 1000
         if not market:
-            market = self.markets_by_id[order['currency_pair']]
+            market = self.find_market(order['currency_pair'])
         price = order['price']
         amount = order['amount']
         return {
@@ -76,6 +76,16 @@ setup(
             'aiodns',
             'requests',
         ],
+        'http2': [
+            'httpx',
+            'h2',
+        ],
+        'arrays': [
+            'numpy',
+        ],
+        'orderbooks': [
+            'sortedcontainers',
+        ],
         'qa': [
             'flake8'
         ],
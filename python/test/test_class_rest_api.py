@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Parent(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(Parent, self).describe(), {
+            'id': 'parent',
+            'api': {
+                'public': {
+                    'get': [
+                        'ticker/price',
+                        'exchangeInfo',
+                    ],
+                },
+            },
+        })
+
+    def request(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return [type(self).__name__, path, api, method, params]
+
+
+class Child(Parent):
+
+    def describe(self):
+        return self.deep_extend(super(Child, self).describe(), {
+            'id': 'child',
+            'api': {
+                'private': {
+                    'post': [
+                        'order',
+                    ],
+                },
+            },
+        })
+
+
+def test_names():
+    exchange = Parent()
+    assert exchange.publicGetTickerPrice({'symbol': 'ETHBTC'}) == ['Parent', 'ticker/price', 'public', 'GET', {'symbol': 'ETHBTC'}]
+    assert exchange.public_get_ticker_price() == ['Parent', 'ticker/price', 'public', 'GET', {}]
+    assert exchange.publicGetExchangeInfo() == ['Parent', 'exchangeInfo', 'public', 'GET', {}]
+    assert exchange.public_get_exchangeinfo() == ['Parent', 'exchangeInfo', 'public', 'GET', {}]
+    assert 'publicGetTickerPrice' not in exchange.__dict__
+    assert 'public_get_ticker_price' in dir(exchange)
+    try:
+        exchange.publicGetMissing()
+        assert False
+    except AttributeError:
+        pass
+
+
+def test_subclass_table():
+    Parent()
+    child = Child()
+    assert Child.__dict__['_rest_api_methods'] is not Parent.__dict__['_rest_api_methods']
+    assert 'private_post_order' in Child.__dict__['_rest_api_methods']
+    assert 'private_post_order' not in Parent.__dict__['_rest_api_methods']
+    assert child.privatePostOrder({'side': 'buy'}) == ['Child', 'order', 'private', 'POST', {'side': 'buy'}]
+    assert child.public_get_ticker_price() == ['Child', 'ticker/price', 'public', 'GET', {}]
+    try:
+        Parent().private_post_order()
+        assert False
+    except AttributeError:
+        pass
+
+
+if __name__ == '__main__':
+    test_names()
+    test_subclass_table()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer  # Python 3
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer  # Python 2
+    from SocketServer import ThreadingMixIn
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"result":"ok"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+
+    daemon_threads = True
+
+
+def start_server():
+    server = Server(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server, 'http://127.0.0.1:' + str(server.server_address[1])
+
+
+def test_connections_are_reused():
+    server, url = start_server()
+    exchange = ccxt.Exchange({'id': 'mock'})
+    for i in range(0, 5):
+        assert exchange.fetch(url + '/ping') == {'result': 'ok'}
+    stats = exchange.connection_pool_stats()
+    host = list(stats.keys())[0]
+    assert stats[host]['requests'] == 5
+    assert stats[host]['connections'] == 1
+    assert stats[host]['reused'] == 4
+    assert stats[host]['handshakes'] == 0
+    server.shutdown()
+
+
+def test_idle_connections_expire():
+    server, url = start_server()
+    exchange = ccxt.Exchange({'id': 'mock', 'connectionPool': {'keepAliveTimeout': 1}})
+    exchange.fetch(url + '/ping')
+    threading.Event().wait(0.01)
+    exchange.fetch(url + '/ping')
+    stats = list(exchange.connection_pool_stats().values())[0]
+    assert stats['expired'] == 1
+    assert stats['connections'] == 2
+    server.shutdown()
+
+
+def test_shared_session():
+    first = ccxt.Exchange({'id': 'first', 'connectionPool': {'shared': 'test'}})
+    second = ccxt.Exchange({'id': 'second', 'connectionPool': {'shared': 'test'}})
+    third = ccxt.Exchange({'id': 'third'})
+    assert first.session is second.session
+    assert first.session is not third.session
+    assert not first.own_session and third.own_session
+
+
+if __name__ == '__main__':
+    test_connections_are_reused()
+    test_idle_connections_expire()
+    test_shared_session()
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.decoder import decoders  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Mock(ccxt.Exchange):
+
+    def handle_errors(self, code, reason, url, method, headers, body):
+        if body[0] == '{':
+            response = self.parse_json(body)
+            if 'error' in response:
+                raise ccxt.ExchangeError(response['error'])
+
+
+def test_body_is_decoded_once():
+    calls = []
+
+    def decoder(body):
+        calls.append(body)
+        return decoders['json'](body)
+
+    exchange = Mock({'id': 'mock', 'jsonDecoder': decoder})
+    body = '{"result":[1,2,3]}'
+    exchange.handle_errors(200, 'OK', 'url', 'GET', None, body)
+    assert exchange.handle_rest_response(body, 'url') == {'result': [1, 2, 3]}
+    assert len(calls) == 1
+    # another body is decoded again
+    exchange.handle_rest_response('{"result":[]}', 'url')
+    assert len(calls) == 2
+
+
+def test_decoders():
+    for name in decoders:
+        exchange = Mock({'id': 'mock', 'jsonDecoder': name})
+        assert exchange.parse_json('{"price":"0.1","amount":2}') == {'price': '0.1', 'amount': 2}
+    try:
+        Mock({'id': 'mock', 'jsonDecoder': 'missing'}).parse_json('{}')
+        assert False
+    except ImportError:
+        pass
+
+
+if __name__ == '__main__':
+    test_body_is_decoded_once()
+    test_decoders()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Mock(ccxt.Exchange):
+
+    def __init__(self, config={}):
+        super(Mock, self).__init__(config)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def fetch_markets(self):
+        return [{'id': str(i), 'symbol': 'COIN' + str(i) + '/USD', 'base': 'COIN' + str(i), 'quote': 'USD'} for i in range(0, 12)]
+
+    def fetch_order_book(self, symbol, params={}):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        if symbol == 'COIN3/USD':
+            raise ccxt.ExchangeNotAvailable(symbol)
+        return {'bids': [], 'asks': [], 'symbol': symbol}
+
+    def fetch_ticker(self, symbol, params={}):
+        raise ccxt.ExchangeNotAvailable(symbol)
+
+
+def test_fetch_order_books():
+    exchange = Mock({'id': 'mock', 'fanOutConcurrency': 3})
+    order_books = exchange.fetch_order_books()
+    assert len(order_books) == 11
+    assert order_books['COIN0/USD']['symbol'] == 'COIN0/USD'
+    assert list(order_books.errors.keys()) == ['COIN3/USD']
+    assert exchange.max_in_flight == 3
+
+
+def test_everything_failed():
+    exchange = Mock({'id': 'mock'})
+    try:
+        exchange.fetch_tickers(['COIN1/USD', 'COIN2/USD'])
+        assert False
+    except ccxt.ExchangeNotAvailable as e:
+        assert str(e) == 'COIN1/USD'
+
+
+def test_concurrent_calls_keep_their_own_errors():
+    exchange = Mock({'id': 'mock'})
+    results = {}
+
+    def fetch(name, symbols):
+        results[name] = exchange.fetch_order_books(symbols)
+
+    threads = [
+        threading.Thread(target=fetch, args=('failing', ['COIN3/USD', 'COIN1/USD'])),
+        threading.Thread(target=fetch, args=('fine', ['COIN4/USD', 'COIN5/USD'])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert list(results['failing'].keys()) == ['COIN1/USD']
+    assert list(results['failing'].errors.keys()) == ['COIN3/USD']
+    assert sorted(results['fine'].keys()) == ['COIN4/USD', 'COIN5/USD']
+    assert results['fine'].errors == {}
+
+
+def test_emulations_in_has():
+    exchange = Mock({'id': 'mock'})
+    assert exchange.has['fetchOrderBooks'] == 'emulated'
+    assert exchange.has['fetchTickers'] == 'emulated'
+
+
+def test_fetch_tickers_requires_symbols():
+    exchange = Mock({'id': 'mock'})
+    try:
+        exchange.fetch_tickers()
+        assert False
+    except ccxt.NotSupported:
+        pass
+
+
+if __name__ == '__main__':
+    test_fetch_order_books()
+    test_everything_failed()
+    test_concurrent_calls_keep_their_own_errors()
+    test_emulations_in_has()
+    test_fetch_tickers_requires_symbols()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def test_find_market():
+    exchange = ccxt.Exchange()
+    assert exchange.find_market('BTC_USD') is None
+    exchange.set_markets([
+        {'id': 'XXBTZUSD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'baseId': 'XXBT', 'quoteId': 'ZUSD', 'altname': 'XBTUSD'},
+        {'id': 'btceur', 'symbol': 'BTC/EUR', 'base': 'BTC', 'quote': 'EUR'},
+    ])
+    btcusd = exchange.markets['BTC/USD']
+    for id in ['XXBTZUSD', 'xxbtzusd', 'XBTUSD', 'xbtusd', 'BTC/USD', 'BTCUSD', 'btc_usd', 'BTC-USD', 'XXBT_ZUSD']:
+        assert exchange.find_market(id) is btcusd
+    assert exchange.find_market('BTCEUR') is exchange.markets['BTC/EUR']
+    assert exchange.find_market('ETHUSD') is None
+
+
+def test_find_market_exact_id_wins():
+    exchange = ccxt.Exchange()
+    exchange.set_markets([
+        {'id': 'ab_c', 'symbol': 'AB/C', 'base': 'AB', 'quote': 'C'},
+        {'id': 'ABC', 'symbol': 'A/BC', 'base': 'A', 'quote': 'BC'},
+    ])
+    assert exchange.find_market('ABC') is exchange.markets['A/BC']
+    assert exchange.find_market('ab_c') is exchange.markets['AB/C']
+
+
+def test_find_market_ambiguous_forms():
+    exchange = ccxt.Exchange()
+    exchange.set_markets([
+        {'id': 'AB-C', 'symbol': 'AB/C', 'base': 'AB', 'quote': 'C'},
+        {'id': 'A-BC', 'symbol': 'A/BC', 'base': 'A', 'quote': 'BC'},
+        {'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'},
+        {'id': 'BTCUSD', 'symbol': 'BTC/USD.d', 'base': 'BTC', 'quote': 'USD'},
+    ])
+    for id in ['ABC', 'abc', 'BTC-USD', 'btc_usd']:
+        assert exchange.find_market(id) is None
+    assert exchange.find_market('AB_C') is exchange.markets['AB/C']
+    assert exchange.find_market('a_bc') is exchange.markets['A/BC']
+    # the exact ids and symbols still find their markets
+    assert exchange.find_market('btcusd') is exchange.markets['BTC/USD']
+    assert exchange.find_market('BTCUSD') is exchange.markets['BTC/USD.d']
+    assert exchange.find_market('BTC/USD') is exchange.markets['BTC/USD']
+    assert exchange.find_market('BTC/USD.d') is exchange.markets['BTC/USD.d']
+    assert exchange.find_market('btc/usd') is None
+
+
+if __name__ == '__main__':
+    test_find_market()
+    test_find_market_exact_id_wins()
+    test_find_market_ambiguous_forms()
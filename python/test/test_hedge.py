@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+import os
+import sys
+
+import pytest
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+try:
+    exchange_module = importlib.import_module('ccxt.async.base.exchange')
+    transport_module = importlib.import_module('ccxt.async.base.transport')
+except SyntaxError:
+    # ccxt.async can not be imported since async became a reserved word in Python 3.7
+    exchange_module = None
+
+requires_async = pytest.mark.skipif(exchange_module is None, reason='ccxt.async can not be imported')
+
+# ------------------------------------------------------------------------------
+
+
+def run(delays, config={}, prepare=None):
+    """Fetches one ticker through a transport that answers the n-th request after delays[n] seconds"""
+    loop = asyncio.new_event_loop()
+    calls = []
+
+    class Delayed(transport_module.Transport):
+
+        async def request(self, method, url, headers=None, body=None, timeout=None, proxy=None):
+            index = len(calls)
+            calls.append('sent')
+            try:
+                await asyncio.sleep(delays[index])
+            except asyncio.CancelledError:
+                calls[index] = 'cancelled'
+                raise
+            calls[index] = 'answered'
+            return 200, {}, '{"attempt":' + str(index) + '}'
+
+    exchange = exchange_module.Exchange(exchange_module.Exchange.deep_extend({
+        'id': 'mock',
+        'asyncio_loop': loop,
+        'transport': Delayed(),
+        'urls': {'api': 'https://api.example.com'},
+        'api': {'public': {'get': ['ticker']}},
+        'hedgeRequests': {'enabled': True, 'delay': 50},
+    }, config))
+    exchange.sign = lambda path, api='public', method='GET', params={}, headers=None, body=None: {
+        'url': exchange.urls['api'] + '/' + path,
+        'method': method,
+        'headers': headers,
+        'body': body,
+    }
+    if prepare:
+        prepare(exchange)
+
+    async def fetch():
+        response = await exchange.public_get_ticker()
+        await asyncio.sleep(0.01)  # lets the cancelled attempt finish
+        await exchange.close()
+        return response
+
+    response = loop.run_until_complete(fetch())
+    loop.close()
+    return response, calls, exchange
+
+
+@requires_async
+def test_hedge_delay():
+    loop = asyncio.new_event_loop()
+    exchange = exchange_module.Exchange({'asyncio_loop': loop, 'hedgeRequests': {'minSamples': 20, 'delay': 500}})
+    exchange.hedge_latencies.extend(range(1, 11))
+    assert exchange.hedge_delay() == 500  # not enough samples yet
+    exchange.hedge_latencies.extend(range(11, 101))
+    assert exchange.hedge_delay() == 96  # the 95th percentile
+    exchange.hedge_latencies.clear()
+    exchange.hedge_latencies.extend([1] * 100)
+    assert exchange.hedge_delay() == exchange.hedgeRequests['minDelay']
+    loop.run_until_complete(exchange.close())
+    loop.close()
+
+
+@requires_async
+def test_fast_response_is_not_hedged():
+    response, calls, exchange = run([0.001])
+    assert response == {'attempt': 0}
+    assert calls == ['answered']
+    assert exchange.hedge_stats == {'requests': 1, 'hedged': 0, 'hedgeWon': 0}
+
+
+@requires_async
+def test_first_response_wins():
+    # the first attempt answers after the hedge was sent but before it
+    response, calls, exchange = run([0.1, 0.3])
+    assert response == {'attempt': 0}
+    assert calls == ['answered', 'cancelled']
+    assert exchange.hedge_stats == {'requests': 1, 'hedged': 1, 'hedgeWon': 0}
+
+
+@requires_async
+def test_hedge_wins_and_cancels_the_first_attempt():
+    response, calls, exchange = run([0.5, 0.01])
+    assert response == {'attempt': 1}
+    assert calls == ['cancelled', 'answered']
+    assert exchange.hedge_stats == {'requests': 1, 'hedged': 1, 'hedgeWon': 1}
+
+
+@requires_async
+def test_hedge_takes_the_cost_and_priority_of_the_request():
+    tokens = []
+
+    def prepare(exchange):
+
+        def recorder(bucket):
+            def acquire(cost, priority=0):
+                tokens.append((bucket, cost, priority))
+                future = asyncio.Future(loop=exchange.asyncio_loop)
+                future.set_result(None)
+                return future
+            return acquire
+
+        exchange.throttles = dict((bucket, recorder(bucket)) for bucket in exchange.throttles)
+        exchange.request_cost = lambda path, api='public', method='GET', params={}: {'default': 3, 'orders': 2}
+
+    response, calls, exchange = run([0.5, 0.01], {'enableRateLimit': True, 'rateLimits': {'orders': {'rateLimit': 100}}}, prepare)
+    assert response == {'attempt': 1}
+    assert sorted(tokens) == [('default', 3, 1), ('default', 3, 1), ('orders', 2, 1), ('orders', 2, 1)]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
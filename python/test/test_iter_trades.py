@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import warnings
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# three trades in every millisecond from 0 to 10, so that the pages end in the middle of a millisecond
+history = [{'id': str(i), 'timestamp': i // 3, 'price': 1.0, 'amount': 1.0} for i in range(0, 30)]
+
+
+def fetch(requests, since, limit, strict=True, history=history):
+    requests.append(since)
+    if since is None:
+        trades = history[-(limit or 4):]
+    else:
+        trades = [trade for trade in history if (trade['timestamp'] > since if strict else trade['timestamp'] >= since)]
+    return list(reversed(trades[0:limit or 4]))  # newest first like many exchanges
+
+
+class Mock(ccxt.Exchange):
+
+    def __init__(self, config={}):
+        super(Mock, self).__init__(config)
+        self.requests = []
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return fetch(self.requests, since, limit)
+
+    def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        return fetch(self.requests, since, limit, False)
+
+
+def ids(trades):
+    trades = list(trades)
+    assert trades == sorted(trades, key=lambda trade: trade['timestamp'])
+    return sorted(int(trade['id']) for trade in trades)
+
+
+def test_iter_trades():
+    exchange = Mock()
+    trades = exchange.iter_trades('BTC/USD', -1)
+    first = next(trades)
+    assert first['timestamp'] == 0
+    assert exchange.requests == [-1]  # lazy
+    assert sorted(ids(trades) + ids([first])) == list(range(0, 30))
+    assert exchange.requests == [-1, 0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 9]
+    assert ids(exchange.iter_my_trades('BTC/USD', 0)) == list(range(0, 30))
+    assert ids(Mock({'tradesPageSize': 7}).iter_trades('BTC/USD', 4)) == list(range(15, 30))
+    assert ids(exchange.iter_trades('BTC/USD', -1, 10)) == list(range(0, 10))
+    assert ids(exchange.iter_trades('BTC/USD')) == list(range(26, 30))
+
+
+def test_trades_without_ids():
+    exchange = Mock()
+    cursor = exchange.trade_history_cursor()
+    trades = [{'id': None, 'timestamp': 5, 'price': price, 'amount': 1.0} for price in (1.0, 2.0)]
+    assert exchange.add_trade_history_page(cursor, trades[0:1]) == trades[0:1]
+    assert exchange.add_trade_history_page(cursor, trades) == trades[1:2]
+    assert cursor['since'] == 4
+    assert exchange.add_trade_history_page(cursor, trades) == []
+    assert cursor['since'] == 5 and not cursor['done']  # fetched again from the last millisecond
+    assert exchange.add_trade_history_page(cursor, trades) == []
+    assert cursor['done']
+
+
+def test_crowded_millisecond():
+    # 20 trades at 10 do not fit in the pages of 5, the trades of that millisecond after the first page are skipped
+    crowded = [{'id': str(i), 'timestamp': 10 if i < 20 else i - 9, 'price': 1.0, 'amount': 1.0} for i in range(0, 25)]
+
+    class Crowded(ccxt.Exchange):
+
+        requests = []
+
+        def fetch_trades(self, symbol, since=None, limit=None, params={}):
+            return fetch(self.requests, since, limit, True, crowded)
+
+        def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+            return fetch(self.requests, since, limit, False, crowded)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        assert ids(Crowded({'tradesPageSize': 5}).iter_trades('BTC/USD', 0)) == list(range(0, 5)) + list(range(20, 25))
+        assert ids(Crowded({'tradesPageSize': 5}).iter_my_trades('BTC/USD', 0)) == list(range(0, 5)) + list(range(20, 25))
+    assert len(caught) == 2
+    assert Crowded.requests == [0, 9, 10, 14, 15, 0, 9, 10, 11, 14, 15]
+
+
+if __name__ == '__main__':
+    test_iter_trades()
+    test_trades_without_ids()
+    test_crowded_millisecond()
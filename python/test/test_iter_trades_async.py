@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+import os
+import sys
+
+import pytest
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from test_iter_trades import fetch, ids  # noqa: E402
+
+try:
+    exchange_module = importlib.import_module('ccxt.async.base.exchange')
+except SyntaxError:
+    # ccxt.async can not be imported since async became a reserved word in Python 3.7
+    exchange_module = None
+
+requires_async = pytest.mark.skipif(exchange_module is None, reason='ccxt.async can not be imported')
+
+# ------------------------------------------------------------------------------
+
+
+async def collect(trades):
+    # no asynchronous comprehension, Python 3.5 has none
+    result = []
+    while True:
+        try:
+            result.append(await trades.__anext__())
+        except StopAsyncIteration:
+            return result
+
+
+@requires_async
+def test_async_iter_trades():
+
+    class Mock(exchange_module.Exchange):
+
+        requests = []
+
+        async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+            return fetch(self.requests, since, limit)
+
+    loop = asyncio.new_event_loop()
+    exchange = Mock({'tradesPageSize': 5, 'asyncio_loop': loop})
+    try:
+        assert ids(loop.run_until_complete(collect(exchange.iter_trades('BTC/USD', 1, 20)))) == list(range(6, 26))
+    finally:
+        loop.run_until_complete(exchange.close())
+        loop.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
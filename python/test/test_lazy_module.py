@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import inspect
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.binance  # noqa: E402
+import ccxt.wex  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def test_submodule_imports():
+    # the names of the exchanges stay bound to the classes after their submodules are imported
+    assert inspect.isclass(ccxt.binance) and ccxt.binance.__name__ == 'binance'
+    assert inspect.isclass(ccxt.wex) and issubclass(ccxt.wex, ccxt.liqui)
+    assert inspect.isclass(ccxt.liqui)
+    assert inspect.isclass(getattr(ccxt, 'kraken'))
+    assert ccxt.binance().id == 'binance'
+    assert 'binance' in dir(ccxt)
+
+
+def test_unknown_name():
+    try:
+        ccxt.missing
+        assert False
+    except AttributeError:
+        pass
+
+
+if __name__ == '__main__':
+    test_submodule_imports()
+    test_unknown_name()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+from decimal import Decimal
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import order_book as order_book_module  # noqa: E402
+from ccxt.base.order_book import LocalOrderBook  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Mock(ccxt.Exchange):
+
+    snapshots = [
+        {'bids': [[100.0, 1.0], [99.0, 2.0], [98.0, 3.0]], 'asks': [[101.0, 1.0], [102.0, 2.0]], 'nonce': 1},
+        {'bids': [[100.0, 1.0], [99.5, 0.5], [98.0, 1.0]], 'asks': [[101.0, 1.0], [102.0, 2.0], [103.0, 4.0]], 'nonce': 2},
+        {'bids': [[200.0, 1.0]], 'asks': [], 'nonce': 1},
+    ]
+
+    def fetch_order_book(self, symbol, params={}):
+        return self.snapshots.pop(0)
+
+
+def test_local_order_book():
+    exchange = Mock()
+    book = exchange.update_order_book('BTC/USD')
+    assert exchange.orderbooks['BTC/USD'] is book
+    assert book.best_bid() == [100.0, 1.0] and book.best_ask() == [101.0, 1.0]
+    changes = book.apply(exchange.fetch_order_book('BTC/USD'))
+    assert sorted(changes['bids']) == [[98.0, 1.0], [99.0, 0.0], [99.5, 0.5]]
+    assert changes['asks'] == [[103.0, 4.0]]
+    assert book.order_book() == {
+        'bids': [[100.0, 1.0], [99.5, 0.5], [98.0, 1.0]],
+        'asks': [[101.0, 1.0], [102.0, 2.0], [103.0, 4.0]],
+        'timestamp': None,
+        'datetime': None,
+        'nonce': 2,
+    }
+    assert book.bids.amount_at(99.5) == 0.5 and book.bids.amount_at(99.0) == 0.0
+    # stale snapshots are ignored
+    assert exchange.update_order_book('BTC/USD').best_bid() == [100.0, 1.0]
+    assert book.vwap('buy', 2.0) == 101.5
+    assert book.vwap('sell', 1.5) == (100.0 + 0.5 * 99.5) / 1.5
+    assert book.vwap('buy', 100.0) is None
+
+
+def test_local_order_book_updates():
+    book = LocalOrderBook()
+    assert book.best_bid() is None
+    book.update([[10.0, 1.0], [11.0, 2.0]], [[12.0, 1.0]], 5)
+    book.update([[11.0, 0.0]], [[11.5, 3.0]], 6)
+    assert book.order_book(1)['bids'] == [[10.0, 1.0]] and book.best_ask() == [11.5, 3.0]
+    assert book.update([[9.0, 1.0]], [], 6) is None
+    assert len(book.bids) == 1
+
+
+def test_local_order_book_without_sortedcontainers():
+    sorted_list = order_book_module.SortedList
+    order_book_module.SortedList = None
+    try:
+        test_local_order_book_updates()
+        assert type(LocalOrderBook().bids.keys) is list
+    finally:
+        order_book_module.SortedList = sorted_list
+
+
+def test_local_order_book_number_types():
+    for number in [Decimal, str]:
+        exchange = Mock({'number': number})
+        exchange.snapshots = [{'bids': [['99.5', '2'], ['100.0', '1'], ['9.5', '1']], 'asks': [['101', '1.5'], ['102', '2']], 'nonce': 1}]
+        book = exchange.update_order_book('BTC/USD')
+        assert book.best_bid() == [exchange.to_number('100.0'), exchange.to_number('1')]
+        # sorted by value, not as strings
+        assert [price for price, amount in book.order_book()['bids']] == [exchange.to_number(price) for price in ['100.0', '99.5', '9.5']]
+        assert book.vwap('buy', '2') == exchange.to_number('101.25')
+        book.update([['100.0', '0']], [['101', 0]])
+        assert book.best_bid()[0] == exchange.to_number('99.5') and book.best_ask()[0] == exchange.to_number('102')
+        # the same price written with other digits is the same level
+        book.update([['99.50', '3']], [['102.0', '0']])
+        assert book.order_book()['bids'][0] == [exchange.to_number('99.5'), exchange.to_number('3')]
+        assert len(book.bids) == 2 and len(book.asks) == 0
+
+
+if __name__ == '__main__':
+    test_local_order_book()
+    test_local_order_book_updates()
+    test_local_order_book_without_sortedcontainers()
+    test_local_order_book_number_types()
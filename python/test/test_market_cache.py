@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import sys
+import tempfile
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.market_cache import market_cache  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Mock(ccxt.Exchange):
+
+    fetched = 0
+
+    def describe(self):
+        return self.deep_extend(super(Mock, self).describe(), {
+            'id': 'cachemock',
+            'urls': {'api': 'https://api.example.com'},
+            'fees': {'trading': {'maker': 0.001, 'taker': 0.002}},
+        })
+
+    def fetch_markets(self):
+        Mock.fetched += 1
+        return [{'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'}]
+
+
+def test_market_cache_in_process():
+    market_cache.invalidate()
+    Mock.fetched = 0
+    first = Mock({'marketCache': {'enabled': True}})
+    second = Mock({'marketCache': {'enabled': True}, 'fees': {'trading': {'taker': 0.005}}})
+    first.load_markets()
+    second.load_markets()
+    assert Mock.fetched == 1
+    # every instance applies set_markets() to the cached markets with its own fees
+    assert first.markets is not second.markets
+    assert first.market('BTC/USD')['taker'] == 0.002 and second.market('BTC/USD')['taker'] == 0.005
+    # expired entries are fetched again
+    expiring = Mock({'marketCache': {'enabled': True, 'ttl': 0}})
+    market_cache.entries[expiring.market_cache_key()]['timestamp'] -= 10
+    expiring.load_markets()
+    assert Mock.fetched == 2
+    # explicit invalidation
+    first.invalidate_markets()
+    Mock({'marketCache': {'enabled': True}}).load_markets()
+    assert Mock.fetched == 3
+    # instances that don't opt in never use the cache
+    Mock().load_markets()
+    assert Mock.fetched == 4
+
+
+def test_market_cache_on_disk():
+    path = tempfile.mkdtemp()
+    try:
+        market_cache.invalidate()
+        Mock.fetched = 0
+        config = {'marketCache': {'enabled': True, 'path': path}}
+        Mock(config).load_markets()
+        assert os.listdir(path) == [Mock().market_cache_key() + '.json']
+        # another process starts with an empty in-process cache
+        market_cache.invalidate()
+        exchange = Mock(config)
+        exchange.load_markets()
+        assert Mock.fetched == 1
+        assert exchange.markets_by_id['btcusd']['symbol'] == 'BTC/USD'
+        assert exchange.currencies['BTC']['code'] == 'BTC'
+        exchange.invalidate_markets()
+        assert os.listdir(path) == []
+    finally:
+        shutil.rmtree(path)
+
+
+def test_config_markets_take_precedence():
+    market_cache.invalidate()
+    Mock.fetched = 0
+    Mock({'sharedMetadata': True}).load_markets()
+    Mock({'marketCache': {'enabled': True}}).load_markets()
+    markets = {'ETH/USD': {'id': 'ethusd', 'symbol': 'ETH/USD', 'base': 'ETH', 'quote': 'USD'}}
+    for config in [{'sharedMetadata': True}, {'marketCache': {'enabled': True}}]:
+        exchange = Mock(ccxt.Exchange.extend(config, {'markets': markets}))
+        exchange.load_markets()
+        assert exchange.symbols == ['ETH/USD']
+    assert Mock.fetched == 1
+    # the markets of the config are not stored for the other instances
+    exchange = Mock({'marketCache': {'enabled': True}})
+    exchange.load_markets()
+    assert exchange.symbols == ['BTC/USD']
+
+
+if __name__ == '__main__':
+    test_market_cache_in_process()
+    test_market_cache_on_disk()
+    test_config_markets_take_precedence()
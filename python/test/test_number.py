@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+from decimal import Decimal
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.numeric_string import NumericString  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+market = {'id': 'ETHBTC', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC', 'taker': 0.001, 'maker': 0.001, 'precision': {'price': 8, 'amount': 3}}
+
+order = '{"symbol":"ETHBTC","orderId":1,"time":1500000000000,"status":"PARTIALLY_FILLED","type":"LIMIT","side":"BUY","price":"0.10000000","origQty":"3.00000000","executedQty":"1.10000000"}'
+
+trade = '{"a":1,"p":"0.10000000","q":"0.30000000","T":1500000000000,"m":true,"commission":"0.00030000","commissionAsset":"ETH"}'
+
+body = '{"price":"0.1","bids":[[0.30000000000000004,"1.10"],["0.2",2]],"last":0.1}'
+
+
+def parse(number):
+    exchange = ccxt.Exchange({'id': 'mock', 'number': number})
+    response = exchange.parse_json(body)
+    return exchange.safe_float(response, 'price'), exchange.safe_float(response, 'last'), exchange.parse_order_book(response)['bids']
+
+
+def test_float():
+    assert parse(float) == (0.1, 0.1, [[0.30000000000000004, 1.1], [0.2, 2.0]])
+
+
+def test_decimal():
+    price, last, bids = parse(Decimal)
+    assert (price, last) == (Decimal('0.1'), Decimal('0.1'))
+    assert bids == [[Decimal('0.30000000000000004'), Decimal('1.10')], [Decimal('0.2'), Decimal('2')]]
+    assert ccxt.Exchange.sum(bids[0][1], bids[1][1]) == Decimal('3.10')
+
+
+def test_string():
+    assert parse(str) == ('0.1', '0.1', [['0.30000000000000004', '1.10'], ['0.2', '2']])
+
+
+def binance(number):
+    exchange = ccxt.binance({'number': number})
+    exchange.set_markets([market])
+    return exchange
+
+
+def test_decimal_parsers():
+    exchange = binance(Decimal)
+    parsed = exchange.parse_order(exchange.parse_json(order), exchange.markets['ETH/BTC'])
+    assert (parsed['price'], parsed['amount'], parsed['filled']) == (Decimal('0.10000000'), Decimal('3.00000000'), Decimal('1.10000000'))
+    assert parsed['remaining'] == Decimal('1.9') and parsed['cost'] == Decimal('0.3')
+    parsed = exchange.parse_trade(exchange.parse_json(trade), exchange.markets['ETH/BTC'])
+    assert (parsed['price'], parsed['amount'], parsed['fee']['cost']) == (Decimal('0.1'), Decimal('0.3'), Decimal('0.0003'))
+    assert type(parsed['cost']) is Decimal and parsed['cost'] == Decimal('0.03')
+
+
+def test_decimal_fees():
+    exchange = binance(Decimal)
+    fee = exchange.calculate_fee('ETH/BTC', 'limit', 'sell', Decimal('3'), Decimal('0.1'))
+    assert (fee['rate'], fee['cost'], fee['currency']) == (Decimal('0.001'), Decimal('0.0003'), 'BTC')
+    fee = ccxt.Exchange.calculate_fee(exchange, 'ETH/BTC', 'limit', 'buy', Decimal('3'), Decimal('0.1'))
+    assert (fee['rate'], fee['cost']) == (Decimal('0.001'), Decimal('0.0003'))
+    assert binance(float).calculate_fee('ETH/BTC', 'limit', 'sell', 3, 0.1)['cost'] == 0.0003
+
+
+def test_string_arithmetic():
+    exchange = binance(str)
+    parsed = exchange.parse_order(exchange.parse_json(order), exchange.markets['ETH/BTC'])
+    assert (parsed['price'], parsed['remaining'], parsed['cost']) == ('0.10000000', '1.90000000', '0.3000000000000000')
+    assert parsed['remaining'] > 1 and float(parsed['cost']) == 0.3
+    bids = parse(str)[2]
+    assert ccxt.Exchange.sum(bids[0][1], bids[1][1]) == '3.10'
+    assert sorted([bid[0] for bid in bids]) == ['0.2', '0.30000000000000004']
+
+
+def test_string_equality():
+    five, one = NumericString('5'), NumericString('1.10')
+    assert five == 5 and five == Decimal('5.0') and five == 5.0 and not (five != 5)
+    assert one == NumericString('1.1') and one == 1.1 and one != 1.2
+    # a plain str compares as a string
+    assert one == '1.10' and one != '1.1'
+    assert len(set([one, NumericString('1.1'), Decimal('1.1')])) == 1
+    assert {five: True}.get(5) and hash(five) == hash(5)
+
+
+def test_unbound_safe_float():
+    assert ccxt.Exchange.safe_float({'price': '0.1'}, 'price') == 0.1
+    assert ccxt.Exchange.safe_float({}, 'price', 1) == 1.0
+    assert ccxt.Exchange.safe_float({}, 'price') is None
+
+
+if __name__ == '__main__':
+    test_float()
+    test_decimal()
+    test_string()
+    test_decimal_parsers()
+    test_decimal_fees()
+    test_string_arithmetic()
+    test_string_equality()
+    test_unbound_safe_float()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import ohlcv as ohlcv_module  # noqa: E402
+from ccxt.base.ohlcv import OHLCVArray  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+rows = [[i * 60000, i + 0.5, i + 1.0, float(i), i + 0.25, 10.0] for i in range(0, 100)]
+
+
+class Mock(ccxt.Exchange):
+
+    def parse_ohlcv(self, ohlcv, market=None, timeframe='1m', since=None, limit=None):
+        return [ohlcv['t'], ohlcv['o'], ohlcv['h'], ohlcv['l'], ohlcv['c'], ohlcv['v']]
+
+
+def test_parse_ohlcvs_arrays():
+    lists = ccxt.Exchange()
+    arrays = ccxt.Exchange({'ohlcvArrays': True})
+    for since, limit in [(None, None), (30 * 60000, None), (30 * 60000 + 1, 5), (None, 10), (10 ** 10, 1)]:
+        result = arrays.parse_ohlcvs(rows, None, '1m', since, limit)
+        assert isinstance(result, OHLCVArray)
+        assert result == lists.parse_ohlcvs(rows, None, '1m', since, limit)
+    # the candles are sorted by time
+    assert arrays.parse_ohlcvs(list(reversed(rows))) == rows
+    # the parse_ohlcv() of the exchange is applied
+    mock = Mock({'ohlcvArrays': True})
+    result = mock.parse_ohlcvs([{'t': 60000, 'o': '1', 'h': '2', 'l': '0.5', 'c': '1.5', 'v': None}])
+    assert result[0][0:5] == [60000, 1.0, 2.0, 0.5, 1.5] and result[0][5] != result[0][5]
+
+
+def test_ohlcv_array():
+    ohlcvs = OHLCVArray.from_rows(rows)
+    assert len(ohlcvs) == 100 and ohlcvs[-1] == rows[-1]
+    assert ohlcvs[10:20] == rows[10:20] and isinstance(ohlcvs[10:20], OHLCVArray)
+    assert list(ohlcvs)[5] == rows[5]
+    assert ohlcvs.index(50 * 60000) == 50 and ohlcvs.index(50 * 60000 + 1) == 51
+    assert ohlcvs.timestamps.itemsize == 8 and ohlcvs.closes.typecode == 'd'
+    # the columns support the buffer protocol
+    if sys.version_info[0] < 3:
+        assert len(bytes(buffer(ohlcvs.closes))) == 800  # noqa: F821
+    else:
+        assert len(memoryview(ohlcvs.closes).tobytes()) == 800
+
+
+def test_float_timestamps():
+    # the type of the timestamps on the Python 2 builds without a 64 bit array type
+    timestamp_type = ohlcv_module.timestamp_type
+    ohlcv_module.timestamp_type = 'd'
+    try:
+        ohlcvs = OHLCVArray.from_rows(rows)
+        assert ohlcvs.timestamps.typecode == 'd'
+        assert ohlcvs.to_list() == rows and ohlcvs[3] == rows[3]
+        assert type(ohlcvs[3][0]) is int and type(list(ohlcvs)[3][0]) is int
+        assert ohlcvs.resample('5m')[0] == [0, rows[0][1], max(row[2] for row in rows[0:5]), min(row[3] for row in rows[0:5]), rows[4][4], sum(row[5] for row in rows[0:5])]
+    finally:
+        ohlcv_module.timestamp_type = timestamp_type
+
+
+if __name__ == '__main__':
+    test_parse_ohlcvs_arrays()
+    test_ohlcv_array()
+    test_float_timestamps()
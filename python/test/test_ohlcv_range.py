@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+minute = 60000
+
+
+class Mock(ccxt.Exchange):
+
+    # candles every minute from 0 to 100 minutes, with a gap from 40 to 60 minutes
+    history = [[i * minute, i, i, i, i, 1.0] for i in range(0, 100) if not (40 <= i < 60)]
+    fail_at = None
+    overlap = 0
+    windowed = False  # returns the candles of the page size from since, like kucoin
+    capacity = None   # the most candles the exchange returns whatever the limit
+
+    def __init__(self, config={}):
+        super(Mock, self).__init__(config)
+        self.requests = []
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        self.requests.append(since)
+        if since == self.fail_at:
+            self.fail_at = None
+            raise ccxt.RequestTimeout('timeout')
+        ohlcvs = [ohlcv for ohlcv in self.history if ohlcv[0] >= since - self.overlap * minute]
+        if self.windowed:
+            ohlcvs = [ohlcv for ohlcv in ohlcvs if ohlcv[0] < since + limit * minute]
+        return ohlcvs[0:min(limit or 15, self.capacity or 15)]
+
+
+def test_parse_timeframe():
+    assert Mock.parse_timeframe('1m') == 60
+    assert Mock.parse_timeframe('4h') == 4 * 3600
+    assert Mock.parse_timeframe('1M') == 30 * 86400
+
+
+def test_fetch_ohlcv_range():
+    exchange = Mock({'ohlcvPageSize': 10})
+    ohlcvs = exchange.fetch_ohlcv_range('BTC/USD', '1m', 5 * minute, 95 * minute)
+    assert [ohlcv[1] for ohlcv in ohlcvs] == [i for i in range(5, 95) if not (40 <= i < 60)]
+    # every page starts after the last candle of the previous one, the gap is inside a page
+    assert exchange.requests == [m * minute for m in [5, 15, 25, 35, 65, 75, 85]]
+
+
+def test_fetch_ohlcv_range_windows():
+    exchange = Mock({'ohlcvPageSize': 10})
+    exchange.windowed = True
+    ohlcvs = exchange.fetch_ohlcv_range('BTC/USD', '1m', 5 * minute, 95 * minute)
+    assert [ohlcv[1] for ohlcv in ohlcvs] == [i for i in range(5, 95) if not (40 <= i < 60)]
+    # the short page before the gap is continued, the empty pages of the gap are skipped one page size at a time
+    assert exchange.requests == [m * minute for m in [5, 15, 25, 35, 40, 50, 60, 70, 80, 90]]
+
+
+def test_fetch_ohlcv_range_capped_pages():
+    # the exchange returns 6 candles where 10 were asked, the pages follow each other without holes
+    exchange = Mock({'ohlcvPageSize': 10})
+    exchange.capacity = 6
+    ohlcvs = exchange.fetch_ohlcv_range('BTC/USD', '1m', 0, 30 * minute)
+    assert [ohlcv[1] for ohlcv in ohlcvs] == list(range(0, 30))
+    assert exchange.requests == [m * minute for m in [0, 6, 12, 18, 24]]
+
+
+def test_fetch_ohlcv_range_overlapping_pages():
+    exchange = Mock({'ohlcvPageSize': 10})
+    exchange.overlap = 1
+    ohlcvs = exchange.fetch_ohlcv_range('BTC/USD', '1m', 5 * minute, 95 * minute)
+    assert [ohlcv[1] for ohlcv in ohlcvs] == [i for i in range(5, 95) if not (40 <= i < 60)]
+
+
+def test_fetch_ohlcv_range_without_page_size():
+    exchange = Mock()
+    ohlcvs = exchange.fetch_ohlcv_range('BTC/USD', '1m', 0, 200 * minute)
+    assert len(ohlcvs) == 80 and ohlcvs[-1][0] == 99 * minute
+
+
+def test_fetch_ohlcv_range_resume():
+    exchange = Mock({'ohlcvPageSize': 10})
+    exchange.fail_at = 25 * minute
+    checkpoint = {}
+    try:
+        exchange.fetch_ohlcv_range('BTC/USD', '1m', 5 * minute, 95 * minute, {}, checkpoint)
+        assert False
+    except ccxt.RequestTimeout:
+        pass
+    assert checkpoint['since'] == 25 * minute and len(checkpoint['ohlcvs']) == 20
+    exchange.requests = []
+    ohlcvs = exchange.fetch_ohlcv_range('BTC/USD', '1m', params={}, checkpoint=checkpoint)
+    assert exchange.requests[0] == 25 * minute
+    assert len(ohlcvs) == 70
+
+
+if __name__ == '__main__':
+    test_parse_timeframe()
+    test_fetch_ohlcv_range()
+    test_fetch_ohlcv_range_windows()
+    test_fetch_ohlcv_range_capped_pages()
+    test_fetch_ohlcv_range_overlapping_pages()
+    test_fetch_ohlcv_range_without_page_size()
+    test_fetch_ohlcv_range_resume()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+import os
+import sys
+
+import pytest
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from test_ohlcv_range import Mock as SyncMock  # noqa: E402
+from test_resample_ohlcv import Minutely  # noqa: E402
+
+try:
+    exchange_module = importlib.import_module('ccxt.async.base.exchange')
+except SyntaxError:
+    # ccxt.async can not be imported since async became a reserved word in Python 3.7
+    exchange_module = None
+
+requires_async = pytest.mark.skipif(exchange_module is None, reason='ccxt.async can not be imported')
+
+# ------------------------------------------------------------------------------
+
+minute = 60000
+
+# candles every minute from 0 to 100 minutes, with a gap from 40 to 60 minutes
+history = [[i * minute, i, i, i, i, 1.0] for i in range(0, 100) if not (40 <= i < 60)]
+
+
+def fetch_range(config, capacity=None, latest_only=False):
+    """capacity is the number of candles the exchange really returns per request, latest_only
+    returns the latest candles from the end of the history whatever the since, like kraken"""
+    loop = asyncio.new_event_loop()
+    requests = []
+
+    class Mock(exchange_module.Exchange):
+
+        async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+            requests.append(since)
+            count = capacity or limit
+            if latest_only:
+                return [ohlcv for ohlcv in history[-count:] if ohlcv[0] >= since]
+            return [ohlcv for ohlcv in history if ohlcv[0] >= since][0:count]
+
+    exchange = Mock(exchange_module.Exchange.extend({'id': 'mock', 'asyncio_loop': loop}, config))
+    try:
+        ohlcvs = loop.run_until_complete(exchange.fetch_ohlcv_range('BTC/USD', '1m', 5 * minute, 95 * minute))
+        return ohlcvs, requests
+    finally:
+        loop.run_until_complete(exchange.close())
+        loop.close()
+
+
+@requires_async
+def test_concurrent_pages():
+    ohlcvs, requests = fetch_range({'ohlcvPageSize': 10})
+    assert [ohlcv[1] for ohlcv in ohlcvs] == [i for i in range(5, 95) if not (40 <= i < 60)]
+    # the window that ends in the gap is continued once, the page of the empty window is not
+    assert sorted(requests) == [m * minute for m in [5, 15, 25, 35, 40, 45, 55, 65, 75, 85]]
+
+
+@requires_async
+def test_short_pages_are_paged_sequentially():
+    # the exchange returns 4 candles where 10 were expected, the rest of every window is fetched again
+    ohlcvs, requests = fetch_range({'ohlcvPageSize': 10}, 4)
+    assert [ohlcv[1] for ohlcv in ohlcvs] == [i for i in range(5, 95) if not (40 <= i < 60)]
+    assert requests.count(5 * minute) == 1 and (9 * minute in requests) and (13 * minute in requests)
+
+
+@requires_async
+def test_latest_only():
+    ohlcvs, requests = fetch_range({'ohlcvPageSize': 10, 'ohlcvLatestOnly': True}, None, True)
+    assert [ohlcv[1] for ohlcv in ohlcvs] == [90, 91, 92, 93, 94]
+    # the pages follow each other instead of one request per window
+    assert requests == [5 * minute]
+
+
+@requires_async
+def test_capped_pages_like_the_sync_version():
+    # the capped mock of the synchronous tests, 6 candles where 10 were asked
+    sync = SyncMock({'ohlcvPageSize': 10})
+    sync.capacity = 6
+    loop = asyncio.new_event_loop()
+
+    class Mock(exchange_module.Exchange):
+
+        async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+            return sync.fetch_ohlcv(symbol, timeframe, since, limit, params)
+
+    exchange = Mock({'id': 'mock', 'ohlcvPageSize': 10, 'asyncio_loop': loop})
+    try:
+        ohlcvs = loop.run_until_complete(exchange.fetch_ohlcv_range('BTC/USD', '1m', 0, 30 * minute))
+    finally:
+        loop.run_until_complete(exchange.close())
+        loop.close()
+    expected = [ohlcv[1] for ohlcv in SyncMock({'ohlcvPageSize': 10, 'capacity': 6}).fetch_ohlcv_range('BTC/USD', '1m', 0, 30 * minute)]
+    assert [ohlcv[1] for ohlcv in ohlcvs] == expected == list(range(0, 30))
+
+
+@requires_async
+def test_resampled_pages():
+    # the minutes of the synchronous tests, 500 per page
+    minutely = Minutely()
+    loop = asyncio.new_event_loop()
+
+    class Mock(exchange_module.Exchange):
+
+        def describe(self):
+            return self.deep_extend(super(Mock, self).describe(), {'id': 'mock', 'timeframes': {'1m': '1'}})
+
+        def milliseconds(self):
+            return minutely.now
+
+        async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+            return minutely.fetch_ohlcv(symbol, timeframe, since, limit, params)
+
+    exchange = Mock({'ohlcvPageSize': 500, 'asyncio_loop': loop})
+    try:
+        ohlcvs = loop.run_until_complete(exchange.fetch_resampled_ohlcv('BTC/USD', '1h', 140 * 60 * minute, 100))
+    finally:
+        loop.run_until_complete(exchange.close())
+        loop.close()
+    assert ohlcvs == minutely.fetch_resampled_ohlcv('BTC/USD', '1h', 140 * 60 * minute, 100)
+    assert [ohlcv[0] for ohlcv in ohlcvs] == [i * 60 * minute for i in range(140, 150)]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import sys
+import tempfile
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.ohlcv_store import OHLCVStore  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+minute = 60000
+
+
+class Mock(ccxt.Exchange):
+
+    # candles every minute from 0 to 100 minutes, without trades from 40 to 60 minutes
+    history = [[i * minute, i + 0.5, i + 1.0, i + 0.0, i + 0.25, 1.0] for i in range(0, 100) if not (40 <= i < 60)]
+
+    def __init__(self, config={}):
+        super(Mock, self).__init__(config)
+        self.requests = []
+
+    def describe(self):
+        return self.deep_extend(super(Mock, self).describe(), {
+            'id': 'mock',
+            'ohlcvPageSize': 10,
+        })
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        self.requests.append(since)
+        return [ohlcv for ohlcv in self.history if ohlcv[0] >= since][0:limit]
+
+
+def test_ohlcv_store():
+    path = tempfile.mkdtemp()
+    try:
+        store = OHLCVStore(path)
+        exchange = Mock()
+        assert store.missing('mock', 'BTC/USD', '1m', 30 * minute, 70 * minute) == [[30 * minute, 70 * minute]]
+        ohlcvs = store.sync(exchange, 'BTC/USD', '1m', 30 * minute, 70 * minute)
+        assert ohlcvs == [ohlcv for ohlcv in Mock.history if 30 * minute <= ohlcv[0] < 70 * minute]
+        assert os.path.exists(os.path.join(path, 'mock', 'BTC-USD-1m.ohlcv'))
+        # the periods without trades are not fetched again
+        assert store.missing('mock', 'BTC/USD', '1m', 30 * minute, 70 * minute) == []
+        assert store.missing('mock', 'BTC/USD', '1m', 20 * minute, 80 * minute) == [[20 * minute, 30 * minute], [70 * minute, 80 * minute]]
+        exchange.requests = []
+        ohlcvs = store.sync(exchange, 'BTC/USD', '1m', 20 * minute, 80 * minute)
+        assert exchange.requests == [20 * minute, 70 * minute]
+        assert ohlcvs == [ohlcv for ohlcv in Mock.history if 20 * minute <= ohlcv[0] < 80 * minute]
+        assert store.read('mock', 'BTC/USD', '1m', 75 * minute) == [ohlcv for ohlcv in Mock.history if 75 * minute <= ohlcv[0] < 80 * minute]
+        assert store.read('mock', 'BTC/USD', '1m') == ohlcvs
+        arrays = store.read('mock', 'BTC/USD', '1m', 20 * minute, 22 * minute, arrays=True)
+        # a NumPy array with a row per candle, or a flat array('d') without NumPy
+        assert list(arrays.ravel() if hasattr(arrays, 'ravel') else arrays) == [
+            20 * minute, 20.5, 21.0, 20.0, 20.25, 1.0,
+            21 * minute, 21.5, 22.0, 21.0, 21.25, 1.0,
+        ]
+        assert store.read('mock', 'ETH/USD', '1m') == []
+    finally:
+        shutil.rmtree(path)
+
+
+def test_sync_marks_only_the_fetched_pages():
+    path = tempfile.mkdtemp()
+    try:
+        store = OHLCVStore(path)
+        # without a page size the range stops at the first empty page, after the 50 minutes of the history
+        exchange = Mock({'ohlcvPageSize': None})
+        exchange.history = [[i * minute, i, i, i, i, 1.0] for i in range(0, 50)]
+        exchange.fetch_ohlcv = lambda symbol, timeframe='1m', since=None, limit=None, params={}: Mock.fetch_ohlcv(exchange, symbol, timeframe, since, 10)
+        assert len(store.sync(exchange, 'BTC/USD', '1m', 30 * minute, 70 * minute)) == 20
+        assert exchange.requests == [30 * minute, 40 * minute, 50 * minute]
+        assert store.missing('mock', 'BTC/USD', '1m', 30 * minute, 70 * minute) == [[50 * minute, 70 * minute]]
+    finally:
+        shutil.rmtree(path)
+
+
+def test_write_in_place():
+    path = tempfile.mkdtemp()
+    try:
+        store = OHLCVStore(path)
+        store.write('mock', 'BTC/USD', '1m', Mock.history[10:20], 10 * minute, 20 * minute)
+        filename = store.filename('mock', 'BTC/USD', '1m')
+        inode = os.stat(filename).st_ino
+        store.write('mock', 'BTC/USD', '1m', Mock.history[25:30])
+        store.write('mock', 'BTC/USD', '1m', Mock.history[12:14])
+        assert os.stat(filename).st_ino == inode
+        assert os.path.getsize(filename) == (2 + 20 * 6) * 8
+        assert store.read('mock', 'BTC/USD', '1m') == Mock.history[10:20] + Mock.history[25:30]
+        assert store.missing('mock', 'BTC/USD', '1m', 10 * minute, 30 * minute) == [[20 * minute, 25 * minute]]
+        # candles before the start of the series write the file again
+        store.write('mock', 'BTC/USD', '1m', Mock.history[5:6])
+        assert store.read('mock', 'BTC/USD', '1m') == Mock.history[5:6] + Mock.history[10:20] + Mock.history[25:30]
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    test_ohlcv_store()
+    test_sync_marks_only_the_fetched_pages()
+    test_write_in_place()
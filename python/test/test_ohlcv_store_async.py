@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+try:
+    exchange_module = importlib.import_module('ccxt.async.base.exchange')
+    store_module = importlib.import_module('ccxt.async.base.ohlcv_store')
+except SyntaxError:
+    # ccxt.async can not be imported since async became a reserved word in Python 3.7
+    exchange_module = None
+
+requires_async = pytest.mark.skipif(exchange_module is None, reason='ccxt.async can not be imported')
+
+# ------------------------------------------------------------------------------
+
+minute = 60000
+
+
+@requires_async
+def test_async_sync():
+
+    class Mock(exchange_module.Exchange):
+
+        history = [[i * minute, i + 0.5, i + 1.0, i + 0.0, i + 0.25, 1.0] for i in range(0, 100)]
+
+        async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+            return [ohlcv for ohlcv in self.history if ohlcv[0] >= since][0:limit]
+
+    loop = asyncio.new_event_loop()
+    path = tempfile.mkdtemp()
+    exchange = Mock({'id': 'mock', 'asyncio_loop': loop, 'ohlcvPageSize': 10})
+    try:
+        store = store_module.OHLCVStore(path)
+        ohlcvs = loop.run_until_complete(store.sync(exchange, 'BTC/USD', '1m', 30 * minute, 70 * minute))
+        assert ohlcvs == Mock.history[30:70]
+        assert store.missing('mock', 'BTC/USD', '1m', 30 * minute, 70 * minute) == []
+    finally:
+        loop.run_until_complete(exchange.close())
+        loop.close()
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.order_book import BookSide  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Mock(ccxt.Exchange):
+
+    def fetch_order_book(self, symbol, params={}):
+        return self.parse_order_book({
+            'bids': [['100.0', '1'], ['101.5', '2'], ['100.0', '3'], ['99', '0']],
+            'asks': [{'price': '103', 'size': '1'}, {'price': '102', 'size': '0.5'}, {'price': '103', 'size': 2}],
+        }, 1500000000000, 'bids', 'asks', 0, 1)
+
+    def parse_order_book(self, orderbook, timestamp=None, bids_key='bids', asks_key='asks', price_key=0, amount_key=1):
+        result = super(Mock, self).parse_order_book(orderbook, timestamp, bids_key, 'none', price_key, amount_key)
+        result['asks'] = self.parse_bids_asks(orderbook[asks_key], 'price', 'size')
+        return result
+
+
+def test_order_book_arrays():
+    lists = Mock()
+    arrays = Mock({'orderBookArrays': True})
+    orderbook = arrays.fetch_order_book('BTC/USD')
+    assert isinstance(orderbook['bids'], BookSide)
+    # unlike the lists, the arrays skip the levels with a zero amount when they are parsed
+    assert orderbook['bids'] == lists.fetch_order_book('BTC/USD')['bids'][:3]
+    assert len(orderbook['bids']) == 3
+    assert orderbook['bids'][1] == [101.5, 2.0]
+    assert orderbook['asks'][-1] == [103.0, 2.0]
+    l2 = arrays.fetch_l2_order_book('BTC/USD')
+    assert l2['bids'] == [[101.5, 2.0], [100.0, 4.0]]
+    assert l2['asks'] == [[102.0, 0.5], [103.0, 3.0]]
+    assert l2['bids'] == lists.fetch_l2_order_book('BTC/USD')['bids']
+    assert l2['asks'] == lists.fetch_l2_order_book('BTC/USD')['asks']
+    assert list(l2['asks']) == [[102.0, 0.5], [103.0, 3.0]]
+
+
+def test_book_side_as_list():
+    bids = Mock({'orderBookArrays': True}).fetch_order_book('BTC/USD')['bids']
+    assert not isinstance(bids, list) and isinstance(bids.to_list(), list)
+    assert ccxt.Exchange.json({'bids': bids}) == '{"bids":[[100.0,1.0],[101.5,2.0],[100.0,3.0]]}'
+    assert bids + [[99.0, 1.0]] == [[100.0, 1.0], [101.5, 2.0], [100.0, 3.0], [99.0, 1.0]]
+    assert [[102.0, 1.0]] + bids == [[102.0, 1.0], [100.0, 1.0], [101.5, 2.0], [100.0, 3.0]]
+    assert list(reversed(bids))[0] == [100.0, 3.0] and [101.5, 2.0] in bids
+
+
+def test_empty_book_side():
+    side = BookSide.from_rows([])
+    assert len(side) == 0 and side == [] and side.aggregate(True) == []
+
+
+if __name__ == '__main__':
+    test_order_book_arrays()
+    test_book_side_as_list()
+    test_empty_book_side()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def mock_exchange(config={}):
+    return ccxt.Exchange(ccxt.Exchange.extend({
+        'id': 'mock',
+        'rateLimit': 20,
+        'rateLimits': {
+            'orders': {'rateLimit': 10},
+        },
+        'api': {
+            'public': {
+                'get': [
+                    'ticker',
+                    'tickers',
+                ],
+                'post': [
+                    'legacy',
+                ],
+            },
+            'private': {
+                'post': [
+                    'order',
+                ],
+            },
+        },
+        'apiCosts': {
+            'public': {
+                'get': {
+                    'tickers': 5,
+                },
+            },
+            'private': {
+                'post': {
+                    'order': {'default': 1, 'orders': 1},
+                },
+            },
+        },
+    }, config))
+
+
+def test_request_cost():
+    exchange = mock_exchange()
+    assert exchange.request_cost('ticker', 'public', 'GET') == {'default': 1}
+    assert exchange.request_cost('tickers', 'public', 'GET') == {'default': 5}
+    assert exchange.request_cost('legacy', 'public', 'POST') == {'default': 1}
+    assert exchange.request_cost('order', 'private', 'POST') == {'default': 1, 'orders': 1}
+    assert hasattr(exchange, 'public_get_tickers') and hasattr(exchange, 'publicPostLegacy')
+
+
+def test_extended_costs():
+    # the endpoint lists and the costs extend separately
+    exchange = ccxt.binance({'apiCosts': {'public': {'get': {'klines': 2}}}})
+    assert exchange.request_cost('klines', 'public', 'GET') == {'default': 2}
+    assert exchange.request_cost('allOrders', 'private', 'GET') == {'default': 5}
+    assert exchange.request_cost('order', 'private', 'POST') == {'default': 1, 'orders': 1}
+    exchange = ccxt.binance({'api': {'public': {'get': ['exchangeInfo', 'depth', 'klines', 'avgPrice']}}})
+    assert hasattr(exchange, 'public_get_avgprice') and hasattr(exchange, 'privateGetAllOrders')
+    assert exchange.request_cost('allOrders', 'private', 'GET') == {'default': 5}
+
+
+def test_weighted_buckets():
+    exchange = mock_exchange()
+    start = time.time()
+    exchange.throttle({'default': 5})
+    # a request in another bucket does not wait behind the expensive one
+    exchange.throttle({'orders': 1})
+    assert time.time() - start < 0.05
+    exchange.throttle({'default': 1})
+    assert time.time() - start >= 0.09
+
+
+def test_threads_are_spaced():
+    exchange = mock_exchange({'rateLimit': 10})
+    released = []
+
+    def worker():
+        for i in range(0, 3):
+            exchange.throttle()
+            released.append(time.time())
+
+    threads = [threading.Thread(target=worker) for i in range(0, 8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    released.sort()
+    gaps = [b - a for a, b in zip(released, released[1:])]
+    assert len(released) == 24
+    assert sorted(gaps)[len(gaps) // 2] > 0.008
+    assert released[-1] - released[0] >= 0.22
+
+
+def test_non_blocking():
+    exchange = mock_exchange()
+    assert exchange.throttle({'default': 1}, False) == 0
+    delay = exchange.throttle({'default': 1}, False)
+    assert 0 < delay <= 20
+    # nothing was reserved by the refused call
+    assert abs(exchange.throttle({'default': 1}, False) - delay) < 5
+
+
+def test_adaptive_rate_limit():
+    exchange = mock_exchange({
+        'adaptiveRateLimit': {
+            'enabled': True,
+            'usedWeightHeader': 'X-Used-Weight',
+            'weightLimit': 100,
+        },
+    })
+    exchange.slow_down_rate_limit()
+    exchange.slow_down_rate_limit()
+    assert exchange.rateLimitFactor == 4.0
+    assert exchange.rate_limit_buckets()['default']['rateLimit'] == 80
+    # additive increase back to the configured rate
+    for i in range(0, 100):
+        exchange.adapt_rate_limit(200, {})
+    assert exchange.rateLimitFactor == 1.0
+    exchange.adapt_rate_limit(200, {'X-Used-Weight': '96'})
+    assert exchange.rate_limit_buckets()['orders']['rateLimit'] == 12
+    exchange.adapt_rate_limit(429, {'Retry-After': '1'})
+    assert exchange.throttle({'default': 1}, False) > 900
+
+
+if __name__ == '__main__':
+    test_request_cost()
+    test_extended_costs()
+    test_weighted_buckets()
+    test_threads_are_spaced()
+    test_non_blocking()
+    test_adaptive_rate_limit()
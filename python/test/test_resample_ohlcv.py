@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.ohlcv import timeframe_end  # noqa: E402
+from ccxt.base.ohlcv import timeframe_start  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+minute = 60000
+day = 1440 * minute
+
+
+class Mock(ccxt.Exchange):
+
+    trades = [
+        {'timestamp': 65000, 'price': 10.0, 'amount': 1.0},
+        {'timestamp': 61000, 'price': 9.0, 'amount': 2.0},
+        {'timestamp': 110000, 'price': 12.0, 'amount': 0.5},
+        {'timestamp': 190000, 'price': 8.0, 'amount': 1.5},
+    ]
+
+    def describe(self):
+        return self.deep_extend(super(Mock, self).describe(), {
+            'id': 'mock',
+            'timeframes': {'1m': '1', '5m': '5', '1h': '60', '1d': 'D'},
+        })
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        return self.trades
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        self.fetched = timeframe
+        # hourly candles over two days
+        return [[i * 60 * minute, i, i + 2.0, i - 1.0, i + 1.0, 1.0] for i in range(0, 48)]
+
+
+def test_build_ohlcv():
+    exchange = Mock()
+    assert exchange.build_ohlcv(Mock.trades, '1m') == [
+        [60000, 9.0, 12.0, 9.0, 12.0, 3.5],
+        [180000, 8.0, 8.0, 8.0, 8.0, 1.5],
+    ]
+    assert exchange.build_ohlcv(Mock.trades, '5m') == [[0, 9.0, 12.0, 8.0, 8.0, 5.0]]
+    assert ccxt.Exchange.fetch_ohlcv_from_trades(exchange, 'BTC/USD', '1m', 100000) == [[180000, 8.0, 8.0, 8.0, 8.0, 1.5]]
+
+
+class Paginated(ccxt.Exchange):
+
+    # a trade every 10 seconds for 10 minutes, the exchange returns 5 trades per page
+    history = [{'id': str(i), 'timestamp': i * 10000, 'price': float(i), 'amount': 1.0} for i in range(0, 60)]
+
+    def __init__(self, config={}):
+        super(Paginated, self).__init__(config)
+        self.requests = []
+
+    def describe(self):
+        return self.deep_extend(super(Paginated, self).describe(), {
+            'id': 'paginated',
+            'has': {'fetchOHLCV': 'emulated'},
+        })
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        self.requests.append(since)
+        return [trade for trade in self.history if since is None or trade['timestamp'] >= since][0:5]
+
+
+def test_fetch_ohlcv_from_trades():
+    # the emulation is opt-in
+    try:
+        ccxt.Exchange.fetch_ohlcv(Mock(), 'BTC/USD', '1m', 0)
+        assert False
+    except ccxt.NotSupported:
+        pass
+    exchange = Paginated()
+    ohlcvs = exchange.fetch_ohlcv('BTC/USD', '1m', 0)
+    # the candles are built from all the pages, not from the first one
+    assert ohlcvs == [[i * minute, i * 6.0, i * 6.0 + 5, i * 6.0, i * 6.0 + 5, 6.0] for i in range(0, 10)]
+    # the pages stop once the limit-th candle is complete
+    exchange.requests = []
+    ohlcvs = exchange.fetch_ohlcv('BTC/USD', '1m', minute + 1, 2)
+    assert ohlcvs == [[i * minute, i * 6.0, i * 6.0 + 5, i * 6.0, i * 6.0 + 5, 6.0] for i in range(2, 4)]
+    assert max(exchange.requests) < 4 * minute
+
+
+def test_resample_ohlcv():
+    exchange = Mock()
+    assert exchange.resample_source_timeframe('1h') == '1h'
+    assert exchange.resample_source_timeframe('4h') == '1h'
+    assert exchange.resample_source_timeframe('1w') == '1d'
+    assert exchange.resample_source_timeframe('1M') == '1d'
+    ohlcvs = exchange.fetch_resampled_ohlcv('BTC/USD', '12h')
+    assert exchange.fetched == '1h'
+    assert ohlcvs == [[i * 12 * 60 * minute, i * 12, i * 12 + 13.0, i * 12 - 1.0, i * 12 + 12.0, 12.0] for i in range(0, 4)]
+    exchange.fetch_resampled_ohlcv('BTC/USD', '1d')
+    assert exchange.fetched == '1d'
+    hourly = Mock.fetch_ohlcv(exchange, 'BTC/USD', '1h')
+    assert exchange.resample_ohlcv(hourly, '1d', day, 1) == [[day, 24, 49.0, 23.0, 48.0, 24.0]]
+    exchange.ohlcvArrays = True
+    assert exchange.resample_ohlcv(hourly, '1d') == ccxt.Exchange.resample_ohlcv(Mock(), hourly, '1d')
+
+
+class Minutely(ccxt.Exchange):
+
+    # a candle every minute from 0 to 150.5 hours, 500 candles per page, the current time is 150.5 hours
+    now = 9030 * minute
+    ohlcvPageSize = 500
+
+    def describe(self):
+        return self.deep_extend(super(Minutely, self).describe(), {
+            'id': 'minutely',
+            'timeframes': {'1m': '1'},
+        })
+
+    def milliseconds(self):
+        return self.now
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        candles = [[i * minute, 1.0, 1.0, 1.0, 1.0, 1.0] for i in range(0, 9030)]
+        if since is None:
+            return candles[-500:]
+        return [ohlcv for ohlcv in candles if ohlcv[0] >= since][0:500]
+
+
+def test_fetch_resampled_ohlcv_pages():
+    exchange = Minutely()
+    # the limit-th hour is complete, it is not cut at the end of the first page of minutes
+    ohlcvs = exchange.fetch_resampled_ohlcv('BTC/USD', '1h', 0, 100)
+    assert [ohlcv[0] for ohlcv in ohlcvs] == [i * 60 * minute for i in range(0, 100)]
+    assert all(ohlcv[5] == 60.0 for ohlcv in ohlcvs)
+    # the hour that has not ended yet is dropped
+    ohlcvs = exchange.fetch_resampled_ohlcv('BTC/USD', '1h', 140 * 60 * minute, 100)
+    assert [ohlcv[0] for ohlcv in ohlcvs] == [i * 60 * minute for i in range(140, 150)]
+    # without since the latest complete hours, without a limit those that the last page covers entirely
+    ohlcvs = exchange.fetch_resampled_ohlcv('BTC/USD', '1h', None, 3)
+    assert [ohlcv[0] for ohlcv in ohlcvs] == [i * 60 * minute for i in range(147, 150)]
+    ohlcvs = exchange.fetch_resampled_ohlcv('BTC/USD', '1h')
+    assert [ohlcv[0] for ohlcv in ohlcvs] == [i * 60 * minute for i in range(143, 150)]
+    assert all(ohlcv[5] == 60.0 for ohlcv in ohlcvs)
+
+
+def test_timeframe_start():
+    monday = 4 * day  # 1970-01-05
+    assert timeframe_start(monday + 3 * day, '1w') == monday
+    assert timeframe_start(monday - 1, '1w') == monday - 7 * day
+    assert timeframe_start(1517443200000 + 5 * day, '1M') == 1517443200000  # 2018-02-01
+    assert timeframe_start(1517443200000 + 5 * day, '3M') == 1514764800000  # 2018-01-01
+    assert timeframe_start(1517443200000, '1y') == 1514764800000
+    assert timeframe_end(monday + 3 * day, '1w') == monday + 7 * day
+    assert timeframe_end(1517443200000 + 5 * day, '1M') == 1519862400000  # 2018-03-01
+    assert timeframe_end(1517443200000 + 5 * day, '3M') == 1522540800000  # 2018-04-01
+    assert timeframe_end(1517443200000, '1y') == 1546300800000  # 2019-01-01
+
+
+if __name__ == '__main__':
+    test_build_ohlcv()
+    test_fetch_ohlcv_from_trades()
+    test_resample_ohlcv()
+    test_fetch_resampled_ohlcv_pages()
+    test_timeframe_start()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer  # Python 3
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer  # Python 2
+    from SocketServer import ThreadingMixIn
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def respond(self):
+        self.server.requests += 1
+        if self.server.requests <= self.server.drops:
+            self.close_connection = True  # closes the connection without a response
+            return
+        failing = self.server.requests <= self.server.failures
+        body = b'{"error":"unavailable"}' if failing else b'{"result":"ok"}'
+        self.send_response(502 if failing else 200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = respond
+    do_POST = respond
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+
+    daemon_threads = True
+
+
+def mock_exchange(failures, config={}, drops=0, exchange_class=ccxt.Exchange):
+    server = Server(('127.0.0.1', 0), Handler)
+    server.requests = 0
+    server.drops = drops
+    server.failures = drops + failures
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    exchange = exchange_class(ccxt.Exchange.extend({
+        'id': 'mock',
+        'urls': {'api': 'http://127.0.0.1:' + str(server.server_address[1])},
+        'api': {
+            'public': {
+                'get': ['ticker'],
+                'post': ['order'],
+            },
+        },
+        'retryPolicy': {'maxAttempts': 3, 'backoff': 10},
+    }, config))
+    exchange.sign = lambda path, api='public', method='GET', params={}, headers=None, body=None: {
+        'url': exchange.urls['api'] + '/' + path,
+        'method': method,
+        'headers': headers,
+        'body': body,
+    }
+    return exchange, server
+
+
+def test_idempotent_requests_are_retried():
+    exchange, server = mock_exchange(2)
+    assert exchange.public_get_ticker() == {'result': 'ok'}
+    assert server.requests == 3
+    assert exchange.retry_stats['public GET ticker'] == {'requests': 1, 'retries': 2, 'recovered': 1, 'failed': 0}
+    server.shutdown()
+
+
+def test_retries_are_exhausted():
+    exchange, server = mock_exchange(5)
+    try:
+        exchange.public_get_ticker()
+        assert False
+    except ccxt.ExchangeNotAvailable:
+        pass
+    assert server.requests == 3
+    assert exchange.retry_stats['public GET ticker']['failed'] == 1
+    server.shutdown()
+
+
+def test_post_is_never_retried():
+    exchange, server = mock_exchange(1)
+    try:
+        exchange.public_post_order()
+        assert False
+    except ccxt.ExchangeNotAvailable:
+        pass
+    assert server.requests == 1
+    assert exchange.retry_stats['public POST order']['retries'] == 0
+    server.shutdown()
+
+
+def test_dropped_connections_are_retried():
+    exchange, server = mock_exchange(0, {}, 2)
+    assert exchange.public_get_ticker() == {'result': 'ok'}
+    assert server.requests == 3
+    server.shutdown()
+
+
+def test_deadline():
+    exchange, server = mock_exchange(5, {'retryPolicy': {'maxAttempts': 10, 'backoff': 1000, 'deadline': 0}})
+    try:
+        exchange.public_get_ticker()
+        assert False
+    except ccxt.ExchangeNotAvailable:
+        pass
+    assert server.requests == 1
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    test_idempotent_requests_are_retried()
+    test_retries_are_exhausted()
+    test_post_is_never_retried()
+    test_dropped_connections_are_retried()
+    test_deadline()
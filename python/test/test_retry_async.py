@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+import os
+import sys
+
+import pytest
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from test_retry import mock_exchange  # noqa: E402
+
+try:
+    exchange_module = importlib.import_module('ccxt.async.base.exchange')
+except SyntaxError:
+    # ccxt.async can not be imported since async became a reserved word in Python 3.7
+    exchange_module = None
+
+requires_async = pytest.mark.skipif(exchange_module is None, reason='ccxt.async can not be imported')
+
+# ------------------------------------------------------------------------------
+
+
+@requires_async
+def test_dropped_connections_are_retried():
+    loop = asyncio.new_event_loop()
+    exchange, server = mock_exchange(1, {'asyncio_loop': loop}, 1, exchange_module.Exchange)
+
+    async def fetch():
+        try:
+            return await exchange.public_get_ticker()
+        finally:
+            await exchange.close()
+
+    assert loop.run_until_complete(fetch()) == {'result': 'ok'}
+    assert server.requests == 3
+    assert exchange.retry_stats['public GET ticker']['retries'] == 2
+    loop.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def market(base, quote, active=True):
+    return {
+        'id': (base + quote).lower(),
+        'symbol': base + '/' + quote,
+        'base': base,
+        'quote': quote,
+        'baseId': base.lower(),
+        'quoteId': quote.lower(),
+        'active': active,
+    }
+
+
+def test_set_markets_indexes():
+    exchange = ccxt.Exchange({'fees': {'trading': {'taker': 0.002}}})
+    exchange.set_markets([market('BTC', 'USD'), market('ETH', 'USD'), market('ETH', 'BTC')])
+    assert sorted(exchange.markets_changes['added']) == ['BTC/USD', 'ETH/BTC', 'ETH/USD']
+    assert exchange.symbols == ['BTC/USD', 'ETH/BTC', 'ETH/USD']
+    assert exchange.ids == ['btcusd', 'ethbtc', 'ethusd']
+    assert sorted(m['symbol'] for m in exchange.markets_by_base['ETH']) == ['ETH/BTC', 'ETH/USD']
+    assert sorted(m['symbol'] for m in exchange.markets_by_quote['USD']) == ['BTC/USD', 'ETH/USD']
+    assert exchange.markets_by_base_id['btc'][0] is exchange.markets['BTC/USD']
+    assert exchange.markets_by_quote_id['btc'][0] is exchange.markets['ETH/BTC']
+    assert exchange.markets['BTC/USD']['taker'] == 0.002
+    assert sorted(exchange.currencies.keys()) == ['BTC', 'ETH', 'USD']
+
+
+def test_set_markets_incremental():
+    exchange = ccxt.Exchange({'fees': {'trading': {'taker': 0.002}}})
+    exchange.set_markets([market('BTC', 'USD'), market('ETH', 'USD'), market('ETH', 'BTC')])
+    btcusd = exchange.markets['BTC/USD']
+    ethusd = exchange.markets['ETH/USD']
+    by_id = exchange.markets_by_id
+    # nothing changed, the indexes are kept as they are
+    exchange.set_markets([market('BTC', 'USD'), market('ETH', 'USD'), market('ETH', 'BTC')])
+    assert exchange.markets_changes == {'added': [], 'removed': [], 'changed': []}
+    assert exchange.markets_by_id is by_id
+    # only the added and changed markets are extended again
+    exchange.set_markets([market('BTC', 'USD'), market('ETH', 'USD', False), market('LTC', 'BTC')])
+    assert exchange.markets_changes == {'added': ['LTC/BTC'], 'removed': ['ETH/BTC'], 'changed': ['ETH/USD']}
+    assert exchange.markets['BTC/USD'] is btcusd
+    assert exchange.markets['ETH/USD'] is not ethusd and not exchange.markets['ETH/USD']['active']
+    assert exchange.symbols == ['BTC/USD', 'ETH/USD', 'LTC/BTC']
+    assert 'ETH' not in exchange.markets_by_quote and 'ethbtc' not in exchange.markets_by_id
+    assert 'LTC' in exchange.currencies
+    # changed defaults apply to every market
+    exchange.fees['trading']['taker'] = 0.001
+    exchange.set_markets([market('BTC', 'USD'), market('ETH', 'USD', False), market('LTC', 'BTC')])
+    assert sorted(exchange.markets_changes['changed']) == ['BTC/USD', 'ETH/USD', 'LTC/BTC']
+    assert exchange.markets['BTC/USD']['taker'] == 0.001
+
+
+def test_set_markets_removed_currencies():
+    exchange = ccxt.Exchange()
+    exchange.set_markets([market('BTC', 'USD'), market('LTC', 'BTC'), market('XRP', 'BTC')])
+    assert sorted(exchange.currencies.keys()) == ['BTC', 'LTC', 'USD', 'XRP']
+    exchange.set_markets([market('BTC', 'USD'), market('ETH', 'USD')])
+    assert sorted(exchange.markets_changes['removed']) == ['LTC/BTC', 'XRP/BTC']
+    assert sorted(exchange.currencies.keys()) == ['BTC', 'ETH', 'USD']
+    # the currencies passed in are kept
+    exchange.set_markets([market('BTC', 'USD')], {'ETH': {'id': 'eth', 'code': 'ETH'}})
+    assert sorted(exchange.currencies.keys()) == ['BTC', 'ETH', 'USD']
+    # only copies of the markets as passed in are kept
+    assert sorted(exchange.markets_raw.keys()) == ['BTC/USD']
+    assert exchange.markets_raw['BTC/USD'] == market('BTC', 'USD')
+
+
+def test_set_markets_changed_in_place():
+    exchange = ccxt.Exchange()
+    markets = [market('BTC', 'USD'), market('ETH', 'USD')]
+    exchange.set_markets(markets)
+    # the markets passed in again after a change in place are compared to copies of the previous ones
+    markets[1]['active'] = False
+    exchange.set_markets(markets)
+    assert exchange.markets_changes == {'added': [], 'removed': [], 'changed': ['ETH/USD']}
+    assert not exchange.markets['ETH/USD']['active']
+
+
+if __name__ == '__main__':
+    test_set_markets_indexes()
+    test_set_markets_incremental()
+    test_set_markets_removed_currencies()
+    test_set_markets_changed_in_place()
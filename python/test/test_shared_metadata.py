@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.market_cache import market_cache  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Mock(ccxt.Exchange):
+
+    fetched = 0
+
+    def describe(self):
+        return self.deep_extend(super(Mock, self).describe(), {
+            'id': 'mock',
+            'urls': {'api': 'https://api.example.com'},
+            'fees': {'trading': {'maker': 0.001, 'taker': 0.002}},
+            'api': {'public': {'get': ['markets']}},
+        })
+
+    def fetch_markets(self):
+        Mock.fetched += 1
+        return [{'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'}]
+
+
+def test_shared_metadata():
+    market_cache.invalidate()
+    first = Mock({'sharedMetadata': True, 'apiKey': 'first'})
+    second = Mock({'sharedMetadata': True, 'apiKey': 'second', 'fees': {'trading': {'maker': 0.0}}})
+    assert first.urls is second.urls and first.api is second.api
+    assert first.fees is not second.fees
+    assert first.fees['trading']['maker'] == 0.001 and second.fees['trading']['maker'] == 0.0
+    first.load_markets()
+    second.load_markets()
+    assert Mock.fetched == 1
+    assert first.markets is not second.markets
+    assert first.market('BTC/USD')['maker'] == 0.001 and second.market('BTC/USD')['maker'] == 0.0
+    assert second.market('BTC/USD')['taker'] == 0.002
+    # instances with the same fees share the markets as loaded
+    fourth = Mock({'sharedMetadata': True, 'apiKey': 'fourth'})
+    fourth.load_markets()
+    assert Mock.fetched == 1
+    assert first.markets is fourth.markets and first.markets_by_id is fourth.markets_by_id
+    assert fourth.marketsById is fourth.markets_by_id
+    # instances outside of the mode keep their own copies
+    third = Mock({'apiKey': 'third'})
+    third.load_markets()
+    assert Mock.fetched == 2
+    assert third.urls is not first.urls and third.markets is not first.markets
+
+
+if __name__ == '__main__':
+    test_shared_metadata()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+import os
+import sys
+import warnings
+
+import pytest
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+try:
+    exchange_module = importlib.import_module('ccxt.async.base.exchange')
+    pool_module = importlib.import_module('ccxt.async.base.connection_pool')
+except SyntaxError:
+    # ccxt.async can not be imported since async became a reserved word in Python 3.7
+    exchange_module = None
+
+requires_async = pytest.mark.skipif(exchange_module is None, reason='ccxt.async can not be imported')
+
+# ------------------------------------------------------------------------------
+
+
+@requires_async
+def test_connector_options():
+    options = pool_module.connector_options(exchange_module.Exchange.connectionPool)
+    assert options['limit_per_host'] == 0  # the per-host pool size does not cap concurrency
+    assert options['keepalive_timeout'] == 30
+    options = pool_module.connector_options({'maxSizePerHost': 4, 'block': True, 'keepAliveTimeout': 0})
+    assert options['limit_per_host'] == 4
+    assert options['keepalive_timeout'] == pool_module.forever
+
+
+@requires_async
+def test_shared_session():
+    loop = asyncio.new_event_loop()
+
+    async def run():
+        config = {'asyncio_loop': loop, 'connectionPool': {'shared': True}}
+        first = exchange_module.Exchange(config)
+        second = exchange_module.Exchange(config)
+        assert first.session is second.session
+        await first.close()
+        assert not second.session.closed
+        await second.close()
+        assert loop not in pool_module.registry
+
+    loop.run_until_complete(run())
+    loop.close()
+
+
+@requires_async
+def test_del_warns_without_closing():
+    loop = asyncio.new_event_loop()
+    exchange = exchange_module.Exchange({'asyncio_loop': loop})
+    session = exchange.session
+    loop.close()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        exchange.__del__()
+    assert [warning.category for warning in caught] == [ResourceWarning]
+    assert not session.closed
+    session.connector._close()  # the loop is gone, release the sockets without awaiting
+
+
+if __name__ == '__main__':
+    test_connector_options()
+    test_shared_session()
+    test_del_warns_without_closing()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+import os
+import sys
+import time
+
+import pytest
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+try:
+    throttle_module = importlib.import_module('ccxt.async.base.throttle')
+except SyntaxError:
+    # ccxt.async can not be imported since async became a reserved word in Python 3.7
+    throttle_module = None
+
+requires_async = pytest.mark.skipif(throttle_module is None, reason='ccxt.async can not be imported')
+
+# ------------------------------------------------------------------------------
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine(loop))
+    finally:
+        loop.close()
+
+
+@requires_async
+def test_priority_order():
+
+    async def released(loop):
+        throttle = throttle_module.Throttle({'loop': loop, 'refillRate': 1.0})
+        order = []
+        futures = []
+        for name, priority in [('a', 1), ('b', 0), ('c', 1), ('d', 0), ('e', 2)]:
+            future = throttle(1, priority)
+            future.add_done_callback(lambda future, name=name: order.append(name))
+            futures.append(future)
+        await asyncio.gather(*futures)
+        return order
+
+    # lower priorities first, in the order of the calls within a priority
+    assert run(released) == ['b', 'd', 'a', 'c', 'e']
+
+
+@requires_async
+def test_cancel_priority():
+
+    async def cancel(loop):
+        throttle = throttle_module.Throttle({'loop': loop, 'refillRate': 1.0})
+        background = [throttle(1, 1) for i in range(0, 3)]
+        orders = [throttle(1, 0) for i in range(0, 2)]
+        assert throttle.queue_depth() == 5
+        assert throttle.cancel(1) == 3
+        assert throttle.queue_depth() == 2
+        await asyncio.gather(*orders)
+        assert all(future.cancelled() for future in background)
+        return throttle.stats()
+
+    stats = run(cancel)
+    assert stats['released'] == 2
+    assert stats['cancelled'] == 3
+    assert stats['queueDepth'] == 0
+
+
+@requires_async
+def test_one_sleep_per_token(monkeypatch):
+    sleeps = []
+    sleep = throttle_module.sleep
+
+    def counting_sleep(delay):
+        sleeps.append(delay)
+        return sleep(delay)
+
+    monkeypatch.setattr(throttle_module, 'sleep', counting_sleep)
+
+    async def spend(loop):
+        # 20 tokens per second, the bucket starts empty
+        throttle = throttle_module.Throttle({'loop': loop, 'refillRate': 0.02})
+        start = time.time()
+        await asyncio.gather(*[throttle(1) for i in range(0, 5)])
+        return time.time() - start, throttle.num_tokens
+
+    elapsed, tokens = run(spend)
+    assert 0.2 <= elapsed < 0.4
+    assert len(sleeps) <= 5  # sleeps until the next token is due instead of polling
+    assert -1 < tokens <= 0
+
+
+@requires_async
+def test_wait_stats():
+
+    async def stats(loop):
+        throttle = throttle_module.Throttle({'loop': loop})
+        for wait in range(1, 101):
+            throttle.record_wait(float(wait))
+        return throttle.stats()
+
+    stats = run(stats)
+    assert stats['released'] == 100
+    assert stats['averageWait'] == 50.5
+    assert stats['maxWait'] == 100.0
+    assert stats['p50Wait'] == 51.0
+    assert stats['p99Wait'] == 100.0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import importlib
+import os
+import sys
+
+import pytest
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from test_connection_pool import start_server  # noqa: E402
+
+try:
+    exchange_module = importlib.import_module('ccxt.async.base.exchange')
+    transport_module = importlib.import_module('ccxt.async.base.transport')
+except SyntaxError:
+    # ccxt.async can not be imported since async became a reserved word in Python 3.7
+    exchange_module = None
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:
+    h2 = None
+
+requires_async = pytest.mark.skipif(exchange_module is None, reason='ccxt.async can not be imported')
+requires_httpx = pytest.mark.skipif((exchange_module is None) or (transport_module.httpx is None) or (h2 is None), reason='requires ccxt.async, httpx and h2')
+
+# ------------------------------------------------------------------------------
+
+
+def run(transport):
+    server, url = start_server()
+
+    async def fetch():
+        exchange = exchange_module.Exchange({'id': 'mock', 'transport': transport})
+        responses = await asyncio.gather(*[exchange.fetch(url + '/ping') for i in range(0, 10)])
+        await exchange.close()
+        return responses
+
+    responses = asyncio.get_event_loop().run_until_complete(fetch())
+    server.shutdown()
+    return responses
+
+
+class H2Server(object):
+    """Answers every request after a delay over HTTP/2 with prior knowledge, counts the connections
+    and the most streams in flight at once"""
+
+    def __init__(self):
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        connection = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+        while True:
+            data = await reader.read(65535)
+            if not data:
+                break
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    asyncio.ensure_future(self.respond(connection, writer, event.stream_id))
+            writer.write(connection.data_to_send())
+        writer.close()
+
+    async def respond(self, connection, writer, stream_id):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.05)
+        body = b'{"result":"ok"}'
+        connection.send_headers(stream_id, [(':status', '200'), ('content-type', 'application/json'), ('content-length', str(len(body)))])
+        connection.send_data(stream_id, body, end_stream=True)
+        writer.write(connection.data_to_send())
+        self.active -= 1
+
+
+@requires_async
+def test_aiohttp_transport():
+    assert run('aiohttp') == [{'result': 'ok'}] * 10
+
+
+@requires_httpx
+def test_httpx_transport():
+    assert run('httpx') == [{'result': 'ok'}] * 10
+
+
+@requires_httpx
+def test_httpx_multiplexes_one_connection():
+    loop = asyncio.get_event_loop()
+    h2_server = H2Server()
+    server = loop.run_until_complete(asyncio.start_server(h2_server.handle, '127.0.0.1', 0))
+    url = 'http://127.0.0.1:' + str(server.sockets[0].getsockname()[1])
+
+    async def fetch():
+        exchange = exchange_module.Exchange({
+            'id': 'mock',
+            'transport': 'httpx',
+            'connectionPool': {'http1': False},  # HTTP/2 over plain http
+        })
+        responses = await asyncio.gather(*[exchange.fetch(url + '/ping') for i in range(0, 10)])
+        await exchange.close()
+        return responses
+
+    assert loop.run_until_complete(fetch()) == [{'result': 'ok'}] * 10
+    server.close()
+    loop.run_until_complete(server.wait_closed())
+    assert h2_server.connections == 1
+    assert h2_server.max_active > 1  # the requests were in flight at once on that connection
+
+
+@requires_async
+def test_custom_transport():
+
+    class StandIn(transport_module.Transport):
+
+        requests = []
+
+        async def request(self, method, url, headers=None, body=None, timeout=None, proxy=None):
+            self.requests.append((method, url))
+            return 200, {}, '{"result":"stand-in"}'
+
+    transport = StandIn()
+    assert run(transport) == [{'result': 'stand-in'}] * 10
+    assert len(transport.requests) == 10
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -40,6 +40,7 @@ const commonRegexes = [
 
     [ /\.deepExtend\s/g, '.deep_extend'],
     [ /\.safeFloat\s/g, '.safe_float'],
+    [ /\.toNumber\s/g, '.to_number'],
     [ /\.safeInteger\s/g, '.safe_integer'],
     [ /\.safeString\s/g, '.safe_string'],
     [ /\.safeValue\s/g, '.safe_value'],
@@ -71,6 +72,7 @@ const commonRegexes = [
     [ /\.groupBy\s/g, '.group_by'],
     [ /\.marketIds\s/g, '.market_ids'],
     [ /\.marketId\s/g, '.market_id'],
+    [ /\.findMarket\s/g, '.find_market'],
     [ /\.fetchL2OrderBook\s/g, '.fetch_l2_order_book'],
     [ /\.fetchOrderBook\s/g, '.fetch_order_book'],
     [ /\.fetchMyTrades\s/g, '.fetch_my_trades'],
@@ -102,6 +104,7 @@ const commonRegexes = [
     [ /\.encodeURIComponent\s/g, '.encode_uri_component'],
     [ /\.throwExceptionOnError\s/g, '.throw_exception_on_error'],
     [ /\.handleErrors\s/g, '.handle_errors'],
+    [ /\.requestCost\s/g, '.request_cost'],
     [ /\.checkRequiredCredentials\s/g, '.check_required_credentials'],
 ]
 
@@ -161,7 +164,7 @@ const pythonRegexes = [
         [ /\.toUpperCase\s*/g, '.upper' ],
         [ /\.toLowerCase\s*/g, '.lower' ],
         [ /JSON\.stringify\s*/g, 'json.dumps' ],
-        [ /JSON\.parse\s*/g, "json.loads" ],
+        [ /JSON\.parse\s*/g, "self.parse_json" ],
         // [ /([^\(\s]+)\.includes\s+\(([^\)]+)\)/g, '$2 in $1' ],
         // [ /\'%([^\']+)\'\.sprintf\s*\(([^\)]+)\)/g, "'{:$1}'.format($2)" ],
         [ /([^\s]+)\.toFixed\s*\(([0-9]+)\)/g, "'{:.$2f}'.format($1)" ],
@@ -305,7 +308,6 @@ const pythonRegexes = [
             'base64': 'base64',
             'hashlib': 'hashlib',
             'math': 'math',
-            'json.loads': 'json',
         }
 
         async = async ? 'async.' : ''